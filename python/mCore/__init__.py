@@ -0,0 +1,99 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/__init__.py @brief [ FILE    ] - Package.
+## @package mCore             @brief [ PACKAGE ] - Core functionalities used by all packages.
+#
+#  Modules of the package are imported on first attribute access, therefore importing the package
+#  doesn't import any of its modules.
+#
+# @code
+#
+#import mCore
+#
+#mCore.displayLib.Display.displayInfo('Modules are imported on first use')
+#
+# @endcode
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import sys
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ tuple of str ] - Names of the modules, which are imported on first attribute access.
+_MODULES = ('bundleLib',
+            'cacheLib',
+            'dateTimeLib',
+            'dependencyLib',
+            'displayLib',
+            'enumAbs',
+            'envComposerLib',
+            'importIndexLib',
+            'importProfilerLib',
+            'nameSpaceLib',
+            'packageEnvLib',
+            'packageIndexLib',
+            'packageInfoLib',
+            'packageRegistryLib',
+            'packageWatcherLib',
+            'pathListLib',
+            'platformLib',
+            'pythonUtilsLib',
+            'pythonVersionLib',
+            'stampIndexLib',
+            'versionLib')
+
+#
+## @brief Import and get given module of the package.
+#
+#  Function is called by the import system only if the attribute doesn't exist, the module sets
+#  itself as an attribute of the package once it is imported.
+#
+#  @param name [ str | None | in  ] - Name of the module.
+#
+#  @exception AttributeError - If the package doesn't have a module with given name.
+#
+#  @return module - Module.
+def __getattr__(name):
+
+    if name not in _MODULES:
+        raise AttributeError('module {} has no attribute {}'.format(__name__, name))
+
+    moduleName = '{}.{}'.format(__name__, name)
+
+    __import__(moduleName)
+
+    return sys.modules[moduleName]
+
+#
+## @brief List attributes of the package including modules, which are not imported yet.
+#
+#  @exception N/A
+#
+#  @return list of str - Attribute names.
+def __dir__():
+
+    return sorted(set(globals()).union(_MODULES))
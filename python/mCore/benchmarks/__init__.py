@@ -0,0 +1,32 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/benchmarks/__init__.py @brief [ FILE    ] - Package.
+## @package mCore.benchmarks             @brief [ PACKAGE ] - Benchmark suite of mCore modules.
+#
+#  Benchmarks are defined in workloadsLib module, benchmarkLib module runs them and compares
+#  results with the baseline.json file of the package.
+#
+# @code
+#
+#python -m mCore.benchmarks
+#
+#python -m mCore.benchmarks --filter nameSpaceLib --scale 0.1
+#
+# @endcode
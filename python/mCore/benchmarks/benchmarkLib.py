@@ -0,0 +1,461 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/benchmarks/benchmarkLib.py @brief [ FILE   ] - Benchmark runner.
+## @package mCore.benchmarks.benchmarkLib    @brief [ MODULE ] - Benchmark runner.
+#
+#  Benchmarks are registered with benchmark decorator. Each benchmark is timed `repeat` times and
+#  the fastest run is used, runs of the benchmarks are interleaved, so a slow period of the machine
+#  doesn't affect all runs of a benchmark. A fixed calibration loop is timed along with the runs
+#  and results are compared by their scores, which are nanoseconds per item divided by nanoseconds
+#  per iteration of the loop, so baselines can be compared across machines of different speeds
+#  and runs of different scales.
+#
+# @code
+#
+#import mCore.benchmarks.benchmarkLib
+#
+#@mCore.benchmarks.benchmarkLib.benchmark('myLib.lookup', 100000)
+#def lookup(count):
+#
+#    names = ['name{}'.format(x) for x in range(count)]
+#
+#    def run():
+#        for name in names:
+#            myLib.lookup(name)
+#
+#    return run
+#
+# @endcode
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import argparse
+import collections
+import gc
+import json
+import os
+import sys
+import time
+
+import mCore.displayLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ str ] - Absolute path of the checked in baseline file.
+BASELINE_FILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+## [ int ] - Version of the result files.
+_RESULT_FILE_VERSION = 1
+
+## [ int ] - Number of iterations of the calibration loop.
+_CALIBRATION_COUNT = 50000
+
+## [ collections.OrderedDict ] - Names of the benchmarks as keys and mCore.benchmarks.benchmarkLib.Benchmark instances as values.
+_BENCHMARKS = collections.OrderedDict()
+
+#
+## @brief [ CLASS ] - Benchmark of a workload.
+class Benchmark(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param name     [ str      | None | in  ] - Name of the benchmark such as nameSpaceLib.addNameSpace.
+    #  @param count    [ int      | None | in  ] - Number of items of the workload with scale 1.
+    #  @param function [ function | None | in  ] - Function, which gets the number of items, prepares the workload and returns a function running it.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, name, count, function):
+
+        ## [ str ] - Name of the benchmark.
+        self._name      = name
+
+        ## [ int ] - Number of items with scale 1.
+        self._count     = count
+
+        ## [ function ] - Function, which prepares the workload.
+        self._function  = function
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Name of the benchmark.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Name.
+    def name(self):
+
+        return self._name
+
+    #
+    ## @brief Number of items with scale 1.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Number of items.
+    def count(self):
+
+        return self._count
+
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Run the benchmark once.
+    #
+    #  Garbage collection is disabled while the workload runs, since its pauses depend on the state of
+    #  the whole process rather than the workload.
+    #
+    #  @param count [ int | None | in  ] - Number of items.
+    #
+    #  @exception N/A
+    #
+    #  @return float - Seconds.
+    def sample(self, count):
+
+        function = self._function(count)
+
+        gc.collect()
+        gc.disable()
+
+        try:
+            start = time.perf_counter()
+            function()
+            return time.perf_counter() - start
+        finally:
+            gc.enable()
+
+#
+## @brief Decorator to register a benchmark.
+#
+#  @param name  [ str | None | in  ] - Name of the benchmark, name of the module and the function or class it measures by convention.
+#  @param count [ int | None | in  ] - Number of items of the workload with scale 1.
+#
+#  @exception ValueError - If a benchmark with the same name is already registered.
+#
+#  @return function - Decorator.
+def benchmark(name, count):
+
+    def decorator(function):
+
+        if name in _BENCHMARKS:
+            raise ValueError('Benchmark {} is already registered'.format(name))
+
+        _BENCHMARKS[name] = Benchmark(name, count, function)
+
+        return function
+
+    return decorator
+
+#
+## @brief Get registered benchmarks.
+#
+#  Workloads of mCore modules are registered on first call.
+#
+#  @param filters [ list of str | None | in  ] - Benchmarks, which contain any of given strings in their names, are returned if provided.
+#
+#  @exception N/A
+#
+#  @return list of mCore.benchmarks.benchmarkLib.Benchmark - Benchmarks in registration order.
+def getBenchmarks(filters=None):
+
+    import mCore.benchmarks.workloadsLib
+
+    return [x for x in _BENCHMARKS.values() if not filters or any([y in x.name() for y in filters])]
+
+#
+## @brief Time the calibration loop.
+#
+#  Loop does dictionary and string operations typical for the workloads, fastest of three runs is used.
+#
+#  @exception N/A
+#
+#  @return float - Nanoseconds per iteration.
+def _calibrate():
+
+    times = []
+
+    for _ in range(3):
+
+        data    = {}
+        start   = time.perf_counter()
+
+        for index in range(_CALIBRATION_COUNT):
+            data['key{}'.format(index & 1023)] = index
+
+        times.append(time.perf_counter() - start)
+
+    return min(times) * 1000000000 / _CALIBRATION_COUNT
+
+#
+## @brief Run given benchmarks.
+#
+#  @param benchmarks [ list of mCore.benchmarks.benchmarkLib.Benchmark | None  | in  ] - Benchmarks, all are run if not provided.
+#  @param scale      [ float                                           | 1.0   | in  ] - Multiplier of the number of items.
+#  @param repeat     [ int                                             | 5     | in  ] - Number of runs of each benchmark, the fastest one is used.
+#
+#  @exception N/A
+#
+#  @return dict - Results with version, python, platform, scale, repeat, calibration and benchmarks keys, results of benchmarks have items, seconds, nsPerItem and score keys.
+def runBenchmarks(benchmarks=None, scale=1.0, repeat=5):
+
+    if benchmarks is None:
+        benchmarks = getBenchmarks()
+
+    results         = collections.OrderedDict()
+    calibrations    = []
+
+    for item in benchmarks:
+        results[item.name()] = {'items': max(1, int(item.count() * scale)), 'seconds': None, 'nsPerItem': None, 'score': None}
+
+    for _ in range(max(1, repeat)):
+
+        for item in benchmarks:
+
+            result  = results[item.name()]
+
+            calibrations.append(_calibrate())
+
+            seconds = item.sample(result['items'])
+
+            if result['seconds'] is None or seconds < result['seconds']:
+                result['seconds']   = seconds
+                result['nsPerItem'] = seconds * 1000000000 / result['items']
+
+    # Fastest calibration is the closest one to an idle machine like the fastest runs of the benchmarks
+    calibration = min(calibrations) if calibrations else None
+
+    for result in results.values():
+        result['score'] = result['nsPerItem'] / calibration
+
+    return {'version'       : _RESULT_FILE_VERSION,
+            'python'        : '.'.join([str(x) for x in sys.version_info[:3]]),
+            'platform'      : sys.platform,
+            'scale'         : scale,
+            'repeat'        : repeat,
+            'calibration'   : calibration,
+            'benchmarks'    : results}
+
+#
+## @brief Compare given results with given baseline.
+#
+#  @param results   [ dict  | None | in  ] - Results returned by mCore.benchmarks.benchmarkLib.runBenchmarks function.
+#  @param baseline  [ dict  | None | in  ] - Baseline results.
+#  @param tolerance [ float | 0.25 | in  ] - Ratio of score change to report a regression or an improvement.
+#
+#  @exception ValueError - If the results and the baseline are run with different scales.
+#
+#  @return list of list - Name, baseline and current scores, change ratio and status, which is regressed, improved, new or empty string.
+def compareResults(results, baseline, tolerance=0.25):
+
+    baselineBenchmarks  = baseline.get('benchmarks', {}) if baseline else {}
+    rows                = []
+
+    # Number of items changes how much of the data fits into caches, therefore the scores
+    if baseline and baseline.get('scale', results.get('scale')) != results.get('scale'):
+        raise ValueError('Results of scale {} can not be compared with the baseline of scale {}'.format(results.get('scale'), baseline.get('scale')))
+
+    for name, result in results['benchmarks'].items():
+
+        current     = result['score']
+        previous    = baselineBenchmarks.get(name, {}).get('score')
+
+        if not previous:
+            rows.append([name, None, current, None, 'new'])
+            continue
+
+        change  = current / previous - 1.0
+        status  = ''
+
+        if change > tolerance:
+            status = 'regressed'
+        elif change < -tolerance:
+            status = 'improved'
+
+        rows.append([name, previous, current, change, status])
+
+    return rows
+
+#
+## @brief Merge given results into given baseline.
+#
+#  Results of the benchmarks in the baseline are replaced, results of other benchmarks are kept.
+#
+#  @param baseline [ dict | None | in  ] - Baseline results, None to use the results as they are.
+#  @param results  [ dict | None | in  ] - Results returned by mCore.benchmarks.benchmarkLib.runBenchmarks function.
+#
+#  @exception ValueError - If the results and the baseline are run with different scales.
+#
+#  @return dict - Merged results.
+def mergeResults(baseline, results):
+
+    if not baseline:
+        return results
+
+    if baseline.get('scale') != results.get('scale'):
+        raise ValueError('Results of scale {} can not be merged into the baseline of scale {}'.format(results.get('scale'), baseline.get('scale')))
+
+    benchmarks = collections.OrderedDict(baseline.get('benchmarks', {}))
+    benchmarks.update(results['benchmarks'])
+
+    merged = dict(results)
+    merged['benchmarks'] = benchmarks
+
+    return merged
+
+#
+## @brief Read given result file.
+#
+#  @param filePath [ str | None | in  ] - Absolute path of the file.
+#
+#  @exception N/A
+#
+#  @return dict - Results.
+#  @return None - If the file doesn't exist or its version isn't supported.
+def readResults(filePath):
+
+    try:
+        with open(filePath, 'r') as _file:
+            data = json.load(_file)
+    except (IOError, OSError, ValueError):
+        return None
+
+    if data.get('version') != _RESULT_FILE_VERSION:
+        return None
+
+    return data
+
+#
+## @brief Write given results into given file.
+#
+#  @param filePath [ str  | None | in  ] - Absolute path of the file.
+#  @param results  [ dict | None | in  ] - Results.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def writeResults(filePath, results):
+
+    with open(filePath, 'w') as _file:
+        json.dump(results, _file, indent=4)
+        _file.write('\n')
+
+#
+## @brief Display given comparison.
+#
+#  @param rows     [ list of list | None | in  ] - Rows returned by mCore.benchmarks.benchmarkLib.compareResults function.
+#  @param useColor [ bool         | True | in  ] - Use color.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def displayComparison(rows, useColor=True):
+
+    mCore.displayLib.Display.displayTable([[row[0],
+                                            '' if row[1] is None else '{:.2f}'.format(row[1]),
+                                            '{:.2f}'.format(row[2]),
+                                            '' if row[3] is None else '{:+.1%}'.format(row[3]),
+                                            row[4]] for row in rows],
+                                          header=('Benchmark', 'Baseline (score)', 'Current (score)', 'Change', 'Status'),
+                                          statusColumn=4,
+                                          statusColors={'regressed': mCore.displayLib.ColorName.kFailure,
+                                                        'improved' : mCore.displayLib.ColorName.kSuccess},
+                                          useColor=useColor)
+
+#
+## @brief Command line interface.
+#
+#  @param arguments [ list of str | None | in  ] - Arguments, sys.argv is used if not provided.
+#
+#  @exception N/A
+#
+#  @return int - Exit code, 1 if a benchmark is regressed, 2 if the results can't be compared with or saved into the baseline.
+def main(arguments=None):
+
+    parser = argparse.ArgumentParser(prog='python -m mCore.benchmarks',
+                                     description='Run mCore benchmarks and compare them with a baseline.')
+
+    parser.add_argument('--filter', action='append', default=None, help='Run only the benchmarks, which contain given string in their names, can be repeated.')
+    parser.add_argument('--scale', type=float, default=1.0, help='Multiplier of the number of items of the workloads.')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of runs of each benchmark, the fastest one is used.')
+    parser.add_argument('--baseline', default=BASELINE_FILE_PATH, help='Baseline file to compare with.')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Ratio of score change to report a regression.')
+    parser.add_argument('--output', default=None, help='Write the results into given JSON file.')
+    parser.add_argument('--save', action='store_true', help='Write the results into the baseline file instead of comparing, results are merged into the baseline if --filter is used.')
+    parser.add_argument('--list', action='store_true', help='List the benchmarks and exit.')
+
+    arguments   = parser.parse_args(arguments)
+    benchmarks  = getBenchmarks(arguments.filter)
+
+    if arguments.list:
+        for item in benchmarks:
+            mCore.displayLib.Display.display('{} ({} items)'.format(item.name(), item.count()), startNewLine=False)
+        return 0
+
+    results = runBenchmarks(benchmarks, scale=arguments.scale, repeat=arguments.repeat)
+
+    if arguments.output:
+        writeResults(arguments.output, results)
+
+    try:
+
+        if arguments.save:
+
+            if arguments.filter:
+                results = mergeResults(readResults(arguments.baseline), results)
+
+            writeResults(arguments.baseline, results)
+            mCore.displayLib.Display.displaySuccess('Baseline is written: {}'.format(arguments.baseline))
+            return 0
+
+        rows = compareResults(results, readResults(arguments.baseline), tolerance=arguments.tolerance)
+
+    except ValueError as error:
+        mCore.displayLib.Display.displayFailure(str(error))
+        return 2
+
+    displayComparison(rows)
+
+    regressed = [row[0] for row in rows if row[4] == 'regressed']
+    if regressed:
+        mCore.displayLib.Display.displayFailure('Regressed: {}'.format(', '.join(regressed)))
+        return 1
+
+    return 0
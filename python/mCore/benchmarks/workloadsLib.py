@@ -0,0 +1,309 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/benchmarks/workloadsLib.py @brief [ FILE   ] - Benchmark workloads.
+## @package mCore.benchmarks.workloadsLib    @brief [ MODULE ] - Benchmark workloads.
+#
+#  Synthetic workloads of mCore modules at production scale. Inputs are generated with fixed seeds,
+#  so each run measures the same work. Each function prepares its inputs and returns a function,
+#  only the returned function is timed.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import io
+import random
+
+import mCore.benchmarks.benchmarkLib
+import mCore.dateTimeLib
+import mCore.dependencyLib
+import mCore.displayLib
+import mCore.enumAbs
+import mCore.nameSpaceLib
+import mCore.packageIndexLib
+import mCore.pathListLib
+import mCore.versionLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ int ] - Depth of the generated enum class hierarchy.
+ENUM_DEPTH = 32
+
+## [ int ] - Number of attributes of each generated enum class.
+ENUM_ATTRIBUTE_COUNT = 16
+
+#
+## @brief Generate names with name spaces.
+#
+#  @param count [ int | None | in  ] - Number of names.
+#
+#  @exception N/A
+#
+#  @return list of str - Full path names such as assetA:group|assetA:node12.
+def _generateNames(count):
+
+    return ['asset{0}:group|asset{0}:node{1}'.format(x % 100, x) for x in range(count)]
+
+#
+## @brief Generate a deep hierarchy of enum classes.
+#
+#  @exception N/A
+#
+#  @return list of type - Classes from the base to the leaf.
+def _generateEnumHierarchy():
+
+    classes = [mCore.enumAbs.Enum]
+
+    for depth in range(ENUM_DEPTH):
+        attributes = dict([('kLevel{}Item{}'.format(depth, x), 'level{}item{}'.format(depth, x)) for x in range(ENUM_ATTRIBUTE_COUNT)])
+        classes.append(type('Level{}'.format(depth), (classes[-1],), attributes))
+
+    return classes[1:]
+
+@mCore.benchmarks.benchmarkLib.benchmark('nameSpaceLib.NameSpace.addNameSpace', 1000000)
+def addNameSpace(count):
+
+    names = _generateNames(count)
+
+    def run():
+        for name in names:
+            mCore.nameSpaceLib.NameSpace.addNameSpace('character', name)
+
+    return run
+
+@mCore.benchmarks.benchmarkLib.benchmark('nameSpaceLib.NameSpace.removeNameSpace', 1000000)
+def removeNameSpace(count):
+
+    names = _generateNames(count)
+
+    def run():
+        for name in names:
+            mCore.nameSpaceLib.NameSpace.removeNameSpace(name)
+
+    return run
+
+@mCore.benchmarks.benchmarkLib.benchmark('nameSpaceLib.NameSpace.headTail', 1000000)
+def headTail(count):
+
+    nameSpaces = [mCore.nameSpaceLib.NameSpace('show:asset{}:node{}'.format(x % 100, x)) for x in range(count)]
+
+    def run():
+        for nameSpace in nameSpaces:
+            nameSpace.head()
+            nameSpace.tail()
+
+    return run
+
+@mCore.benchmarks.benchmarkLib.benchmark('enumAbs.Enum.getattr', 1000000)
+def enumGetattr(count):
+
+    leaf        = _generateEnumHierarchy()[-1]
+    attributes  = ['kLevel{}Item{}'.format(x % ENUM_DEPTH, x % ENUM_ATTRIBUTE_COUNT) for x in range(count)]
+
+    def run():
+        for attribute in attributes:
+            getattr(leaf, attribute)
+
+    return run
+
+@mCore.benchmarks.benchmarkLib.benchmark('enumAbs.Enum.getValueFromAttributeName', 100000)
+def enumGetValueFromAttributeName(count):
+
+    classes = _generateEnumHierarchy()
+    lookups = [(classes[x % ENUM_DEPTH], 'Level{}Item{}'.format(x % ENUM_DEPTH, x % ENUM_ATTRIBUTE_COUNT)) for x in range(count)]
+
+    def run():
+        for cls, attribute in lookups:
+            cls.getValueFromAttributeName(attribute, removeK=True)
+
+    return run
+
+@mCore.benchmarks.benchmarkLib.benchmark('enumAbs.Enum.getAttributeNameFromValue', 100000)
+def enumGetAttributeNameFromValue(count):
+
+    classes = _generateEnumHierarchy()
+    lookups = [(classes[x % ENUM_DEPTH], 'level{}item{}'.format(x % ENUM_DEPTH, x % ENUM_ATTRIBUTE_COUNT)) for x in range(count)]
+
+    def run():
+        for cls, value in lookups:
+            cls.getAttributeNameFromValue(value)
+
+    return run
+
+@mCore.benchmarks.benchmarkLib.benchmark('enumAbs.Enum.listAttributes', 100000)
+def enumListAttributes(count):
+
+    classes = _generateEnumHierarchy()
+
+    def run():
+        for index in range(count):
+            classes[index % ENUM_DEPTH].listAttributes()
+
+    return run
+
+@mCore.benchmarks.benchmarkLib.benchmark('displayLib.Display.display', 100000)
+def display(count):
+
+    lines = ['frame {} rendered in {} ms'.format(x, x % 997) for x in range(count)]
+
+    def run():
+        out = io.StringIO()
+        for line in lines:
+            mCore.displayLib.Display.display(line, startNewLine=False, useColor=False, out=out)
+
+    return run
+
+@mCore.benchmarks.benchmarkLib.benchmark('displayLib.Display.displayJson', 100000)
+def displayJson(count):
+
+    lines = ['frame {} rendered in {} ms'.format(x, x % 997) for x in range(count)]
+
+    def run():
+        out = io.StringIO()
+        mCore.displayLib.Display.setOutputFormat(mCore.displayLib.Format.kJson)
+        try:
+            for line in lines:
+                mCore.displayLib.Display.display(line, out=out, level=mCore.displayLib.ColorName.kInfo, fields={'shot': 'sh010'})
+        finally:
+            mCore.displayLib.Display.setOutputFormat(mCore.displayLib.Format.kColor)
+
+    return run
+
+@mCore.benchmarks.benchmarkLib.benchmark('displayLib.Display.displayTable', 100000)
+def displayTable(count):
+
+    rows = [('asset:node{}'.format(x), x, 'ok' if x % 7 else 'missing') for x in range(count)]
+
+    def run():
+        mCore.displayLib.Display.displayTable(rows, header=('Name', 'Index', 'Status'), useColor=False, out=io.StringIO())
+
+    return run
+
+@mCore.benchmarks.benchmarkLib.benchmark('dateTimeLib.getDateTimeStamp', 100000)
+def getDateTimeStamp(count):
+
+    def run():
+        for _ in range(count):
+            mCore.dateTimeLib.getDateTimeStamp()
+
+    return run
+
+@mCore.benchmarks.benchmarkLib.benchmark('dateTimeLib.formatStamps', 100000)
+def formatStamps(count):
+
+    values = [1368000000 + x * 37 for x in range(count)]
+
+    def run():
+        mCore.dateTimeLib.formatStamps(values)
+
+    return run
+
+@mCore.benchmarks.benchmarkLib.benchmark('dateTimeLib.parseStamps', 100000)
+def parseStamps(count):
+
+    stamps = mCore.dateTimeLib.formatStamps([1368000000 + x * 37 for x in range(count)])
+
+    def run():
+        mCore.dateTimeLib.parseStamps(stamps)
+
+    return run
+
+@mCore.benchmarks.benchmarkLib.benchmark('versionLib.parseVersion', 100000)
+def parseVersion(count):
+
+    versions = ['{}.{}.{}'.format(x % 7, x % 101, x) for x in range(count)]
+
+    # Memoized versions would make later runs measure lookups only
+    mCore.versionLib._VERSIONS.clear()
+
+    def run():
+        for version in versions:
+            mCore.versionLib.parseVersion(version)
+
+    return run
+
+@mCore.benchmarks.benchmarkLib.benchmark('versionLib.selectBestVersions', 100000)
+def selectBestVersions(count):
+
+    randomizer  = random.Random(0)
+    candidates  = {}
+
+    for index in range(count):
+        candidates.setdefault('package{}'.format(index % 2000), []).append('{}.{}.{}'.format(randomizer.randrange(4), randomizer.randrange(20), randomizer.randrange(30)))
+
+    constraints = dict([(x, '>=1.2, <3') for x in candidates])
+
+    def run():
+        mCore.versionLib.selectBestVersions(candidates, constraints)
+
+    return run
+
+@mCore.benchmarks.benchmarkLib.benchmark('pathListLib.PathList', 100000)
+def pathList(count):
+
+    randomizer  = random.Random(0)
+    operations  = [(randomizer.random() < 0.5, '/tools/package{}/bin'.format(randomizer.randrange(3000))) for _ in range(count)]
+
+    def run():
+        paths = mCore.pathListLib.PathList()
+        for isPrepend, path in operations:
+            if isPrepend:
+                paths.prepend([path])
+            else:
+                paths.append([path])
+        paths.toString()
+
+    return run
+
+@mCore.benchmarks.benchmarkLib.benchmark('packageIndexLib.PackageIndex.search', 2000)
+def packageIndexSearch(count):
+
+    randomizer  = random.Random(0)
+    keywords    = ['keyword{:05d}'.format(x) for x in range(20000)]
+    index       = mCore.packageIndexLib.PackageIndex()
+
+    for number in range(5000):
+        index.setPackage('package{}'.format(number), {'KEYWORDS'       : randomizer.sample(keywords, 8),
+                                                      'PLATFORMS'      : randomizer.sample(['Linux', 'Darwin', 'Windows'], randomizer.randint(1, 3)),
+                                                      'APPLICATIONS'   : randomizer.choice([['all'], ['maya'], ['nuke', 'maya']]),
+                                                      'PYTHON_VERSIONS': randomizer.choice([['2'], ['3'], ['2', '3'], ['3.9']])})
+
+    queries = [keywords[randomizer.randrange(len(keywords))][:randomizer.randint(8, 12)] for _ in range(count)]
+
+    def run():
+        for query in queries:
+            index.search(keywords=[query], platform='Linux', application='maya', pythonVersion='3')
+
+    return run
+
+@mCore.benchmarks.benchmarkLib.benchmark('dependencyLib.DependencyGraph.loadOrder', 20000)
+def dependencyLoadOrder(count):
+
+    randomizer      = random.Random(0)
+    dependencies    = dict([('package{}'.format(x), ['package{}'.format(randomizer.randrange(x)) for _ in range(min(x, 8))]) for x in range(count)])
+
+    def run():
+        mCore.dependencyLib.DependencyGraph(dependencies).loadOrder()
+
+    return run
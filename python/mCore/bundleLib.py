@@ -0,0 +1,636 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/bundleLib.py @brief [ FILE   ] - Single file bundles of Python packages.
+## @package mCore.bundleLib    @brief [ MODULE ] - Single file bundles of Python packages.
+#
+#  A bundle contains compiled code of all the modules of a set of Python packages in a single file.
+#  BundleImporter memory maps the bundle and imports the modules from it, so starting a tool reads
+#  one file sequentially instead of many small files from shared storage.
+#
+#  Bundles are created for the Python version which creates them. Only Python modules are bundled,
+#  data files of the packages aren't; modules, which read files relative to their __file__, should
+#  be kept in directory layout.
+#
+# @code
+#
+#import mCore.bundleLib
+#
+#directories = mCore.bundleLib.resolvePythonPackages(['mAsset'])
+#mCore.bundleLib.createBundle('/tools/bundles/mAsset.mcb', directories)
+#
+#mCore.bundleLib.install('/tools/bundles/mAsset.mcb')
+#
+#import mAsset.assetLib
+#
+# @endcode
+#
+#  Startup times of directory layout and bundle can be compared from command line.
+#
+# @code
+#
+#python -m mCore.bundleLib benchmark mAsset.assetLib --package mAsset --runs 5
+#
+# @endcode
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import argparse
+import importlib.machinery
+import marshal
+import mmap
+import os
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ bytes ] - Magic bytes of bundle files.
+BUNDLE_MAGIC = b'MCBUNDLE'
+
+## [ int ] - Version of bundle file format.
+_BUNDLE_VERSION = 1
+
+## [ struct.Struct ] - Header of bundle files: magic, version of Python, format version and size of the index.
+_HEADER = struct.Struct('<8sIII')
+
+## [ list of mCore.bundleLib.BundleImporter ] - Installed importers.
+_BUNDLE_IMPORTERS = []
+
+#
+## @brief Get Python package directories of given packages and the packages they depend on.
+#
+#  Packages are looked up from a package registry, their packageInfoLib modules aren't imported.
+#
+#  @param packageNames  [ list of str                                   | None  | in  ] - Names of the packages.
+#  @param paths         [ list of str                                   | None  | in  ] - Paths to find the packages in, sys.path is used if not provided.
+#  @param ignoreMissing [ bool                                          | False | in  ] - Skip packages, which aren't found, instead of raising an exception.
+#  @param registry      [ mCore.packageRegistryLib.PackageRegistry      | None  | in  ] - Package registry, a new one is created for `paths` if not provided.
+#
+#  @exception ValueError - If a package isn't found and `ignoreMissing` is False.
+#
+#  @return list of str - Absolute paths of the Python package directories.
+def resolvePythonPackages(packageNames, paths=None, ignoreMissing=False, registry=None):
+
+    import mCore.packageRegistryLib
+
+    registry    = registry or mCore.packageRegistryLib.PackageRegistry(paths)
+    directories = []
+    visited     = set()
+    pending     = list(packageNames)
+
+    while pending:
+
+        packageName = pending.pop(0)
+        if packageName in visited:
+            continue
+
+        visited.add(packageName)
+
+        info = registry.package(packageName)
+        if info is None:
+            if ignoreMissing:
+                continue
+            raise ValueError('Package {} is not found'.format(packageName))
+
+        for pythonPackage in info.pythonPackages():
+            directory = os.path.join(info.pythonDirectory(), pythonPackage)
+            if os.path.isdir(directory) and directory not in directories:
+                directories.append(directory)
+
+        pending.extend(info.dependentPackages())
+
+    return directories
+
+#
+## @brief Get Python modules of given Python package directory.
+#
+#  @param directory    [ str  | None | in  ] - Absolute path of the Python package directory.
+#  @param excludeTests [ bool | None | in  ] - Skip tests packages.
+#
+#  @exception N/A
+#
+#  @return list of tuple - Full name of the module, absolute path of the source file and whether the module is a package.
+def _collectModules(directory, excludeTests):
+
+    modules = []
+    stack   = [(directory, os.path.basename(directory))]
+
+    while stack:
+
+        path, packageName = stack.pop()
+
+        if not os.path.isfile(os.path.join(path, '__init__.py')):
+            continue
+
+        modules.append((packageName, os.path.join(path, '__init__.py'), True))
+
+        for entry in sorted(os.scandir(path), key=lambda x: x.name):
+
+            if entry.is_dir():
+                if entry.name.isidentifier() and not (excludeTests and entry.name == 'tests'):
+                    stack.append((entry.path, '{}.{}'.format(packageName, entry.name)))
+
+            elif entry.name.endswith('.py') and entry.name != '__init__.py' and entry.name[:-3].isidentifier():
+                modules.append(('{}.{}'.format(packageName, entry.name[:-3]), entry.path, False))
+
+    return modules
+
+#
+## @brief Create a bundle of given Python packages.
+#
+#  Bundle is written into a temporary file, which then replaces the bundle file, so processes using
+#  the previous bundle aren't affected.
+#
+#  @param bundleFilePath [ str         | None | in  ] - Absolute path of the bundle file.
+#  @param directories    [ list of str | None | in  ] - Absolute paths of the Python package directories.
+#  @param optimization   [ int         | 0    | in  ] - Optimization level of the compiled code.
+#  @param excludeTests   [ bool        | True | in  ] - Skip tests packages.
+#
+#  @exception SyntaxError - If a module can't be compiled.
+#
+#  @return dict - Summary with modules and bytes keys, which are the number of bundled modules and size of the bundle.
+def createBundle(bundleFilePath, directories, optimization=0, excludeTests=True):
+
+    index   = {}
+    blobs   = []
+    offset  = 0
+
+    for directory in directories:
+
+        for name, sourcePath, isPackage in _collectModules(os.path.realpath(directory), excludeTests):
+
+            if name in index:
+                continue
+
+            with open(sourcePath, 'rb') as _file:
+                code = compile(_file.read(), sourcePath, 'exec', dont_inherit=True, optimize=optimization)
+
+            blob = marshal.dumps(code)
+
+            index[name] = (offset, len(blob), isPackage, sourcePath)
+            blobs.append(blob)
+            offset += len(blob)
+
+    indexBlob   = marshal.dumps(index)
+    directory   = os.path.dirname(os.path.abspath(bundleFilePath))
+
+    descriptor, temporaryFilePath = tempfile.mkstemp(prefix='.{}.'.format(os.path.basename(bundleFilePath)), dir=directory)
+
+    try:
+        with os.fdopen(descriptor, 'wb') as _file:
+            _file.write(_HEADER.pack(BUNDLE_MAGIC, sys.hexversion, _BUNDLE_VERSION, len(indexBlob)))
+            _file.write(indexBlob)
+            _file.writelines(blobs)
+
+        os.replace(temporaryFilePath, bundleFilePath)
+
+    except Exception:
+        os.remove(temporaryFilePath)
+        raise
+
+    return {'modules': len(index), 'bytes': _HEADER.size + len(indexBlob) + offset}
+
+#
+## @brief [ CLASS ] - Meta path finder and loader, which imports modules from a bundle.
+#
+#  Bundle file is memory mapped and the kernel is advised to read all of it ahead, code of a module
+#  is unmarshalled from the mapping when the module is executed.
+class BundleImporter(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param bundleFilePath [ str | None | in  ] - Absolute path of the bundle file.
+    #
+    #  @exception ValueError - If the file isn't a bundle or it is created by another Python version.
+    #
+    #  @return None - None.
+    def __init__(self, bundleFilePath):
+
+        ## [ str ] - Absolute path of the bundle file.
+        self._bundleFilePath = os.path.abspath(bundleFilePath)
+
+        with open(self._bundleFilePath, 'rb') as _file:
+            ## [ mmap.mmap ] - Mapping of the bundle file.
+            self._mmap = mmap.mmap(_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if hasattr(self._mmap, 'madvise') and hasattr(mmap, 'MADV_WILLNEED'):
+            self._mmap.madvise(mmap.MADV_WILLNEED)
+
+        try:
+            magic, pythonVersion, version, indexSize = _HEADER.unpack_from(self._mmap, 0)
+        except struct.error:
+            magic = None
+
+        if magic != BUNDLE_MAGIC or version != _BUNDLE_VERSION:
+            self._mmap.close()
+            raise ValueError('{} is not a bundle file'.format(self._bundleFilePath))
+
+        # Format of marshalled code may change between any two versions of Python
+        if pythonVersion != sys.hexversion:
+            self._mmap.close()
+            raise ValueError('{} is created by another Python version'.format(self._bundleFilePath))
+
+        ## [ int ] - Offset of the code of the modules.
+        self._dataOffset    = _HEADER.size + indexSize
+
+        ## [ dict ] - Module names as keys and tuple of offset, size, whether it is a package and source path as values.
+        self._index         = marshal.loads(self._mmap[_HEADER.size:self._dataOffset])
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Absolute path of the bundle file.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Path.
+    def bundleFilePath(self):
+
+        return self._bundleFilePath
+
+    #
+    ## @brief Names of the modules in the bundle.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Names.
+    def moduleNames(self):
+
+        return sorted(self._index)
+
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Find spec of given module.
+    #
+    #  Method is called by the import system.
+    #
+    #  @param fullname [ str         | None | in  ] - Full name of the module.
+    #  @param path     [ list of str | None | in  ] - Search locations of the parent package.
+    #  @param target   [ module      | None | in  ] - Module to reload.
+    #
+    #  @exception N/A
+    #
+    #  @return importlib.machinery.ModuleSpec - Spec.
+    #  @return None                           - If the module isn't in the bundle.
+    def find_spec(self, fullname, path=None, target=None):
+
+        entry = self._index.get(fullname)
+        if entry is None:
+            return None
+
+        spec = importlib.machinery.ModuleSpec(fullname, self, origin=entry[3], is_package=entry[2])
+
+        if entry[2]:
+            spec.submodule_search_locations = [os.path.dirname(entry[3])]
+
+        spec.has_location = True
+
+        return spec
+
+    #
+    ## @brief Create the module.
+    #
+    #  Method is called by the import system, default module creation is used.
+    #
+    #  @param spec [ importlib.machinery.ModuleSpec | None | in  ] - Spec.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def create_module(self, spec):
+
+        return None
+
+    #
+    ## @brief Execute given module.
+    #
+    #  Method is called by the import system.
+    #
+    #  @param module [ module | None | in  ] - Module.
+    #
+    #  @exception ImportError - If the module isn't in the bundle.
+    #
+    #  @return None - None.
+    def exec_module(self, module):
+
+        exec(self.get_code(module.__name__), module.__dict__)
+
+    #
+    ## @brief Get code of given module.
+    #
+    #  @param fullname [ str | None | in  ] - Full name of the module.
+    #
+    #  @exception ImportError - If the module isn't in the bundle.
+    #
+    #  @return code - Code.
+    def get_code(self, fullname):
+
+        entry = self._index.get(fullname)
+        if entry is None:
+            raise ImportError('{} is not in {}'.format(fullname, self._bundleFilePath), name=fullname)
+
+        start = self._dataOffset + entry[0]
+
+        return marshal.loads(self._mmap[start:start + entry[1]])
+
+    #
+    ## @brief Get source of given module.
+    #
+    #  Source is read from the location the module is bundled from, if it still exists.
+    #
+    #  @param fullname [ str | None | in  ] - Full name of the module.
+    #
+    #  @exception N/A
+    #
+    #  @return str  - Source.
+    #  @return None - If the source isn't available.
+    def get_source(self, fullname):
+
+        entry = self._index.get(fullname)
+        if entry is None:
+            return None
+
+        try:
+            with open(entry[3], 'r') as _file:
+                return _file.read()
+        except (IOError, OSError):
+            return None
+
+    #
+    ## @brief Get whether given module is a package.
+    #
+    #  @param fullname [ str | None | in  ] - Full name of the module.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def is_package(self, fullname):
+
+        entry = self._index.get(fullname)
+
+        return bool(entry and entry[2])
+
+    #
+    ## @brief Close the mapping of the bundle file.
+    #
+    #  Modules, which aren't imported yet, can't be imported from the bundle after it is closed.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def close(self):
+
+        self._index = {}
+        self._mmap.close()
+
+#
+## @brief Install an importer for given bundle into sys.meta_path before the path based finder.
+#
+#  @param bundleFilePath [ str | None | in  ] - Absolute path of the bundle file.
+#
+#  @exception ValueError - If the file isn't a bundle or it is created by another Python version.
+#
+#  @return mCore.bundleLib.BundleImporter - Installed importer.
+def install(bundleFilePath):
+
+    importer = BundleImporter(bundleFilePath)
+
+    try:
+        position = sys.meta_path.index(importlib.machinery.PathFinder)
+    except ValueError:
+        position = len(sys.meta_path)
+
+    sys.meta_path.insert(position, importer)
+
+    _BUNDLE_IMPORTERS.append(importer)
+
+    return importer
+
+#
+## @brief Uninstall given importer or all installed importers from sys.meta_path.
+#
+#  @param importer [ mCore.bundleLib.BundleImporter | None | in  ] - Importer, all importers are uninstalled if not provided.
+#
+#  @exception N/A
+#
+#  @return int - Number of uninstalled importers.
+def uninstall(importer=None):
+
+    importers = [importer] if importer else list(_BUNDLE_IMPORTERS)
+    count     = 0
+
+    for item in importers:
+
+        if item not in _BUNDLE_IMPORTERS:
+            continue
+
+        _BUNDLE_IMPORTERS.remove(item)
+
+        if item in sys.meta_path:
+            sys.meta_path.remove(item)
+
+        item.close()
+
+        count += 1
+
+    return count
+
+#
+## @brief Evict given files from page cache.
+#
+#  @param filePaths [ list of str | None | in  ] - Absolute paths of the files.
+#
+#  @exception N/A
+#
+#  @return bool - Whether page cache can be evicted on this platform.
+def _evictFileCache(filePaths):
+
+    if not hasattr(os, 'posix_fadvise'):
+        return False
+
+    for filePath in filePaths:
+
+        try:
+            descriptor = os.open(filePath, os.O_RDONLY)
+        except OSError:
+            continue
+
+        try:
+            os.posix_fadvise(descriptor, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(descriptor)
+
+    return True
+
+#
+## @brief Compare startup time of importing given modules from directory layout and from a bundle.
+#
+#  Modules are imported in new interpreters. Python object files of the directory layout are
+#  compiled beforehand. Page cache of all the files is evicted before each run where the platform
+#  supports it, to measure cold start; only pages, which aren't dirty, can be evicted. mCore package
+#  and mCore.bundleLib module are imported from directory layout in both cases to install the
+#  importer.
+#
+#  @param modules          [ list of str | None | in  ] - Names of the modules to import.
+#  @param directories      [ list of str | None | in  ] - Absolute paths of the Python package directories.
+#  @param runCount         [ int         | 5    | in  ] - Number of runs for each layout.
+#  @param pythonExecutable [ str         | None | in  ] - Python executable, current one is used if not provided.
+#
+#  @exception subprocess.CalledProcessError - If a module can't be imported.
+#
+#  @return dict - Summary with directory, bundle, coldCache and modules keys. Directory and bundle values are fastest times in seconds, coldCache value is whether page cache is evicted, modules value is the number of bundled modules.
+def benchmarkStartup(modules, directories, runCount=5, pythonExecutable=None):
+
+    import mCore.pythonUtilsLib
+
+    directories = [os.path.realpath(x) for x in directories]
+    mCoreRoot   = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    paths       = []
+
+    for directory in directories + [os.path.join(mCoreRoot, 'mCore')]:
+        if os.path.dirname(directory) not in paths:
+            paths.append(os.path.dirname(directory))
+
+    mCore.pythonUtilsLib.compilePythonObjects(directories)
+
+    files = []
+    for directory in directories:
+        for root, _, fileNames in os.walk(directory):
+            files.extend([os.path.join(root, x) for x in fileNames])
+
+    temporaryDirectory  = tempfile.mkdtemp()
+    bundleFilePath      = os.path.join(temporaryDirectory, 'benchmark.mcb')
+    environment         = dict(os.environ, PYTHONPATH=os.pathsep.join(paths))
+    imports             = 'import {}'.format(', '.join(modules))
+    summary             = {'directory': None, 'bundle': None, 'coldCache': False}
+
+    try:
+
+        summary['modules'] = createBundle(bundleFilePath, directories)['modules']
+
+        commands = {'directory': 'import time\n'
+                                 'start = time.perf_counter()\n'
+                                 '{}\n'
+                                 'print(time.perf_counter() - start)\n'.format(imports),
+                    'bundle'   : 'import time\n'
+                                 'start = time.perf_counter()\n'
+                                 'import mCore.bundleLib\n'
+                                 'mCore.bundleLib.install({!r})\n'
+                                 '{}\n'
+                                 'print(time.perf_counter() - start)\n'.format(bundleFilePath, imports)}
+
+        for _ in range(max(runCount, 1)):
+
+            for layout, code in commands.items():
+
+                summary['coldCache'] = _evictFileCache(files + [bundleFilePath])
+
+                output  = subprocess.check_output([pythonExecutable or sys.executable, '-c', code], env=environment, universal_newlines=True)
+                elapsed = float(output.split()[-1])
+
+                if summary[layout] is None or elapsed < summary[layout]:
+                    summary[layout] = elapsed
+
+    finally:
+        shutil.rmtree(temporaryDirectory)
+
+    return summary
+
+#
+## @brief Run bundle commands from command line.
+#
+#  @param arguments [ list of str | None | in  ] - Command line arguments, sys.argv is used if not provided.
+#
+#  @exception N/A
+#
+#  @return int - Exit code.
+def main(arguments=None):
+
+    import mCore.displayLib
+
+    parser      = argparse.ArgumentParser(prog='python -m mCore.bundleLib', description='Create single file bundles of packages.')
+    subParsers  = parser.add_subparsers(dest='command')
+
+    createParser = subParsers.add_parser('create', help='Create a bundle of packages and their dependent packages.')
+    createParser.add_argument('bundleFilePath', help='Bundle file to create.')
+    createParser.add_argument('packages', nargs='+', help='Names of the packages.')
+    createParser.add_argument('--optimization', type=int, default=0, help='Optimization level of the compiled code.')
+
+    benchmarkParser = subParsers.add_parser('benchmark', help='Compare startup time of directory layout and bundle.')
+    benchmarkParser.add_argument('modules', nargs='+', help='Modules to import.')
+    benchmarkParser.add_argument('--package', dest='packages', action='append', required=True, help='Name of a package to bundle.')
+    benchmarkParser.add_argument('--runs', type=int, default=5, help='Number of runs for each layout.')
+
+    arguments = parser.parse_args(arguments)
+
+    if arguments.command == 'create':
+
+        summary = createBundle(arguments.bundleFilePath, resolvePythonPackages(arguments.packages), optimization=arguments.optimization)
+
+        mCore.displayLib.Display.displaySuccess('{} modules, {} bytes bundled into {}'.format(summary['modules'], summary['bytes'], arguments.bundleFilePath))
+
+        return 0
+
+    if arguments.command == 'benchmark':
+
+        summary = benchmarkStartup(arguments.modules, resolvePythonPackages(arguments.packages, ignoreMissing=True), runCount=arguments.runs)
+
+        mCore.displayLib.Display.displayTable([('directory', '{:.3f}'.format(summary['directory'] * 1000)),
+                                               ('bundle'   , '{:.3f}'.format(summary['bundle'] * 1000))],
+                                              header=('Layout', 'Startup (ms)'))
+
+        mCore.displayLib.Display.displayInfo('{} modules bundled, page cache {}evicted'.format(summary['modules'], '' if summary['coldCache'] else 'not '))
+
+        return 0
+
+    parser.print_help()
+
+    return 1
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    sys.exit(main())
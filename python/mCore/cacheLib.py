@@ -0,0 +1,141 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/cacheLib.py @brief [ FILE   ] - Local cache files.
+## @package mCore.cacheLib    @brief [ MODULE ] - Local cache files.
+#
+# @code
+#
+#import mCore.cacheLib
+#
+#filePath = mCore.cacheLib.getCacheFilePath('manifest.json')
+# #/home/user/.cache/mCore/manifest.json
+#
+#mCore.cacheLib.writeJsonFile(filePath, {'version': 1})
+#
+#mCore.cacheLib.readJsonFile(filePath)
+# #{'version': 1}
+#
+# @endcode
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import json
+import os
+import tempfile
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ str ] - Environment variable to override the cache directory.
+CACHE_DIRECTORY_ENV = 'MCORE_CACHE_DIR'
+
+#
+## @brief Get the directory of the local cache files.
+#
+#  Value of MCORE_CACHE_DIR environment variable is used if it is set, otherwise mCore directory
+#  under XDG_CACHE_HOME (or ~/.cache) is used.
+#
+#  @exception N/A
+#
+#  @return str - Absolute path of the directory.
+def getCacheDirectory():
+
+    directory = os.environ.get(CACHE_DIRECTORY_ENV)
+    if directory:
+        return directory
+
+    cacheHome = os.environ.get('XDG_CACHE_HOME')
+    if not cacheHome:
+        cacheHome = os.path.join(os.path.expanduser('~'), '.cache')
+
+    return os.path.join(cacheHome, 'mCore')
+
+#
+## @brief Get absolute path of given cache file.
+#
+#  @param name [ str | None | in  ] - Name of the file.
+#
+#  @exception N/A
+#
+#  @return str - Absolute path of the file.
+def getCacheFilePath(name):
+
+    return os.path.join(getCacheDirectory(), name)
+
+#
+## @brief Read given JSON file.
+#
+#  @param filePath     [ str     | None | in  ] - Absolute path of the file.
+#  @param defaultValue [ variant | None | in  ] - Value to return if the file doesn't exist or can't be read.
+#
+#  @exception N/A
+#
+#  @return variant - Content of the file.
+#  @return variant - If the file can't be read based on provided value for `defaultValue` argument.
+def readJsonFile(filePath, defaultValue=None):
+
+    try:
+        with open(filePath, 'r') as _file:
+            return json.load(_file)
+    except (IOError, OSError, ValueError):
+        return defaultValue
+
+#
+## @brief Write given data into given JSON file atomically.
+#
+#  Data is written into a temporary file in the same directory, which then replaces the file, so
+#  readers never see a partially written file.
+#
+#  @param filePath [ str     | None | in  ] - Absolute path of the file.
+#  @param data     [ variant | None | in  ] - Data.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def writeJsonFile(filePath, data):
+
+    directory = os.path.dirname(filePath)
+
+    try:
+
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        descriptor, temporaryFilePath = tempfile.mkstemp(prefix='.{}.'.format(os.path.basename(filePath)), dir=directory or None)
+
+        try:
+            with os.fdopen(descriptor, 'w') as _file:
+                json.dump(data, _file, separators=(',', ':'))
+
+            os.replace(temporaryFilePath, filePath)
+
+        except Exception:
+            os.remove(temporaryFilePath)
+            raise
+
+    except (IOError, OSError):
+        return False
+
+    return True
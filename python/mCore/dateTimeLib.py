@@ -49,18 +49,256 @@
 # #2013.02.11 - 19:33:20
 #
 # @endcode
+#
+# All functions read the clock once and share the strings formatted for the current second, see
+# mCore.dateTimeLib.TimeStamp class.
+#
+# @code
+#
+#import mCore.dateTimeLib
+#
+#@mCore.dateTimeLib.Stopwatch('loadAsset')
+#def loadAsset(name):
+#    pass
+#
+#with mCore.dateTimeLib.Stopwatch('publish'):
+#    pass
+#
+#mCore.dateTimeLib.getTimingRegistry().displayReport()
+#
+#mCore.dateTimeLib.parseStamps(['2013.05.20_19.32.22'], localTime=False)
+# #[1369078342]
+#
+#mCore.dateTimeLib.formatStamps([1369078342], localTime=False)
+# #['2013.05.20_19.32.22']
+#
+#mCore.dateTimeLib.StampNameGenerator(prefix='render_', suffix='.exr').generate()
+# #render_2013.05.20_19.32.22.123456_000000001024.exr
+#
+# @endcode
 
 #
 # ----------------------------------------------------------------------------------------------------
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
-from datetime import datetime
+import functools
+import os
+import random
+import tempfile
+import threading
+import time
+import weakref
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+import mCore.enumAbs
 
 
 #
 # ----------------------------------------------------------------------------------------------------
 # CODE
 # ----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Date and time values formatted for a single second.
+#
+#  Instances are not modified once they are created.
+class _TimeStampSnapshot(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param second [ int | None | in  ] - Seconds since the epoch.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, second):
+
+        localTime = time.localtime(second)
+
+        ## [ int ] - Seconds since the epoch.
+        self.second                 = second
+
+        ## [ tuple of int ] - Date in (YYYY, MM, DD) format.
+        self.dateInt                = (localTime.tm_year, localTime.tm_mon, localTime.tm_mday)
+
+        ## [ tuple of int ] - Time in (HH, MM, SS) format.
+        self.timeInt                = (localTime.tm_hour, localTime.tm_min, localTime.tm_sec)
+
+        ## [ tuple of str ] - Date in (YYYY, MM, DD) format.
+        self.dateStr                = ('%04d' % self.dateInt[0], '%02d' % self.dateInt[1], '%02d' % self.dateInt[2])
+
+        ## [ tuple of str ] - Time in (HH, MM, SS) format.
+        self.timeStr                = ('%02d' % self.timeInt[0], '%02d' % self.timeInt[1], '%02d' % self.timeInt[2])
+
+        ## [ str ] - Date in "YYYY.MM.DD" format.
+        self.dateStamp              = '.'.join(self.dateStr)
+
+        ## [ str ] - Time in "HH:MM:SS" format.
+        self.timeStamp              = ':'.join(self.timeStr)
+
+        ## [ str ] - Date and time in "YYYY.MM.DD - HH:MM:SS" format.
+        self.dateTimeStamp          = '{} - {}'.format(self.dateStamp, self.timeStamp)
+
+        ## [ str ] - Date and time in "YYYY.MM.DD_HH.MM.SS" format.
+        self.dateTimeForFileSystem  = '{}_{}'.format(self.dateStamp, '.'.join(self.timeStr))
+
+#
+## @brief [ CLASS ] - Class to get date and time stamps for the current second.
+#
+#  The clock is read once for each call and all the values of the current second are formatted
+#  together, so fields of the values always belong to the same second. Formatted values are cached
+#  until the second changes, therefore existing strings are returned for subsequent calls.
+#
+#  Cached values are kept in a single immutable object, which is replaced when the second changes,
+#  so instances can be shared between threads without locking.
+#
+#  @code
+#import mCore.dateTimeLib
+#
+#timeStamp = mCore.dateTimeLib.TimeStamp()
+#
+#timeStamp.dateTimeForFileSystem()
+# #2013.05.20_19.32.22
+#  @endcode
+class TimeStamp(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self):
+
+        ## [ mCore.dateTimeLib._TimeStampSnapshot ] - Values of the last second.
+        self._snapshot = _TimeStampSnapshot(int(time.time()))
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get the values of the current second.
+    #
+    #  @param second [ int | None | in  ] - Seconds since the epoch, current second is used if not provided.
+    #
+    #  @exception N/A
+    #
+    #  @return mCore.dateTimeLib._TimeStampSnapshot - Snapshot.
+    def _current(self, second=None):
+
+        if second is None:
+            second = int(time.time())
+
+        snapshot = self._snapshot
+
+        if snapshot.second != second:
+            snapshot = self._snapshot = _TimeStampSnapshot(second)
+
+        return snapshot
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get date as int list in [YYYY, MM, DD] format.
+    #
+    #  @exception N/A
+    #
+    #  @return list of int - Date.
+    def dateIntList(self):
+
+        return list(self._current().dateInt)
+
+    #
+    ## @brief Get time as int list in [HH, MM, SS] format.
+    #
+    #  @exception N/A
+    #
+    #  @return list of int - Time.
+    def timeIntList(self):
+
+        return list(self._current().timeInt)
+
+    #
+    ## @brief Get date as string list in [YYYY, MM, DD] format.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Date.
+    def dateStrList(self):
+
+        return list(self._current().dateStr)
+
+    #
+    ## @brief Get time as string list in [HH, MM, SS] format.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Time.
+    def timeStrList(self):
+
+        return list(self._current().timeStr)
+
+    #
+    ## @brief Get date and time as single string in "YYYY.MM.DD_HH.MM.SS" format.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Date and time.
+    def dateTimeForFileSystem(self):
+
+        return self._current().dateTimeForFileSystem
+
+    #
+    ## @brief Get date as string in "YYYY.MM.DD" format.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Date.
+    def dateStamp(self):
+
+        return self._current().dateStamp
+
+    #
+    ## @brief Get time as string in "HH:MM:SS" format.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Time.
+    def timeStamp(self):
+
+        return self._current().timeStamp
+
+    #
+    ## @brief Get date and time as single string in "YYYY.MM.DD - HH:MM:SS" format.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Date and time.
+    def dateTimeStamp(self):
+
+        return self._current().dateTimeStamp
+
+## [ mCore.dateTimeLib.TimeStamp ] - Time stamp instance shared by the functions of this module.
+_TIME_STAMP = TimeStamp()
+
 #
 ## @brief Get date as int list in [YYYY, MM, DD] format.
 #
@@ -69,7 +307,7 @@ from datetime import datetime
 #  @return list of int - Date.
 def getDateIntList():
 
-    return [datetime.now().year, datetime.now().month, datetime.now().day]
+    return _TIME_STAMP.dateIntList()
 
 #
 ## @brief Get time as int list in [HH, MM, SS] format.
@@ -79,7 +317,7 @@ def getDateIntList():
 #  @return list of int - Time.
 def getTimeIntList():
 
-    return [datetime.now().hour, datetime.now().minute, datetime.now().second]
+    return _TIME_STAMP.timeIntList()
 
 #
 ## @brief Get date as string list in [YYYY, MM, DD] format.
@@ -89,9 +327,7 @@ def getTimeIntList():
 #  @return list of str - Date.
 def getDateStrList():
 
-    date = getDateIntList()
-
-    return ['{0:04d}'.format(date[0]), '{0:02d}'.format(date[1]), '{0:02d}'.format(date[2])]
+    return _TIME_STAMP.dateStrList()
 
 #
 ## @brief Get time as string list in [HH, MM, SS] format.
@@ -101,9 +337,7 @@ def getDateStrList():
 #  @return list of str - Time.
 def getTimeStrList():
 
-    time = getTimeIntList()
-
-    return ['{0:02d}'.format(time[0]), '{0:02d}'.format(time[1]), '{0:02d}'.format(time[2])]
+    return _TIME_STAMP.timeStrList()
 
 #
 ## @brief Get date and time as single string in "YYYY.MM.DD_HH.MM.SS" format.
@@ -113,10 +347,7 @@ def getTimeStrList():
 #  @return str - Date and time.
 def getDateTimeForFileSystem():
 
-    date = getDateStrList()
-    time = getTimeStrList()
-
-    return str('{}.{}.{}_{}.{}.{}').format(date[0], date[1], date[2], time[0], time[1], time[2])
+    return _TIME_STAMP.dateTimeForFileSystem()
 
 #
 ## @brief Get date as string in "YYYY.MM.DD" format.
@@ -126,9 +357,7 @@ def getDateTimeForFileSystem():
 #  @return str - Date.
 def getDateStamp():
 
-    date = getDateStrList()
-
-    return str('{}.{}.{}').format(date[0], date[1], date[2])
+    return _TIME_STAMP.dateStamp()
 
 #
 ## @brief Get time as string in "HH:MM:SS" format.
@@ -138,9 +367,7 @@ def getDateStamp():
 #  @return str - Time.
 def getTimeStamp():
 
-    time = getTimeStrList()
-
-    return str('{}:{}:{}').format(time[0], time[1], time[2])
+    return _TIME_STAMP.timeStamp()
 
 #
 ## @brief Get date and time as single string in "YYYY.MM.DD - HH:MM:SS" format.
@@ -150,7 +377,1292 @@ def getTimeStamp():
 #  @return str - Date and time.
 def getDateTimeStamp():
 
-    date = getDateStrList()
-    time = getTimeStrList()
+    return _TIME_STAMP.dateTimeStamp()
+
+#
+## @brief Get the value of a monotonic clock in nanoseconds.
+#
+#  time.perf_counter_ns is used if available.
+#
+#  @exception N/A
+#
+#  @return int - Nanoseconds.
+def _perfCounterNs():
+
+    return int(_perfCounter() * 1000000000)
+
+## [ function ] - Clock used for perfCounterNs fallback.
+_perfCounter = getattr(time, 'perf_counter', time.time)
+
+## [ function ] - Monotonic clock in nanoseconds.
+perfCounterNs = getattr(time, 'perf_counter_ns', _perfCounterNs)
+
+#
+## @brief [ CLASS ] - Timing statistic of a single name collected by a single thread.
+class _TimingStatistic(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param sampleSize [ int | None | in  ] - Maximum number of samples kept to compute percentiles.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, sampleSize):
+
+        ## [ int ] - Number of recorded durations.
+        self.count      = 0
+
+        ## [ int ] - Sum of recorded durations in nanoseconds.
+        self.total      = 0
+
+        ## [ int ] - Minimum duration in nanoseconds.
+        self.minimum    = None
+
+        ## [ int ] - Maximum duration in nanoseconds.
+        self.maximum    = None
+
+        ## [ list of int ] - Reservoir of sampled durations in nanoseconds.
+        self.samples    = []
+
+        ## [ int ] - Maximum number of samples.
+        self.sampleSize = sampleSize
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Record given duration.
+    #
+    #  @param nanoseconds [ int | None | in  ] - Duration.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def record(self, nanoseconds):
+
+        self.count += 1
+        self.total += nanoseconds
+
+        if self.minimum is None or nanoseconds < self.minimum:
+            self.minimum = nanoseconds
+
+        if self.maximum is None or nanoseconds > self.maximum:
+            self.maximum = nanoseconds
+
+        if len(self.samples) < self.sampleSize:
+            self.samples.append(nanoseconds)
+        else:
+            index = int(random.random() * self.count)
+            if index < self.sampleSize:
+                self.samples[index] = nanoseconds
+
+    #
+    ## @brief Merge given statistic into this one.
+    #
+    #  Samples of both statistics are kept in proportion to their counts so each sample keeps
+    #  representing `count / len(samples)` durations.
+    #
+    #  @param other [ mCore.dateTimeLib._TimingStatistic | None | in  ] - Statistic.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def merge(self, other):
+
+        if not other.count:
+            return
+
+        count     = self.count + other.count
+        size      = min(self.sampleSize, len(self.samples) + len(other.samples))
+        otherSize = min(len(other.samples), int(round(size * other.count / float(count))))
+        selfSize  = min(len(self.samples), size - otherSize)
+        otherSize = min(len(other.samples), size - selfSize)
+
+        self.samples = self.samples[:selfSize] + other.samples[:otherSize]
+        self.count   = count
+        self.total  += other.total
+        self.minimum = other.minimum if self.minimum is None else min(self.minimum, other.minimum)
+        self.maximum = other.maximum if self.maximum is None else max(self.maximum, other.maximum)
+
+#
+## @brief [ CLASS ] - Class to aggregate durations into named statistics.
+#
+#  Each thread records into its own statistics, therefore recording doesn't acquire any lock except
+#  the first time a thread records after creation or reset of the registry. Statistics of all the
+#  threads are merged when they are requested. Statistics of threads, which are no longer alive, are
+#  folded into a shared aggregate so they aren't kept for each thread.
+#
+#  Percentiles are computed from a reservoir of at most `sampleSize` durations for each name and
+#  thread, each sample is weighted by the number of durations it represents. Count, total, min and
+#  max are exact.
+class TimingRegistry(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param sampleSize [ int | 1024 | in  ] - Maximum number of samples kept to compute percentiles.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, sampleSize=1024):
+
+        ## [ int ] - Maximum number of samples kept to compute percentiles.
+        self._sampleSize        = sampleSize
+
+        ## [ threading.local ] - Statistics of the current thread.
+        self._local             = threading.local()
+
+        ## [ threading.Lock ] - Lock to register statistics of threads.
+        self._lock              = threading.Lock()
+
+        ## [ list of tuple ] - Weak references to the threads and their statistics.
+        self._threadStatistics  = []
+
+        ## [ dict ] - Statistics of the threads, which are no longer alive.
+        self._retiredStatistics = {}
+
+        ## [ int ] - Incremented each time the registry is reset.
+        self._generation        = 0
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Register statistics for the current thread.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Statistics of the current thread.
+    def _registerThread(self):
+
+        with self._lock:
+
+            self._retireThreads()
+
+            statistics = {}
+
+            self._threadStatistics.append((weakref.ref(threading.current_thread()), statistics))
+
+            self._local.generation = self._generation
+            self._local.statistics = statistics
+
+        return statistics
+
+    #
+    ## @brief Fold statistics of the threads, which are no longer alive, into the shared aggregate.
+    #
+    #  Lock must be acquired by the caller.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _retireThreads(self):
+
+        threadStatistics = []
+
+        for threadReference, statistics in self._threadStatistics:
+
+            thread = threadReference()
+            if thread is not None and thread.is_alive():
+                threadStatistics.append((threadReference, statistics))
+                continue
+
+            for name, statistic in statistics.items():
+
+                retired = self._retiredStatistics.get(name)
+                if retired is None:
+                    retired = self._retiredStatistics[name] = _TimingStatistic(self._sampleSize)
+
+                retired.merge(statistic)
+
+        self._threadStatistics = threadStatistics
+
+    #
+    ## @brief Get the value of given percentile from given weighted samples.
+    #
+    #  @param samples    [ list of tuple | None | in  ] - Sorted duration and weight pairs.
+    #  @param percentile [ float         | None | in  ] - Percentile between 0 and 100.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Value.
+    @staticmethod
+    def _percentile(samples, percentile):
+
+        target     = percentile / 100.0 * sum([x[1] for x in samples])
+        cumulative = 0.0
+
+        for value, weight in samples:
+
+            cumulative += weight
+            if cumulative >= target:
+                return value
+
+        return samples[-1][0]
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Record given duration for given name.
+    #
+    #  @param name        [ str | None | in  ] - Name of the statistic.
+    #  @param nanoseconds [ int | None | in  ] - Duration.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def record(self, name, nanoseconds):
+
+        local = self._local
+
+        if getattr(local, 'generation', None) == self._generation:
+            statistics = local.statistics
+        else:
+            statistics = self._registerThread()
+
+        statistic = statistics.get(name)
+        if statistic is None:
+            statistic = statistics[name] = _TimingStatistic(self._sampleSize)
+
+        statistic.record(nanoseconds)
+
+    #
+    ## @brief Get merged statistics.
+    #
+    #  Durations are in nanoseconds.
+    #
+    #  @param name [ str | None | in  ] - Name of the statistic, all statistics are returned if not provided.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Names as keys and dict instances with count, total, min, max, p50 and p95 keys as values.
+    def statistics(self, name=None):
+
+        merged = {}
+
+        with self._lock:
+
+            self._retireThreads()
+
+            for statistics in [self._retiredStatistics] + [x[1] for x in self._threadStatistics]:
+
+                for statisticName, statistic in list(statistics.items()):
+
+                    if name is not None and statisticName != name:
+                        continue
+
+                    if not statistic.count or not statistic.samples:
+                        continue
+
+                    data = merged.get(statisticName)
+                    if data is None:
+                        data = merged[statisticName] = {'count': 0, 'total': 0, 'min': statistic.minimum, 'max': statistic.maximum, 'samples': []}
+
+                    weight = statistic.count / float(len(statistic.samples))
+
+                    data['count'] += statistic.count
+                    data['total'] += statistic.total
+                    data['min']    = min(data['min'], statistic.minimum)
+                    data['max']    = max(data['max'], statistic.maximum)
+                    data['samples'].extend([(x, weight) for x in statistic.samples])
+
+        for data in merged.values():
+
+            samples = sorted(data.pop('samples'))
+
+            data['p50'] = TimingRegistry._percentile(samples, 50)
+            data['p95'] = TimingRegistry._percentile(samples, 95)
+
+        return merged
+
+    #
+    ## @brief Remove all the statistics.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def reset(self):
+
+        with self._lock:
+            self._generation       += 1
+            self._threadStatistics  = []
+            self._retiredStatistics = {}
+
+    #
+    ## @brief Get the report of the statistics ordered by their total duration.
+    #
+    #  @exception N/A
+    #
+    #  @return list of tuple - Rows of name, count, total, min, max, p50 and p95, durations are in milliseconds.
+    def report(self):
+
+        rows = []
+
+        for name, data in self.statistics().items():
+            rows.append((name,
+                         data['count'],
+                         data['total'] / 1000000.0,
+                         data['min']   / 1000000.0,
+                         data['max']   / 1000000.0,
+                         data['p50']   / 1000000.0,
+                         data['p95']   / 1000000.0))
+
+        rows.sort(key=lambda x: x[2], reverse=True)
+
+        return rows
+
+    #
+    ## @brief Display the report of the statistics as a table.
+    #
+    #  @param useColor [ bool | True | in  ] - Use color to display the header.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def displayReport(self, useColor=True):
+
+        import mCore.displayLib
+
+        rows = [[row[0], row[1]] + ['{:.3f}'.format(x) for x in row[2:]] for row in self.report()]
+
+        mCore.displayLib.Display.displayTable(rows,
+                                              header=('Name', 'Count', 'Total (ms)', 'Min (ms)', 'Max (ms)', 'P50 (ms)', 'P95 (ms)'),
+                                              useColor=useColor)
+
+## [ mCore.dateTimeLib.TimingRegistry ] - Timing registry shared by Stopwatch instances.
+_TIMING_REGISTRY = TimingRegistry()
+
+#
+## @brief Get the timing registry shared by Stopwatch instances.
+#
+#  @exception N/A
+#
+#  @return mCore.dateTimeLib.TimingRegistry - Timing registry.
+def getTimingRegistry():
+
+    return _TIMING_REGISTRY
+
+#
+## @brief [ CLASS ] - Monotonic high resolution stopwatch.
+#
+#  Stopwatch can be used as a context manager or a decorator. If a name is provided, measured
+#  durations are recorded into the timing registry. An instance used as context manager measures a
+#  single block at a time, decorated functions can be called by many threads.
+#
+#  @code
+#import mCore.dateTimeLib
+#
+#with mCore.dateTimeLib.Stopwatch() as stopwatch:
+#    pass
+#
+#stopwatch.elapsed()
+# #0.000001
+#  @endcode
+class Stopwatch(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param name     [ str                              | None | in  ] - Name of the statistic to record durations into.
+    #  @param registry [ mCore.dateTimeLib.TimingRegistry | None | in  ] - Timing registry, shared registry is used if not provided.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, name=None, registry=None):
+
+        ## [ str ] - Name of the statistic.
+        self._name     = name
+
+        ## [ mCore.dateTimeLib.TimingRegistry ] - Timing registry.
+        self._registry = registry if registry is not None else _TIMING_REGISTRY
+
+        ## [ int ] - Start time in nanoseconds.
+        self._start    = None
+
+        ## [ int ] - Elapsed time in nanoseconds.
+        self._elapsed  = 0
+
+    #
+    ## @brief Start the stopwatch.
+    #
+    #  @exception N/A
+    #
+    #  @return mCore.dateTimeLib.Stopwatch - This instance.
+    def __enter__(self):
+
+        self.start()
+
+        return self
+
+    #
+    ## @brief Stop the stopwatch.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - False, exceptions are not suppressed.
+    def __exit__(self, exceptionType, exceptionValue, traceback):
+
+        self.stop()
+
+        return False
+
+    #
+    ## @brief Decorate given function to measure its calls.
+    #
+    #  Name of the function is used as the name of the statistic if this stopwatch has no name.
+    #
+    #  @param function [ function | None | in  ] - Function.
+    #
+    #  @exception N/A
+    #
+    #  @return function - Decorated function.
+    def __call__(self, function):
+
+        name     = self._name if self._name else '{}.{}'.format(function.__module__, function.__name__)
+        registry = self._registry
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+
+            start = perfCounterNs()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                registry.record(name, perfCounterNs() - start)
+
+        return wrapper
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Start the stopwatch.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def start(self):
+
+        self._start = perfCounterNs()
+
+    #
+    ## @brief Stop the stopwatch and record the duration if the stopwatch has a name.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Elapsed time in nanoseconds.
+    def stop(self):
+
+        if self._start is None:
+            return self._elapsed
+
+        self._elapsed = perfCounterNs() - self._start
+        self._start   = None
+
+        if self._name:
+            self._registry.record(self._name, self._elapsed)
+
+        return self._elapsed
+
+    #
+    ## @brief Get elapsed time.
+    #
+    #  Time elapsed so far is returned if the stopwatch is running.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Elapsed time in nanoseconds.
+    def elapsedNs(self):
+
+        if self._start is not None:
+            return perfCounterNs() - self._start
+
+        return self._elapsed
+
+    #
+    ## @brief Get elapsed time in seconds.
+    #
+    #  @exception N/A
+    #
+    #  @return float - Elapsed time in seconds.
+    def elapsed(self):
+
+        return self.elapsedNs() / 1000000000.0
+
+#
+## @brief [ ENUM CLASS ] - Stamp formats produced by this module.
+class StampFormat(mCore.enumAbs.Enum):
+
+    ## [ str ] - "YYYY.MM.DD_HH.MM.SS" format, see getDateTimeForFileSystem.
+    kFileSystem = 'fileSystem'
+
+    ## [ str ] - "YYYY.MM.DD - HH:MM:SS" format, see getDateTimeStamp.
+    kDateTime   = 'dateTime'
+
+    ## [ str ] - "YYYY.MM.DD" format, see getDateStamp.
+    kDate       = 'date'
+
+    ## [ str ] - "HH:MM:SS" format, see getTimeStamp.
+    kTime       = 'time'
+
+## [ dict ] - Stamp formats as keys, templates and (field index, start, width) tuples of the fields as values.
+#
+#  Field indices are 0 for year, 1 for month, 2 for day, 3 for hour, 4 for minute and 5 for second.
+_STAMP_LAYOUTS = {StampFormat.kFileSystem : ('0000.00.00_00.00.00'  , ((0, 0, 4), (1, 5, 2), (2, 8, 2), (3, 11, 2), (4, 14, 2), (5, 17, 2))),
+                  StampFormat.kDateTime   : ('0000.00.00 - 00:00:00', ((0, 0, 4), (1, 5, 2), (2, 8, 2), (3, 13, 2), (4, 16, 2), (5, 19, 2))),
+                  StampFormat.kDate       : ('0000.00.00'           , ((0, 0, 4), (1, 5, 2), (2, 8, 2))),
+                  StampFormat.kTime       : ('00:00:00'             , ((3, 0, 2), (4, 3, 2), (5, 6, 2)))}
+
+## [ int ] - Size of the buckets in seconds, which UTC offsets are cached for.
+_UTC_OFFSET_BUCKET = 900
+
+## [ tuple of str ] - Two digit strings from 00 to 59.
+_TWO_DIGITS = tuple(['%02d' % x for x in range(60)])
+
+## [ dict ] - Translation table, which maps digits to 0 so stamps can be compared with the templates.
+_DIGIT_TO_ZERO = str.maketrans('123456789', '000000000')
+
+## [ tuple of int ] - Exclusive upper limits of the hour, minute and second fields.
+_TIME_FIELD_LIMITS = (24, 60, 60)
+
+#
+## @brief Get the layout of given stamp format.
+#
+#  Template has 0 in place of each digit, such as "0000.00.00" for StampFormat.kDate. Fields are
+#  (field index, start, width) tuples, where field indices are 0 for year, 1 for month, 2 for day,
+#  3 for hour, 4 for minute and 5 for second.
+#
+#  @param stampFormat [ enum | None | in  ] - Any value from mCore.dateTimeLib.StampFormat enum class.
+#
+#  @exception ValueError - If given stamp format is not supported.
+#
+#  @return tuple - Template and field tuples.
+def getStampLayout(stampFormat):
+
+    layout = _STAMP_LAYOUTS.get(stampFormat)
+    if layout is None:
+        raise ValueError('Unsupported stamp format: {}'.format(stampFormat))
+
+    return layout
+
+#
+## @brief Get the number of days since 1970-01-01 for given date of proleptic Gregorian calendar.
+#
+#  Works with ints and NumPy int64 arrays.
+#
+#  @param year  [ int | None | in  ] - Year.
+#  @param month [ int | None | in  ] - Month.
+#  @param day   [ int | None | in  ] - Day.
+#
+#  @exception N/A
+#
+#  @return int - Days.
+def _daysFromCivil(year, month, day):
+
+    march = month <= 2
+    year  = year - march
+    era   = year // 400
+    yoe   = year - era * 400
+    doy   = (153 * (month + 9 - 12 * (1 - march)) + 2) // 5 + day - 1
+    doe   = yoe * 365 + yoe // 4 - yoe // 100 + doy
+
+    return era * 146097 + doe - 719468
+
+#
+## @brief Get whether given date of proleptic Gregorian calendar exists.
+#
+#  Date exists if it doesn't change when it is converted to days and back, months and days out
+#  of range roll over to other dates.
+#
+#  Works with ints and NumPy int64 arrays.
+#
+#  @param year  [ int | None | in  ] - Year.
+#  @param month [ int | None | in  ] - Month.
+#  @param day   [ int | None | in  ] - Day.
+#
+#  @exception N/A
+#
+#  @return bool - Result, NumPy bool array for arrays.
+def _isValidDate(year, month, day):
+
+    civilYear, civilMonth, civilDay = _civilFromDays(_daysFromCivil(year, month, day))
+
+    return (civilYear == year) & (civilMonth == month) & (civilDay == day)
+
+#
+## @brief Get the date of proleptic Gregorian calendar for given number of days since 1970-01-01.
+#
+#  Works with ints and NumPy int64 arrays.
+#
+#  @param days [ int | None | in  ] - Days.
+#
+#  @exception N/A
+#
+#  @return tuple - Year, month and day.
+def _civilFromDays(days):
+
+    days  = days + 719468
+    era   = days // 146097
+    doe   = days - era * 146097
+    yoe   = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy   = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp    = (5 * doy + 2) // 153
+    day   = doy - (153 * mp + 2) // 5 + 1
+    month = mp + 3 - 12 * (mp >= 10)
+
+    return yoe + era * 400 + (month <= 2), month, day
+
+#
+## @brief Get UTC offset of local time for the bucket of given seconds.
+#
+#  @param bucket    [ int  | None | in  ] - Seconds divided by _UTC_OFFSET_BUCKET.
+#  @param wallClock [ bool | None | in  ] - Whether the seconds are local wall clock seconds rather than seconds since the epoch.
+#
+#  @exception N/A
+#
+#  @return int - Offset in seconds, which is added to seconds since the epoch to get wall clock seconds.
+def _getUtcOffset(bucket, wallClock):
+
+    seconds = bucket * _UTC_OFFSET_BUCKET
+
+    if wallClock:
+        return seconds - int(time.mktime(time.gmtime(seconds)[:8] + (-1,)))
+
+    return time.localtime(seconds).tm_gmtoff
+
+#
+## @brief Get UTC offsets of local time for given NumPy array of seconds.
+#
+#  Offsets are computed once for each day, days, which the offset changes in, are computed once for
+#  each bucket.
+#
+#  @param numpy     [ module        | None | in  ] - numpy module.
+#  @param seconds   [ numpy.ndarray | None | in  ] - Seconds.
+#  @param wallClock [ bool          | None | in  ] - Whether the seconds are local wall clock seconds rather than seconds since the epoch.
+#
+#  @exception N/A
+#
+#  @return numpy.ndarray - Offsets in seconds.
+def _getUtcOffsetArray(numpy, seconds, wallClock):
+
+    offsets = numpy.zeros(seconds.shape, dtype=numpy.int64)
+    if not seconds.size:
+        return offsets
+
+    bucketsPerDay   = 86400 // _UTC_OFFSET_BUCKET
+    days, inverse   = numpy.unique(seconds // 86400, return_inverse=True)
+    inverse         = inverse.ravel()
+    dayOffsets      = numpy.empty(days.shape, dtype=numpy.int64)
+    changingDays    = []
+
+    for index, day in enumerate(days.tolist()):
+
+        first = _getUtcOffset(day * bucketsPerDay, wallClock)
+        last  = _getUtcOffset((day + 1) * bucketsPerDay - 1, wallClock)
+
+        dayOffsets[index] = first
+
+        if first != last:
+            changingDays.append(index)
+
+    offsets[:] = dayOffsets[inverse]
+
+    for index in changingDays:
+
+        mask            = inverse == index
+        buckets, bucket = numpy.unique(seconds[mask] // _UTC_OFFSET_BUCKET, return_inverse=True)
+        offsets[mask]   = numpy.array([_getUtcOffset(x, wallClock) for x in buckets.tolist()], dtype=numpy.int64)[bucket.ravel()]
+
+    return offsets
+
+#
+## @brief Import NumPy if given values are a NumPy array.
+#
+#  @param values [ variant | None | in  ] - Values.
+#
+#  @exception N/A
+#
+#  @return module - numpy module.
+#  @return None   - If given values are not a NumPy array.
+def _getNumpy(values):
+
+    if type(values).__module__ != 'numpy':
+        return None
+
+    import numpy
+
+    return numpy
+
+#
+## @brief Format given values as stamps.
+#
+#  Values are seconds since the epoch. If `localTime` is True stamps are in local time like the
+#  stamps produced by the functions of this module, otherwise values are treated as wall clock
+#  seconds, which is the case for NumPy datetime64 values as well.
+#
+#  Lists and other iterables result in a list of str, NumPy int64, float64 and datetime64 arrays
+#  result in a NumPy str array. NumPy arrays are formatted without a Python level loop.
+#
+#  @param values      [ list of int, numpy.ndarray | None                   | in  ] - Values.
+#  @param stampFormat [ enum                       | StampFormat.kFileSystem | in  ] - Any value from mCore.dateTimeLib.StampFormat enum class.
+#  @param localTime   [ bool                       | True                   | in  ] - Format values in local time.
+#
+#  @exception ValueError - If given stamp format is not supported.
+#
+#  @return list of str   - Stamps.
+#  @return numpy.ndarray - Stamps if values are a NumPy array.
+def formatStamps(values, stampFormat=StampFormat.kFileSystem, localTime=True):
+
+    template, fields = getStampLayout(stampFormat)
+
+    numpy = _getNumpy(values)
+    if numpy is not None:
+        return _formatStampArray(numpy, values, template, fields, localTime)
+
+    pattern = template
+    for _, start, width in reversed(fields):
+        pattern = '{}%0{}d{}'.format(pattern[:start], width, pattern[start + width:])
+
+    hasTime     = fields[-1][0] == 5
+    bucketSize  = 60 if hasTime else 86400
+    prefixes    = {}
+    offsets     = {}
+    stamps      = []
+
+    for value in values:
+
+        seconds = int(value // 1)
+
+        if localTime:
+
+            bucket = seconds // _UTC_OFFSET_BUCKET
+            offset = offsets.get(bucket)
+            if offset is None:
+                offset = offsets[bucket] = _getUtcOffset(bucket, False)
+
+            seconds += offset
+
+        # Stamps are formatted once for each minute (or day), only seconds are appended after that
+        bucket = seconds // bucketSize
+        prefix = prefixes.get(bucket)
+
+        if prefix is None:
+
+            utc    = time.gmtime(bucket * bucketSize)
+            parts  = (utc.tm_year, utc.tm_mon, utc.tm_mday, utc.tm_hour, utc.tm_min, 0)
+            prefix = pattern % tuple([parts[x[0]] for x in fields])
+
+            if hasTime:
+                prefix = prefix[:-2]
+
+            prefixes[bucket] = prefix
+
+        stamps.append(prefix + _TWO_DIGITS[seconds % 60] if hasTime else prefix)
+
+    return stamps
+
+#
+## @brief Format given NumPy array as stamps.
+#
+#  @param numpy     [ module        | None | in  ] - numpy module.
+#  @param values    [ numpy.ndarray | None | in  ] - Values.
+#  @param template  [ str           | None | in  ] - Template of the stamp format.
+#  @param fields    [ tuple         | None | in  ] - Field tuples of the stamp format.
+#  @param localTime [ bool          | None | in  ] - Format values in local time.
+#
+#  @exception N/A
+#
+#  @return numpy.ndarray - Stamps.
+def _formatStampArray(numpy, values, template, fields, localTime):
+
+    values = numpy.asarray(values).ravel()
+
+    if values.dtype.kind == 'M':
+        seconds = values.astype('datetime64[s]').astype(numpy.int64)
+    else:
+        seconds = numpy.floor(values).astype(numpy.int64) if values.dtype.kind == 'f' else values.astype(numpy.int64)
+
+        if localTime:
+            seconds = seconds + _getUtcOffsetArray(numpy, seconds, False)
+
+    days, daySeconds  = numpy.divmod(seconds, 86400)
+    year, month, day  = _civilFromDays(days)
+    columns           = (year, month, day, daySeconds // 3600, daySeconds // 60 % 60, daySeconds % 60)
+
+    length = len(template)
+    data   = numpy.empty((seconds.size, length), dtype=numpy.uint8)
+    data[:] = numpy.frombuffer(template.encode('ascii'), dtype=numpy.uint8)
+
+    for index, start, width in fields:
+
+        column = columns[index]
+
+        for position in range(width):
+            data[:, start + width - 1 - position] = column // (10 ** position) % 10 + 48
+
+    return data.view('S{}'.format(length)).ravel().astype('U{}'.format(length))
+
+#
+## @brief Parse given stamps.
+#
+#  Stamps are parsed by their fixed positions. If `localTime` is True stamps are treated as local
+#  time like the stamps produced by the functions of this module and seconds since the epoch are
+#  returned, otherwise wall clock seconds are returned, which can be viewed as NumPy datetime64[s]
+#  values. Stamps of StampFormat.kTime format are parsed as seconds of the day.
+#
+#  Lists and other iterables result in a list of int, NumPy str or bytes arrays result in a NumPy
+#  int64 array. NumPy arrays are parsed without a Python level loop.
+#
+#  @param stamps      [ list of str, numpy.ndarray | None                   | in  ] - Stamps.
+#  @param stampFormat [ enum                       | StampFormat.kFileSystem | in  ] - Any value from mCore.dateTimeLib.StampFormat enum class.
+#  @param localTime   [ bool                       | True                   | in  ] - Treat stamps as local time.
+#
+#  @exception ValueError - If given stamp format is not supported, stamps are not in given format or their dates or times don't exist.
+#
+#  @return list of int   - Seconds.
+#  @return numpy.ndarray - Seconds if stamps are a NumPy array.
+def parseStamps(stamps, stampFormat=StampFormat.kFileSystem, localTime=True):
+
+    template, fields = getStampLayout(stampFormat)
+
+    numpy = _getNumpy(stamps)
+    if numpy is not None:
+        return _parseStampArray(numpy, stamps, template, fields, localTime)
+
+    length      = len(template)
+    hasDate     = fields[0][0] == 0
+    timeFields  = [(start, start + width, (3600, 60, 1)[index - 3], _TIME_FIELD_LIMITS[index - 3]) for index, start, width in fields if index >= 3]
+    localTime   = localTime and hasDate
+    days        = {}
+    offsets     = {}
+    result      = []
+
+    for stamp in stamps:
+
+        if len(stamp) != length or stamp.translate(_DIGIT_TO_ZERO) != template:
+            raise ValueError('Stamp is not in {} format: {}'.format(template, stamp))
+
+        seconds = 0
+
+        if hasDate:
+
+            # Seconds of the dates are cached, stamps in a directory usually share a few dates
+            datePart = stamp[:10]
+            seconds  = days.get(datePart)
+
+            if seconds is None:
+
+                year, month, day = int(stamp[0:4]), int(stamp[5:7]), int(stamp[8:10])
+                if not _isValidDate(year, month, day):
+                    raise ValueError('Stamp is not a valid date: {}'.format(stamp))
+
+                seconds = days[datePart] = _daysFromCivil(year, month, day) * 86400
+
+        for start, end, multiplier, limit in timeFields:
+
+            value = int(stamp[start:end])
+            if value >= limit:
+                raise ValueError('Stamp is not a valid time: {}'.format(stamp))
+
+            seconds += value * multiplier
+
+        if localTime:
+
+            bucket = seconds // _UTC_OFFSET_BUCKET
+            offset = offsets.get(bucket)
+            if offset is None:
+                offset = offsets[bucket] = _getUtcOffset(bucket, True)
+
+            seconds -= offset
+
+        result.append(seconds)
+
+    return result
+
+#
+## @brief Parse given NumPy array of stamps.
+#
+#  @param numpy     [ module        | None | in  ] - numpy module.
+#  @param stamps    [ numpy.ndarray | None | in  ] - Stamps.
+#  @param template  [ str           | None | in  ] - Template of the stamp format.
+#  @param fields    [ tuple         | None | in  ] - Field tuples of the stamp format.
+#  @param localTime [ bool          | None | in  ] - Treat stamps as local time.
+#
+#  @exception ValueError - If stamps are not in given format or their dates or times don't exist.
+#
+#  @return numpy.ndarray - Seconds.
+def _parseStampArray(numpy, stamps, template, fields, localTime):
+
+    length = len(template)
+    stamps = numpy.asarray(stamps).ravel()
+
+    if stamps.dtype.kind not in 'SU' or stamps.dtype.itemsize // (4 if stamps.dtype.kind == 'U' else 1) != length:
+        raise ValueError('Stamps are not in {} format'.format(template))
+
+    try:
+        data = stamps.astype('S{}'.format(length)).view(numpy.uint8).reshape(-1, length)
+    except UnicodeEncodeError:
+        _raiseInvalidStamp(numpy, stamps, [any([ord(x) > 127 for x in stamp]) for stamp in stamps], 'Stamp is not in {} format'.format(template))
+
+    separators = [index for index, character in enumerate(template) if character != '0']
+    invalid    = (data[:, separators] != numpy.frombuffer(template.encode('ascii'), dtype=numpy.uint8)[separators]).any(axis=1)
+
+    # Characters other than digits wrap around and become greater than 9
+    digits  = data - numpy.uint8(48)
+    invalid = invalid | (digits[:, [index for index, character in enumerate(template) if character == '0']] > 9).any(axis=1)
+
+    if invalid.any():
+        _raiseInvalidStamp(numpy, stamps, invalid, 'Stamp is not in {} format'.format(template))
+
+    columns = [0, 1, 1, 0, 0, 0]
+
+    for index, start, width in fields:
+
+        column = numpy.zeros(digits.shape[0], dtype=numpy.int64)
+
+        for position in range(start, start + width):
+            column *= 10
+            column += digits[:, position]
+
+        columns[index] = column
+
+    invalid = numpy.zeros(digits.shape[0], dtype=bool)
+    for index in range(3, 6):
+        invalid |= columns[index] >= _TIME_FIELD_LIMITS[index - 3]
+
+    if invalid.any():
+        _raiseInvalidStamp(numpy, stamps, invalid, 'Stamp is not a valid time')
+
+    seconds = columns[3] * 3600 + columns[4] * 60 + columns[5]
+
+    if fields[0][0] == 0:
+
+        invalid = ~_isValidDate(columns[0], columns[1], columns[2])
+        if invalid.any():
+            _raiseInvalidStamp(numpy, stamps, invalid, 'Stamp is not a valid date')
+
+        seconds = seconds + _daysFromCivil(columns[0], columns[1], columns[2]) * 86400
+
+        if localTime:
+            seconds = seconds - _getUtcOffsetArray(numpy, seconds, True)
+
+    return numpy.asarray(seconds, dtype=numpy.int64)
+
+#
+## @brief Raise an error for the first invalid stamp of given NumPy array.
+#
+#  @param numpy   [ module        | None | in  ] - numpy module.
+#  @param stamps  [ numpy.ndarray | None | in  ] - Stamps.
+#  @param invalid [ list of bool  | None | in  ] - Whether each stamp is invalid.
+#  @param message [ str           | None | in  ] - Message, which the stamp is appended to.
+#
+#  @exception ValueError - Always.
+#
+#  @return None - None.
+def _raiseInvalidStamp(numpy, stamps, invalid, message):
+
+    stamp = stamps[numpy.flatnonzero(invalid)[0]]
+    if isinstance(stamp, bytes):
+        stamp = stamp.decode('ascii', 'replace')
+
+    raise ValueError('{}: {}'.format(message, stamp))
+
+#
+## [ function ] - Current time in nanoseconds since the epoch.
+_timeNs = getattr(time, 'time_ns', lambda: int(time.time() * 1000000000))
+
+## [ threading.Lock ] - Lock for counter files, file locks are held by processes and don't exclude threads of the same process.
+_SEQUENCE_FILE_LOCK = threading.Lock()
+
+## [ tuple of str ] - Host local directories shared by all users for the counter file in order of preference, temp directory is used if none of them is writable.
+_SEQUENCE_DIRECTORIES = ('/dev/shm', '/var/tmp')
+
+## [ str ] - Name of the counter file shared by all users of a host.
+_SEQUENCE_FILE_NAME = 'mCore.dateTimeLib.sequence'
+
+#
+## @brief Get absolute path of the counter file shared by all users of the host.
+#
+#  @exception N/A
+#
+#  @return str - Absolute path.
+def _getSequenceFilePath():
+
+    for directory in _SEQUENCE_DIRECTORIES:
+        if os.path.isdir(directory) and os.access(directory, os.W_OK):
+            return os.path.join(directory, _SEQUENCE_FILE_NAME)
+
+    return os.path.join(tempfile.gettempdir(), _SEQUENCE_FILE_NAME)
+
+#
+## @brief [ CLASS ] - Class to generate time stamped names, which are unique across processes of a host.
+#
+#  Names consist of `prefix`, the stamp in "YYYY.MM.DD_HH.MM.SS" format, microseconds, a sequence
+#  number and `suffix`, therefore names sort lexicographically in the same order as the stamps
+#  produced by getDateTimeForFileSystem.
+#
+#  Sequence numbers are shared by the processes of all users of a host through a world writable
+#  counter file in a host local directory, such as /dev/shm, so the file lock isn't held on a
+#  network file system. Each process reserves a block of `blockSize`
+#  sequence numbers under a file lock at once, so the file is locked once for each block rather
+#  than once for each name. A counter file with invalid content is restarted from 0.
+#
+#  @code
+#import mCore.dateTimeLib
+#
+#generator = mCore.dateTimeLib.StampNameGenerator(prefix='render_', suffix='.exr')
+#
+#generator.generate()
+# #render_2013.05.20_19.32.22.123456_000000001024.exr
+#
+#generator.generate()
+# #render_2013.05.20_19.32.22.123461_000000001025.exr
+#  @endcode
+class StampNameGenerator(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC STATIC MEMBERS
+    # ------------------------------------------------------------------------------------------------
+    ## [ int ] - Number of digits of the sequence numbers.
+    SEQUENCE_WIDTH = 12
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param prefix           [ str | ''   | in  ] - Prefix of the names.
+    #  @param suffix           [ str | ''   | in  ] - Suffix of the names, such as file extension.
+    #  @param sequenceFilePath [ str | None | in  ] - Absolute path of the counter file, the file shared by all users of the host is used if not provided.
+    #  @param blockSize        [ int | 1024 | in  ] - Number of sequence numbers reserved at once.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, prefix='', suffix='', sequenceFilePath=None, blockSize=1024):
+
+        if not sequenceFilePath:
+            sequenceFilePath = _getSequenceFilePath()
+
+        ## [ str ] - Prefix of the names.
+        self._prefix            = prefix
+
+        ## [ str ] - Suffix of the names.
+        self._suffix            = suffix
+
+        ## [ str ] - Absolute path of the counter file.
+        self._sequenceFilePath  = sequenceFilePath
+
+        ## [ int ] - Number of sequence numbers reserved at once.
+        self._blockSize         = max(blockSize, 1)
+
+        ## [ int ] - Next sequence number of the reserved block.
+        self._next              = 0
+
+        ## [ int ] - End of the reserved block.
+        self._end               = 0
+
+        ## [ int ] - Id of the process, which reserved the block.
+        self._pid               = None
+
+        ## [ threading.Lock ] - Lock for the reserved block.
+        self._lock              = threading.Lock()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Reserve a block of sequence numbers from the counter file.
+    #
+    #  @exception OSError - If the counter file can't be opened.
+    #
+    #  @return int - First sequence number of the block.
+    def _reserve(self):
+
+        with _SEQUENCE_FILE_LOCK:
+            return self._reserveFromFile()
+
+    #
+    ## @brief Reserve a block of sequence numbers from the counter file under a file lock.
+    #
+    #  @exception OSError - If the counter file can't be opened.
+    #
+    #  @return int - First sequence number of the block.
+    def _reserveFromFile(self):
+
+        descriptor = StampNameGenerator._open(self._sequenceFilePath)
+
+        try:
+
+            StampNameGenerator._lock(descriptor)
+
+            try:
+                os.lseek(descriptor, 0, os.SEEK_SET)
+                data = os.read(descriptor, 32).strip()
+
+                try:
+                    start = int(data) if data else 0
+                except ValueError:
+                    start = 0
+                    os.ftruncate(descriptor, 0)
+
+                # Fixed width, therefore the file never needs to be truncated
+                os.lseek(descriptor, 0, os.SEEK_SET)
+                os.write(descriptor, '{:020d}'.format(start + self._blockSize).encode('ascii'))
+
+            finally:
+                StampNameGenerator._unlock(descriptor)
+
+        finally:
+            os.close(descriptor)
+
+        return start
+
+    #
+    ## @brief Open given counter file, create it writable by all users if it doesn't exist.
+    #
+    #  Existing file is opened without O_CREAT, which is refused for files of other users in sticky
+    #  directories, such as /var/tmp, on hosts protecting regular files.
+    #
+    #  @param filePath [ str | None | in  ] - Absolute path of the counter file.
+    #
+    #  @exception OSError - If the counter file can't be opened.
+    #
+    #  @return int - File descriptor.
+    @staticmethod
+    def _open(filePath):
+
+        try:
+            return os.open(filePath, os.O_RDWR)
+        except FileNotFoundError:
+            pass
+
+        directory = os.path.dirname(filePath)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        try:
+            descriptor = os.open(filePath, os.O_RDWR | os.O_CREAT | os.O_EXCL, 0o666)
+        except FileExistsError:
+            return os.open(filePath, os.O_RDWR)
+
+        # Mode given to os.open is masked by umask of the process
+        if hasattr(os, 'fchmod'):
+            os.fchmod(descriptor, 0o666)
+
+        return descriptor
+
+    #
+    ## @brief Lock given file descriptor exclusively.
+    #
+    #  @param descriptor [ int | None | in  ] - File descriptor.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    @staticmethod
+    def _lock(descriptor):
+
+        if fcntl:
+            fcntl.lockf(descriptor, fcntl.LOCK_EX)
+
+        elif msvcrt:
+            os.lseek(descriptor, 0, os.SEEK_SET)
+            msvcrt.locking(descriptor, msvcrt.LK_LOCK, 1)
+
+    #
+    ## @brief Unlock given file descriptor.
+    #
+    #  @param descriptor [ int | None | in  ] - File descriptor.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    @staticmethod
+    def _unlock(descriptor):
+
+        if fcntl:
+            fcntl.lockf(descriptor, fcntl.LOCK_UN)
+
+        elif msvcrt:
+            os.lseek(descriptor, 0, os.SEEK_SET)
+            msvcrt.locking(descriptor, msvcrt.LK_UNLCK, 1)
+
+    #
+    ## @brief Get next sequence number.
+    #
+    #  Reserved block is discarded in forked processes.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Sequence number.
+    def _nextSequence(self):
+
+        with self._lock:
+
+            pid = os.getpid()
+
+            if self._next >= self._end or self._pid != pid:
+                self._next = self._reserve()
+                self._end  = self._next + self._blockSize
+                self._pid  = pid
+
+            sequence    = self._next
+            self._next += 1
+
+        return sequence
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Generate a name.
+    #
+    #  @exception OSError - If the counter file can't be opened.
+    #
+    #  @return str - Name.
+    def generate(self):
+
+        sequence                = self._nextSequence()
+        second, nanoseconds     = divmod(_timeNs(), 1000000000)
+
+        return '{}{}.{:06d}_{:0{width}d}{}'.format(self._prefix,
+                                                   _TIME_STAMP._current(second).dateTimeForFileSystem,
+                                                   nanoseconds // 1000,
+                                                   sequence % 10 ** StampNameGenerator.SEQUENCE_WIDTH,
+                                                   self._suffix,
+                                                   width=StampNameGenerator.SEQUENCE_WIDTH)
+
+    #
+    ## @brief Generate given number of names.
+    #
+    #  @param count [ int | None | in  ] - Number of names.
+    #
+    #  @exception OSError - If the counter file can't be opened.
+    #
+    #  @return list of str - Names.
+    def generateMany(self, count):
 
-    return str('{}.{}.{} - {}:{}:{}').format(date[0], date[1], date[2], time[0], time[1], time[2])
+        return [self.generate() for _ in range(count)]
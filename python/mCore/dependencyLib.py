@@ -0,0 +1,475 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/dependencyLib.py @brief [ FILE   ] - Package dependency graph.
+## @package mCore.dependencyLib    @brief [ MODULE ] - Package dependency graph.
+#
+# @code
+#
+#import mCore.dependencyLib
+#
+#graph = mCore.dependencyLib.DependencyGraph({'mAsset'     : ['mCore', 'mFileSystem'],
+#                                             'mFileSystem': ['mCore'],
+#                                             'mCore'      : []})
+#
+#graph.loadOrder(['mAsset'])
+# #['mCore', 'mFileSystem', 'mAsset']
+#
+#graph.closure('mAsset')
+# #frozenset({'mCore', 'mFileSystem'})
+#
+# @endcode
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ EXCEPTION CLASS ] - Raised if packages depend on each other cyclically.
+class CyclicDependencyError(ValueError):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param cycle [ list of str | None | in  ] - Names of the packages in the cycle, first one is repeated at the end.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, cycle):
+
+        ValueError.__init__(self, 'Cyclic dependency: {}'.format(' -> '.join(cycle)))
+
+        ## [ list of str ] - Names of the packages in the cycle, first one is repeated at the end.
+        self.cycle = cycle
+
+#
+## @brief [ CLASS ] - Graph of packages and the packages they depend on.
+#
+#  Load order is computed by a depth first search in O(V+E), transitive dependencies of packages
+#  are memoized. Updating a package invalidates memoized results only for the packages depending on
+#  it. Dependencies, which aren't in the graph, are skipped by load orders and closures and reported
+#  by missingPackages method.
+class DependencyGraph(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param dependencies [ dict | None | in  ] - Package names as keys and list of names of the packages they depend on as values.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, dependencies=None):
+
+        ## [ dict ] - Package names as keys and tuple of names of the packages they depend on as values.
+        self._dependencies  = {}
+
+        ## [ dict ] - Package names as keys and set of names of the packages depending on them as values.
+        self._dependents    = {}
+
+        ## [ dict ] - Package names as keys and frozenset of their transitive dependencies as values.
+        self._closures      = {}
+
+        ## [ list of str ] - Load order of all the packages.
+        self._order         = None
+
+        for name, packageDependencies in (dependencies or {}).items():
+            self.setDependencies(name, packageDependencies)
+
+    #
+    ## @brief Get whether given package is in the graph.
+    #
+    #  @param name [ str | None | in  ] - Name of the package.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def __contains__(self, name):
+
+        return name in self._dependencies
+
+    #
+    ## @brief Get the number of packages in the graph.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Number of packages.
+    def __len__(self):
+
+        return len(self._dependencies)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Remove memoized results of given package and the packages depending on it.
+    #
+    #  @param name [ str | None | in  ] - Name of the package.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _invalidate(self, name):
+
+        self._order = None
+
+        pending = [name]
+        visited = set(pending)
+
+        while pending:
+
+            current = pending.pop()
+
+            self._closures.pop(current, None)
+
+            for dependent in self._dependents.get(current, ()):
+                if dependent not in visited:
+                    visited.add(dependent)
+                    pending.append(dependent)
+
+    #
+    ## @brief Get load order of given packages and their dependencies.
+    #
+    #  Iterative depth first search, each package and dependency is visited once.
+    #
+    #  @param names [ list of str | None | in  ] - Names of the packages.
+    #
+    #  @exception mCore.dependencyLib.CyclicDependencyError - If packages depend on each other cyclically.
+    #
+    #  @return list of str - Names of the packages, dependencies come before the packages depending on them.
+    def _sort(self, names):
+
+        dependencies    = self._dependencies
+        order           = []
+        states          = {}
+
+        for root in names:
+
+            if root in states:
+                continue
+
+            states[root] = False
+            stack        = [(root, iter(dependencies[root]))]
+
+            while stack:
+
+                node, iterator = stack[-1]
+
+                for dependency in iterator:
+
+                    if dependency not in dependencies:
+                        continue
+
+                    state = states.get(dependency)
+
+                    if state is None:
+                        states[dependency] = False
+                        stack.append((dependency, iter(dependencies[dependency])))
+                        break
+
+                    # Package is on the stack of the search
+                    if state is False:
+                        path = [x[0] for x in stack]
+                        raise CyclicDependencyError(path[path.index(dependency):] + [dependency])
+
+                else:
+                    stack.pop()
+                    states[node] = True
+                    order.append(node)
+
+        return order
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Set dependencies of given package, package is added to the graph if it isn't in it.
+    #
+    #  @param name         [ str         | None | in  ] - Name of the package.
+    #  @param dependencies [ list of str | None | in  ] - Names of the packages, which the package depends on.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether the graph is changed.
+    def setDependencies(self, name, dependencies):
+
+        dependencies = tuple(dict.fromkeys(dependencies or ()))
+        previous     = self._dependencies.get(name)
+
+        if previous == dependencies:
+            return False
+
+        for dependency in previous or ():
+            self._dependents[dependency].discard(name)
+
+        for dependency in dependencies:
+            self._dependents.setdefault(dependency, set()).add(name)
+
+        self._dependencies[name] = dependencies
+
+        self._invalidate(name)
+
+        return True
+
+    #
+    ## @brief Remove given package from the graph.
+    #
+    #  Packages depending on it keep their dependency, which then becomes a missing package.
+    #
+    #  @param name [ str | None | in  ] - Name of the package.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether the package was in the graph.
+    def removePackage(self, name):
+
+        dependencies = self._dependencies.pop(name, None)
+        if dependencies is None:
+            return False
+
+        for dependency in dependencies:
+            self._dependents[dependency].discard(name)
+
+        self._invalidate(name)
+
+        return True
+
+    #
+    ## @brief Get direct dependencies of given package.
+    #
+    #  @param name [ str | None | in  ] - Name of the package.
+    #
+    #  @exception KeyError - If the package isn't in the graph.
+    #
+    #  @return list of str - Names of the packages.
+    def dependencies(self, name):
+
+        return list(self._dependencies[name])
+
+    #
+    ## @brief Get packages directly depending on given package.
+    #
+    #  @param name [ str | None | in  ] - Name of the package.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Names of the packages.
+    def dependents(self, name):
+
+        return sorted(self._dependents.get(name, ()))
+
+    #
+    ## @brief Get transitive dependencies of given package.
+    #
+    #  @param name [ str | None | in  ] - Name of the package.
+    #
+    #  @exception KeyError - If the package isn't in the graph.
+    #
+    #  @return frozenset of str - Names of the packages, missing packages aren't included.
+    def closure(self, name):
+
+        closure = self._closures.get(name)
+        if closure is not None:
+            return closure
+
+        if name not in self._dependencies:
+            raise KeyError(name)
+
+        closures        = self._closures
+        dependencies    = self._dependencies
+        items           = set()
+        pending         = [name]
+
+        while pending:
+
+            for dependency in dependencies[pending.pop()]:
+
+                if dependency in items or dependency not in dependencies:
+                    continue
+
+                items.add(dependency)
+
+                # Memoized closures cut the search short
+                memoized = closures.get(dependency)
+                if memoized is None:
+                    pending.append(dependency)
+                else:
+                    items.update(memoized)
+
+        items.discard(name)
+
+        closure = closures[name] = frozenset(items)
+
+        return closure
+
+    #
+    ## @brief Get load order of given packages.
+    #
+    #  @param names [ list of str | None | in  ] - Names of the packages, all the packages are used if not provided.
+    #
+    #  @exception ValueError                                - If a package isn't in the graph.
+    #  @exception mCore.dependencyLib.CyclicDependencyError - If packages depend on each other cyclically.
+    #
+    #  @return list of str - Names of the packages and their dependencies, dependencies come before the packages depending on them.
+    def loadOrder(self, names=None):
+
+        if names is None:
+
+            if self._order is None:
+                self._order = self._sort(sorted(self._dependencies))
+
+            return list(self._order)
+
+        for name in names:
+            if name not in self._dependencies:
+                raise ValueError('Package {} is not in the graph'.format(name))
+
+        return self._sort(names)
+
+    #
+    ## @brief Find cycles in the graph.
+    #
+    #  Strongly connected components are found by Tarjan's algorithm in O(V+E), a cycle is reported for
+    #  each component.
+    #
+    #  @exception N/A
+    #
+    #  @return list of list of str - Cycles, first package of each cycle is repeated at the end.
+    def findCycles(self):
+
+        dependencies    = self._dependencies
+        indices         = {}
+        lowLinks        = {}
+        onStack         = set()
+        componentStack  = []
+        components      = []
+
+        for root in sorted(dependencies):
+
+            if root in indices:
+                continue
+
+            indices[root] = lowLinks[root] = len(indices)
+            componentStack.append(root)
+            onStack.add(root)
+
+            stack = [(root, iter(dependencies[root]))]
+
+            while stack:
+
+                node, iterator = stack[-1]
+
+                for dependency in iterator:
+
+                    if dependency not in dependencies:
+                        continue
+
+                    if dependency not in indices:
+                        indices[dependency] = lowLinks[dependency] = len(indices)
+                        componentStack.append(dependency)
+                        onStack.add(dependency)
+                        stack.append((dependency, iter(dependencies[dependency])))
+                        break
+
+                    if dependency in onStack:
+                        lowLinks[node] = min(lowLinks[node], indices[dependency])
+
+                else:
+                    stack.pop()
+
+                    if stack:
+                        parent = stack[-1][0]
+                        lowLinks[parent] = min(lowLinks[parent], lowLinks[node])
+
+                    if lowLinks[node] == indices[node]:
+
+                        component = set()
+
+                        while True:
+                            item = componentStack.pop()
+                            onStack.discard(item)
+                            component.add(item)
+                            if item == node:
+                                break
+
+                        if len(component) > 1 or node in dependencies[node]:
+                            components.append(component)
+
+        cycles = []
+
+        for component in components:
+
+            # Walk the component from its first package until a package is visited twice
+            start = min(component)
+            path  = [start]
+            seen  = {start: 0}
+
+            while True:
+                node = [x for x in dependencies[path[-1]] if x in component][0]
+                if node in seen:
+                    cycles.append(path[seen[node]:] + [node])
+                    break
+                seen[node] = len(path)
+                path.append(node)
+
+        return cycles
+
+    #
+    ## @brief Get dependencies, which aren't in the graph.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Names of the missing packages as keys and sorted list of names of the packages depending on them as values.
+    def missingPackages(self):
+
+        return dict([(x, sorted(y)) for x, y in self._dependents.items() if y and x not in self._dependencies])
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # CLASS METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create a graph of the packages in given registry.
+    #
+    #  @param cls      [ object                                   | None | in  ] - Class object.
+    #  @param registry [ mCore.packageRegistryLib.PackageRegistry | None | in  ] - Package registry.
+    #
+    #  @exception N/A
+    #
+    #  @return mCore.dependencyLib.DependencyGraph - Graph.
+    @classmethod
+    def fromRegistry(cls, registry):
+
+        return cls(dict([(x.name(), x.dependentPackages()) for x in registry.packages()]))
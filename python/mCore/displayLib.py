@@ -25,7 +25,14 @@
 # ----------------------------------------------------------------------------------------------------
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
+import abc
+import atexit
+import itertools
+import json
+import os
 import sys
+import threading
+import time
 
 import mCore.enumAbs
 import mCore.platformLib
@@ -156,9 +163,654 @@ class WindowsColor(mCore.enumAbs.Enum):
     ## [ str ] - Failure color.
     kFailure    = '{}'
 
+#
+## @brief [ ENUM CLASS ] - Message format enum class.
+class Format(mCore.enumAbs.Enum):
+
+    ## [ str ] - Text with color.
+    kColor = 'color'
+
+    ## [ str ] - Text without color.
+    kPlain = 'plain'
+
+    ## [ str ] - JSON object per line.
+    kJson  = 'json'
+
+#
+## @brief [ ENUM CLASS ] - Color mode enum class.
+class ColorMode(mCore.enumAbs.Enum):
+
+    ## [ str ] - Use color only if the output is a TTY and NO_COLOR environment variable is not set.
+    kAuto   = 'auto'
+
+    ## [ str ] - Always use color.
+    kAlways = 'always'
+
+    ## [ str ] - Never use color.
+    kNever  = 'never'
+
+#
+## [ dict ] - Encoded level names.
+_JSON_LEVEL_NAMES = {None: 'null'}
+
+#
+## @brief Encode given data as a JSON object in a single line.
+#
+#  @param level     [ enum   | None | in  ] - Any value from mCore.displayLib.ColorName enum class.
+#  @param timestamp [ float  | None | in  ] - Seconds since the epoch.
+#  @param text      [ object | None | in  ] - Text, converted to str if it isn't.
+#  @param fields    [ dict   | None | in  ] - Additional fields.
+#
+#  @exception N/A
+#
+#  @return str - Line.
+def _encodeJsonLine(level, timestamp, text, fields=None):
+
+    levelName = _JSON_LEVEL_NAMES.get(level)
+    if levelName is None:
+        levelName = _JSON_LEVEL_NAMES[level] = json.dumps('{}{}'.format(level[1:2].lower(), level[2:]))
+
+    if fields:
+        return '{{"level":{},"timestamp":{:.6f},"text":{},"fields":{}}}\n'.format(levelName,
+                                                                                timestamp,
+                                                                                json.dumps(str(text)),
+                                                                                json.dumps(fields, separators=(',', ':'), default=str))
+
+    return '{{"level":{},"timestamp":{:.6f},"text":{}}}\n'.format(levelName, timestamp, json.dumps(str(text)))
+
+#
+## @brief [ CLASS ] - Message displayed through registered sinks.
+#
+#  A message is rendered at most once per format no matter how many sinks use that format.
+class Message(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param text         [ str  | None       | in  ] - Text.
+    #  @param level        [ enum | None       | in  ] - Any value from mCore.displayLib.ColorName enum class.
+    #  @param color        [ str  | None       | in  ] - Text to format the color (like ANSI).
+    #  @param coloredText  [ str  | None       | in  ] - Text with color already applied, `color` is ignored if provided.
+    #  @param startNewLine [ bool | True       | in  ] - Display blank line at the start.
+    #  @param endNewLine   [ bool | True       | in  ] - Display blank line at the end.
+    #  @param out          [ file | sys.stdout | in  ] - sys.stdout or sys.stderr
+    #  @param fields       [ dict | None       | in  ] - Additional fields for structured formats.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, text, level=None, color=None, coloredText=None, startNewLine=True, endNewLine=True, out=None, fields=None):
+
+        ## [ str ] - Text.
+        self._text          = text
+
+        ## [ str ] - Level.
+        self._level         = level
+
+        ## [ str ] - Color.
+        self._color         = color
+
+        ## [ str ] - Text with color.
+        self._coloredText   = coloredText
+
+        ## [ bool ] - Display blank line at the start.
+        self._startNewLine  = startNewLine
+
+        ## [ bool ] - Display blank line at the end.
+        self._endNewLine    = endNewLine
+
+        ## [ file ] - sys.stdout or sys.stderr
+        self._out           = out if out is not None else sys.stdout
+
+        ## [ dict ] - Additional fields.
+        self._fields        = fields
+
+        ## [ float ] - Creation time in seconds since the epoch.
+        self._time          = time.time()
+
+        ## [ dict ] - Rendered text for each format.
+        self._renders       = {}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Text.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Text.
+    def text(self):
+
+        return self._text
+
+    #
+    ## @brief Level.
+    #
+    #  @exception N/A
+    #
+    #  @return enum - Any value from mCore.displayLib.ColorName enum class.
+    #  @return None - If level is not set.
+    def level(self):
+
+        return self._level
+
+    #
+    ## @brief Creation time.
+    #
+    #  @exception N/A
+    #
+    #  @return float - Seconds since the epoch.
+    def time(self):
+
+        return self._time
+
+    #
+    ## @brief Additional fields.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Fields.
+    #  @return None - If fields are not set.
+    def fields(self):
+
+        return self._fields
+
+    #
+    ## @brief File like object the message is meant to be written to.
+    #
+    #  @exception N/A
+    #
+    #  @return file - sys.stdout or sys.stderr
+    def out(self):
+
+        return self._out
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get the name of the level, such as "info" for ColorName.kInfo.
+    #
+    #  @exception N/A
+    #
+    #  @return str  - Name of the level.
+    #  @return None - If level is not set.
+    def levelName(self):
+
+        if not self._level:
+            return None
+
+        return '{}{}'.format(self._level[1:2].lower(), self._level[2:])
+
+    #
+    ## @brief Render the message in given format.
+    #
+    #  Rendered text is cached, therefore each format is rendered only once.
+    #
+    #  @param format [ enum | None | in  ] - Any value from mCore.displayLib.Format enum class.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Rendered text.
+    def render(self, format):
+
+        rendered = self._renders.get(format)
+        if rendered is not None:
+            return rendered
+
+        if format == Format.kJson:
+            rendered = _encodeJsonLine(self._level, self._time, self._text, self._fields)
+
+        else:
+
+            text = self._text
+
+            if format == Format.kColor:
+                if self._coloredText is not None:
+                    text = self._coloredText
+                elif self._color:
+                    text = self._color.format(text)
+
+            rendered = '{}{}{}'.format('\n' if self._startNewLine else '', text, '\n' if self._endNewLine else '')
+
+        self._renders[format] = rendered
+
+        return rendered
+
+#
+## @brief [ ABSTRACT CLASS ] - Abstract class for sinks, which messages are written to.
+#
+#  Rendered messages are kept in a buffer, which is flushed when it holds `bufferSize` messages or
+#  `flushInterval` seconds after the first message is buffered. The latter is done by a timer so
+#  an idle sink doesn't hold on to its buffer.
+class Sink(abc.ABC):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param format        [ enum  | Format.kPlain | in  ] - Any value from mCore.displayLib.Format enum class.
+    #  @param bufferSize    [ int   | 1             | in  ] - Number of messages to buffer before flushing.
+    #  @param flushInterval [ float | None          | in  ] - Seconds to flush the buffer after, regardless of its size.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, format=Format.kPlain, bufferSize=1, flushInterval=None):
+
+        ## [ enum ] - Format.
+        self._format        = format
+
+        ## [ int ] - Number of messages to buffer before flushing.
+        self._bufferSize    = max(bufferSize, 1)
+
+        ## [ float ] - Seconds to flush the buffer after.
+        self._flushInterval = flushInterval
+
+        ## [ list of str ] - Rendered messages.
+        self._buffer        = []
+
+        ## [ threading.Timer ] - Timer to flush the buffer after `flushInterval` seconds.
+        self._timer         = None
+
+        ## [ threading.Lock ] - Lock for the buffer.
+        self._lock          = threading.Lock()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Append given rendered text to the buffer and flush it if needed.
+    #
+    #  Lock must be acquired by the caller.
+    #
+    #  @param text [ str | None | in  ] - Rendered text.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _append(self, text):
+
+        self._buffer.append(text)
+
+        if len(self._buffer) >= self._bufferSize:
+            self._flush()
+
+        elif self._flushInterval is not None and self._timer is None:
+            self._timer        = threading.Timer(self._flushInterval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    #
+    ## @brief Write buffered messages. Lock must be acquired by the caller.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _flush(self):
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if self._buffer:
+            self._write(''.join(self._buffer))
+            self._buffer = []
+
+    #
+    ## @brief Write given text.
+    #
+    #  @param text [ str | None | in  ] - Text.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    @abc.abstractmethod
+    def _write(self, text):
+
+        pass
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Format.
+    #
+    #  @exception N/A
+    #
+    #  @return enum - Any value from mCore.displayLib.Format enum class.
+    def format(self):
+
+        return self._format
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Write given message.
+    #
+    #  @param message [ mCore.displayLib.Message | None | in  ] - Message.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def write(self, message):
+
+        text = message.render(self._format)
+
+        with self._lock:
+            self._append(text)
+
+    #
+    ## @brief Write buffered messages.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def flush(self):
+
+        with self._lock:
+            self._flush()
+
+    #
+    ## @brief Flush and release resources used by the sink.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def close(self):
+
+        self.flush()
+
+#
+## @brief [ CLASS ] - Sink for file like objects such as console.
+#
+#  Messages are written to the stream they are meant to be written to (sys.stdout or sys.stderr)
+#  unless a `stream` is provided.
+class StreamSink(Sink):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param stream        [ file  | None | in  ] - File like object, messages are written to their own stream if not provided.
+    #  @param useColor      [ bool  | True | in  ] - Use color to display the messages, see Display.isColorEnabled.
+    #  @param bufferSize    [ int   | 1    | in  ] - Number of messages to buffer before flushing.
+    #  @param flushInterval [ float | None | in  ] - Seconds to flush the buffer after, regardless of its size.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, stream=None, useColor=True, bufferSize=1, flushInterval=None):
+
+        Sink.__init__(self,
+                      format=Format.kColor if useColor else Format.kPlain,
+                      bufferSize=bufferSize,
+                      flushInterval=flushInterval)
+
+        ## [ file ] - Stream.
+        self._stream       = stream
+
+        ## [ file ] - Stream of the buffered messages.
+        self._bufferStream = stream
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Write given text.
+    #
+    #  @param text [ str | None | in  ] - Text.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _write(self, text):
+
+        self._bufferStream.write(text)
+        self._bufferStream.flush()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Write given message.
+    #
+    #  @param message [ mCore.displayLib.Message | None | in  ] - Message.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def write(self, message):
+
+        stream = self._stream if self._stream else message.out()
+        format = self._format
+
+        if format == Format.kColor and not Display.isColorEnabled(stream):
+            format = Format.kPlain
+
+        text = message.render(format)
+
+        with self._lock:
+
+            if stream is not self._bufferStream:
+                self._flush()
+                self._bufferStream = stream
+
+            self._append(text)
+
+#
+## @brief [ CLASS ] - Sink for files, which are rotated when they reach a given size.
+#
+#  When the file reaches `maxBytes`, it is renamed by adding ".1" suffix to its name and existing
+#  backups are shifted up to `backupCount`. Use Format.kJson to write JSON lines files.
+#
+#  @code
+#import mCore.displayLib
+#
+#mCore.displayLib.Display.addSink(mCore.displayLib.StreamSink())
+#mCore.displayLib.Display.addSink(mCore.displayLib.RotatingFileSink('/tmp/tool.log'))
+#mCore.displayLib.Display.addSink(mCore.displayLib.RotatingFileSink('/tmp/tool.jsonl', format=mCore.displayLib.Format.kJson))
+#
+#mCore.displayLib.Display.displayInfo('Asset has been published.')
+#  @endcode
+class RotatingFileSink(Sink):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param filePath      [ str   | None          | in  ] - Absolute path of the file.
+    #  @param format        [ enum  | Format.kPlain | in  ] - Any value from mCore.displayLib.Format enum class.
+    #  @param maxBytes      [ int   | 10485760      | in  ] - Size of the file to rotate it at, 0 disables the rotation.
+    #  @param backupCount   [ int   | 5             | in  ] - Number of rotated files to keep.
+    #  @param bufferSize    [ int   | 100           | in  ] - Number of messages to buffer before flushing.
+    #  @param flushInterval [ float | 1.0           | in  ] - Seconds to flush the buffer after, regardless of its size.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, filePath, format=Format.kPlain, maxBytes=10485760, backupCount=5, bufferSize=100, flushInterval=1.0):
+
+        Sink.__init__(self, format=format, bufferSize=bufferSize, flushInterval=flushInterval)
+
+        ## [ str ] - Absolute path of the file.
+        self._filePath    = filePath
+
+        ## [ int ] - Size of the file to rotate it at.
+        self._maxBytes    = maxBytes
+
+        ## [ int ] - Number of rotated files to keep.
+        self._backupCount = backupCount
+
+        ## [ file ] - File object.
+        self._file        = None
+
+        ## [ int ] - Current size of the file.
+        self._size        = 0
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Open the file in append mode.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _open(self):
+
+        directory = os.path.dirname(self._filePath)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        self._file = open(self._filePath, 'ab')
+        self._size = self._file.seek(0, os.SEEK_END)
+
+    #
+    ## @brief Rotate the file.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _rotate(self):
+
+        self._file.close()
+        self._file = None
+
+        if self._backupCount > 0:
+
+            for index in range(self._backupCount - 1, 0, -1):
+
+                source = '{}.{}'.format(self._filePath, index)
+                if os.path.isfile(source):
+                    os.replace(source, '{}.{}'.format(self._filePath, index + 1))
+
+            os.replace(self._filePath, '{}.1'.format(self._filePath))
+
+        else:
+            os.remove(self._filePath)
+
+        self._open()
+
+    #
+    ## @brief Write given text.
+    #
+    #  @param text [ str | None | in  ] - Text.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _write(self, text):
+
+        data = text.encode('utf-8')
+
+        if self._file is None:
+            self._open()
+
+        if self._maxBytes and self._size and self._size + len(data) > self._maxBytes:
+            self._rotate()
+
+        self._file.write(data)
+        self._file.flush()
+
+        self._size += len(data)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Absolute path of the file.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the file.
+    def filePath(self):
+
+        return self._filePath
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Flush and close the file.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def close(self):
+
+        with self._lock:
+
+            self._flush()
+
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
 #
 ## @brief Display class.
 class Display(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE STATIC MEMBERS
+    # ------------------------------------------------------------------------------------------------
+    ## [ tuple of mCore.displayLib.Sink ] - Registered sinks, the tuple is replaced rather than modified.
+    _sinks          = ()
+
+    ## [ threading.Lock ] - Lock to register and unregister sinks.
+    _sinkLock       = threading.Lock()
+
+    ## [ bool ] - Whether sinks are flushed at exit.
+    _flushAtExit    = False
+
+    ## [ enum ] - Output format, any value from mCore.displayLib.Format enum class.
+    _outputFormat   = Format.kColor
+
+    ## [ enum ] - Color mode, any value from mCore.displayLib.ColorMode enum class.
+    _colorMode      = ColorMode.kAuto
+
+    ## [ dict ] - Whether streams are TTY, id of the streams as keys and (stream, bool) tuples as values.
+    _ttyCache       = {}
+
     ## @name DISPLAY
 
     ## @{
@@ -170,18 +822,21 @@ class Display(object):
     #  @param startNewLine [ bool               | True  | in  ] - Display blank line at the start.
     #  @param endNewLine   [ bool               | True  | in  ] - Display blank line at the end.
     #  @param useColor     [ bool               | False | in  ] - Use color to display the text.
+    #  @param fields       [ dict               | None  | in  ] - Additional fields for structured output.
     #
     #  @exception N/A
     #
     #  @return None - None.
     @staticmethod
-    def displayInfo(text, startNewLine=True, endNewLine=True, useColor=True):
+    def displayInfo(text, startNewLine=True, endNewLine=True, useColor=True, fields=None):
 
         Display.display(text=text,
                         startNewLine=startNewLine,
                         endNewLine=endNewLine,
                         useColor=useColor,
                         color=Display.getDisplayColor(ColorName.kInfo),
+                        level=ColorName.kInfo,
+                        fields=fields,
                         out=sys.stdout)
 
     #
@@ -191,18 +846,21 @@ class Display(object):
     #  @param startNewLine [ bool               | True  | in  ] - Display blank line at the start.
     #  @param endNewLine   [ bool               | True  | in  ] - Display blank line at the end.
     #  @param useColor     [ bool               | False | in  ] - Use color to display the text.
+    #  @param fields       [ dict               | None  | in  ] - Additional fields for structured output.
     #
     #  @exception N/A
     #
     #  @return None - None.
     @staticmethod
-    def displaySuccess(text, startNewLine=True, endNewLine=True, useColor=True):
+    def displaySuccess(text, startNewLine=True, endNewLine=True, useColor=True, fields=None):
 
         Display.display(text=text,
                         startNewLine=startNewLine,
                         endNewLine=endNewLine,
                         useColor=useColor,
                         color=Display.getDisplayColor(ColorName.kSuccess),
+                        level=ColorName.kSuccess,
+                        fields=fields,
                         out=sys.stdout)
 
     #
@@ -212,18 +870,21 @@ class Display(object):
     #  @param startNewLine [ bool               | True  | in  ] - Display blank line at the start.
     #  @param endNewLine   [ bool               | True  | in  ] - Display blank line at the end.
     #  @param useColor     [ bool               | False | in  ] - Use color to display the text.
+    #  @param fields       [ dict               | None  | in  ] - Additional fields for structured output.
     #
     #  @exception N/A
     #
     #  @return None - None.
     @staticmethod
-    def displayWarning(text, startNewLine=True, endNewLine=True, useColor=True):
+    def displayWarning(text, startNewLine=True, endNewLine=True, useColor=True, fields=None):
 
         Display.display(text=text,
                         startNewLine=startNewLine,
                         endNewLine=endNewLine,
                         useColor=useColor,
                         color=Display.getDisplayColor(ColorName.kWarning),
+                        level=ColorName.kWarning,
+                        fields=fields,
                         out=sys.stdout)
 
     #
@@ -234,18 +895,21 @@ class Display(object):
     #  @param endNewLine   [ bool               | True  | in  ] - Display blank line at the end.
     #  @param useColor     [ bool               | False | in  ] - Use color to display the text.
     #  @param stdErr       [ bool               | False | in  ] - Whether to use sys.stderr instead of sys.stdout.
+    #  @param fields       [ dict               | None  | in  ] - Additional fields for structured output.
     #
     #  @exception N/A
     #
     #  @return None - None.
     @staticmethod
-    def displayFailure(text, startNewLine=True, endNewLine=True, useColor=True, stdErr=False):
+    def displayFailure(text, startNewLine=True, endNewLine=True, useColor=True, stdErr=False, fields=None):
 
         Display.display(text=text,
                         startNewLine=startNewLine,
                         endNewLine=endNewLine,
                         useColor=useColor,
                         color=Display.getDisplayColor(ColorName.kFailure),
+                        level=ColorName.kFailure,
+                        fields=fields,
                         out=sys.stderr if stdErr else sys.stdout)
 
     #
@@ -257,17 +921,43 @@ class Display(object):
     #  @param useColor     [ bool             | False      | in  ] - Use color to display the text. This argument does nothing if `color` is not provided.
     #  @param color        [ bool             | False      | in  ] - Text to format the color (like ANSI).
     #  @param out          [ file             | sys.stdout | in  ] - sys.stdout or sys.stderr
+    #  @param level        [ enum             | None       | in  ] - Any value from mCore.displayLib.ColorName enum class.
+    #  @param fields       [ dict             | None       | in  ] - Additional fields for structured output.
+    #
+    #  If any sink is registered, the text is written to registered sinks instead of `out`.
+    #  If output format is Format.kJson, the text is written as a JSON object in a single line and
+    #  `startNewLine`, `endNewLine` and color arguments are ignored.
     #
     #  @exception N/A
     #
     #  @return None - None.
     @staticmethod
-    def display(text, startNewLine=True, endNewLine=True, useColor=True, color=None, out=sys.stdout):
+    def display(text, startNewLine=True, endNewLine=True, useColor=True, color=None, out=sys.stdout, level=None, fields=None):
 
         if isinstance(text, (list, tuple)):
             text = ' '.join([str(x) for x in text])
 
-        if useColor and color:
+        sinks = Display._sinks
+        if sinks:
+
+            message = Message(text,
+                              level=level,
+                              color=color if useColor else None,
+                              startNewLine=startNewLine,
+                              endNewLine=endNewLine,
+                              out=out,
+                              fields=fields)
+
+            for sink in sinks:
+                sink.write(message)
+
+            return
+
+        if Display._outputFormat == Format.kJson:
+            out.write(_encodeJsonLine(level, time.time(), text, fields))
+            return
+
+        if useColor and color and Display._outputFormat == Format.kColor and Display.isColorEnabled(out):
             text = color.format(text)
 
         if startNewLine:
@@ -302,7 +992,8 @@ class Display(object):
                         startNewLine=startNewLine,
                         endNewLine=endNewLine,
                         useColor=useColor,
-                        color=Display.getDisplayColor(ColorName.kHeaderLine))
+                        color=Display.getDisplayColor(ColorName.kHeaderLine),
+                        level=ColorName.kHeaderLine)
 
     #
     ## @brief Display header text.
@@ -322,7 +1013,207 @@ class Display(object):
                         startNewLine=startNewLine,
                         endNewLine=endNewLine,
                         useColor=useColor,
-                        color=Display.getDisplayColor(ColorName.kHeaderText))
+                        color=Display.getDisplayColor(ColorName.kHeaderText),
+                        level=ColorName.kHeaderText)
+
+    #
+    ## @}
+
+    ## @name TABLE
+
+    ## @{
+    #
+    ## @brief Display given rows as aligned columns.
+    #
+    #  Column widths are taken from `widths` if provided, otherwise they are computed from the
+    #  header and the first `sampleSize` rows. Rows are consumed lazily and written out in chunks of
+    #  `chunkSize` lines, so memory use doesn't depend on the number of rows.
+    #
+    #  Cells of rows beyond the sample may be wider than their column, they are truncated if
+    #  `truncate` is True, otherwise they are displayed as they are.
+    #
+    #  @code
+    #import mCore.displayLib
+    #
+    #rows = (('asset:soldier', 12, 'ok'), ('asset:sword', 4, 'missing'))
+    #
+    #mCore.displayLib.Display.displayTable(rows,
+    #                                      header=('Name Space', 'Count', 'Status'),
+    #                                      statusColumn=2,
+    #                                      statusColors={'ok'     : mCore.displayLib.ColorName.kSuccess,
+    #                                                    'missing': mCore.displayLib.ColorName.kFailure})
+    # #Name Space     Count  Status
+    # #-------------  -----  -------
+    # #asset:soldier  12     ok
+    # #asset:sword    4      missing
+    #  @endcode
+    #
+    #  @param rows         [ iterable of list, tuple | None       | in  ] - Rows to be displayed.
+    #  @param header       [ list, tuple             | None       | in  ] - Column titles.
+    #  @param widths       [ list of int             | None       | in  ] - Column widths, they are computed from the sampled rows if not provided.
+    #  @param sampleSize   [ int                     | 100        | in  ] - Number of rows to sample to compute the column widths.
+    #  @param chunkSize    [ int                     | 100        | in  ] - Number of rows written at once.
+    #  @param statusColumn [ int                     | None       | in  ] - Index of the column, which will be colored based on its values.
+    #  @param statusColors [ dict                    | None       | in  ] - Cell values as keys and values from mCore.displayLib.ColorName enum class as values.
+    #  @param separator    [ str                     | '  '       | in  ] - Column separator.
+    #  @param truncate     [ bool                    | True       | in  ] - Truncate cells wider than their column.
+    #  @param useColor     [ bool                    | True       | in  ] - Use color to display the header and the status column.
+    #  @param out          [ file                    | sys.stdout | in  ] - sys.stdout or sys.stderr
+    #
+    #  @exception N/A
+    #
+    #  @return int - Number of rows displayed, header is not included.
+    @staticmethod
+    def displayTable(rows,
+                     header=None,
+                     widths=None,
+                     sampleSize=100,
+                     chunkSize=100,
+                     statusColumn=None,
+                     statusColors=None,
+                     separator='  ',
+                     truncate=True,
+                     useColor=True,
+                     out=sys.stdout):
+
+        rows   = iter(rows)
+        sample = []
+
+        if not widths:
+
+            sample = list(itertools.islice(rows, max(sampleSize, 1)))
+
+            widths = [0] * max([len(x) for x in sample] + [len(header) if header else 0])
+
+            for row in itertools.chain([header] if header else [], sample):
+                for index, cell in enumerate(row):
+                    widths[index] = max(widths[index], len(str(cell)))
+
+        if not widths:
+            return 0
+
+        sinks = Display._sinks
+        if not sinks:
+            useColor = useColor and Display._outputFormat == Format.kColor and Display.isColorEnabled(out)
+
+        colors = {}
+        if useColor and statusColumn is not None and statusColors:
+            colors = dict([(value, Display.getDisplayColor(name)) for value, name in statusColors.items()])
+
+        # Sinks need plain lines, colored lines are formatted as well only if color is used
+        plainLines = [] if sinks else None
+        lines      = []
+
+        if header:
+
+            headerColor = Display.getDisplayColor(ColorName.kHeaderText) if useColor else None
+            lineColor   = Display.getDisplayColor(ColorName.kHeaderLine) if useColor else None
+
+            lines.append(Display._formatTableRow(header, widths, separator, truncate, color=headerColor))
+            lines.append(Display._formatTableRow(['-' * x for x in widths], widths, separator, truncate, color=lineColor))
+
+            if sinks:
+                plainLines.append(Display._formatTableRow(header, widths, separator, truncate))
+                plainLines.append(Display._formatTableRow(['-' * x for x in widths], widths, separator, truncate))
+
+        count = 0
+
+        for row in itertools.chain(sample, rows):
+
+            lines.append(Display._formatTableRow(row, widths, separator, truncate, statusColumn=statusColumn, statusColors=colors))
+
+            if sinks:
+                plainLines.append(Display._formatTableRow(row, widths, separator, truncate) if colors else lines[-1])
+
+            count += 1
+
+            if len(lines) >= chunkSize:
+                Display._writeTableLines(lines, plainLines, sinks, out)
+                lines      = []
+                plainLines = [] if sinks else None
+
+        if lines:
+            Display._writeTableLines(lines, plainLines, sinks, out)
+
+        return count
+
+    #
+    ## @brief Write given table lines to `out` or registered sinks.
+    #
+    #  @param lines      [ list of str                     | None | in  ] - Lines, which may contain color.
+    #  @param plainLines [ list of str                     | None | in  ] - Lines without color, required only if sinks are provided.
+    #  @param sinks      [ tuple of mCore.displayLib.Sink | None | in  ] - Registered sinks.
+    #  @param out        [ file                            | None | in  ] - sys.stdout or sys.stderr
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    @staticmethod
+    def _writeTableLines(lines, plainLines, sinks, out):
+
+        if not sinks:
+
+            if Display._outputFormat == Format.kJson:
+                out.write(_encodeJsonLine(None, time.time(), '\n'.join(lines)))
+            else:
+                out.write('{}\n'.format('\n'.join(lines)))
+
+            return
+
+        message = Message('\n'.join(plainLines), coloredText='\n'.join(lines), startNewLine=False, endNewLine=True, out=out)
+
+        for sink in sinks:
+            sink.write(message)
+
+    #
+    ## @brief Format given row as a single line of aligned cells.
+    #
+    #  @param row          [ list, tuple | None | in  ] - Row.
+    #  @param widths       [ list of int | None | in  ] - Column widths.
+    #  @param separator    [ str         | None | in  ] - Column separator.
+    #  @param truncate     [ bool        | None | in  ] - Truncate cells wider than their column.
+    #  @param color        [ str         | None | in  ] - Color to format all the cells of the row.
+    #  @param statusColumn [ int         | None | in  ] - Index of the column, which will be colored based on its values.
+    #  @param statusColors [ dict        | None | in  ] - Cell values as keys and colors as values.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Line.
+    @staticmethod
+    def _formatTableRow(row, widths, separator, truncate, color=None, statusColumn=None, statusColors=None):
+
+        cells     = []
+        lastIndex = len(widths) - 1
+
+        for index, width in enumerate(widths):
+
+            value = row[index] if index < len(row) else ''
+            cell  = str(value)
+
+            if truncate and len(cell) > width:
+                cell = cell[:width]
+
+            if index != lastIndex:
+                cell = cell.ljust(width)
+
+            cellColor = color
+            if index == statusColumn and statusColors:
+
+                # Unhashable values, such as lists, can't be keys of the colors
+                try:
+                    cellColor = statusColors.get(value, cellColor)
+                except TypeError:
+                    pass
+
+            if cellColor:
+                cell = cellColor.format(cell)
+
+            cells.append(cell)
+
+        if not truncate and len(row) > len(widths):
+            cells.extend([str(x) for x in row[len(widths):]])
+
+        return separator.join(cells)
 
     #
     ## @}
@@ -371,6 +1262,179 @@ class Display(object):
 
         out.write('\n' * count)
 
+    ## @name OUTPUT
+
+    ## @{
+    #
+    ## @brief Set output format.
+    #
+    #  Format.kColor displays text with color if color is enabled for the output, Format.kPlain
+    #  displays text without color and Format.kJson displays a JSON object with level, timestamp, text
+    #  and fields keys in a single line for each message. Registered sinks use their own format.
+    #
+    #  @param format [ enum | None | in  ] - Any value from mCore.displayLib.Format enum class.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    @staticmethod
+    def setOutputFormat(format):
+
+        Display._outputFormat = format
+
+    #
+    ## @brief Get output format.
+    #
+    #  @exception N/A
+    #
+    #  @return enum - Any value from mCore.displayLib.Format enum class.
+    @staticmethod
+    def outputFormat():
+
+        return Display._outputFormat
+
+    #
+    ## @brief Set color mode.
+    #
+    #  @param mode [ enum | None | in  ] - Any value from mCore.displayLib.ColorMode enum class.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    @staticmethod
+    def setColorMode(mode):
+
+        Display._colorMode = mode
+
+    #
+    ## @brief Get color mode.
+    #
+    #  @exception N/A
+    #
+    #  @return enum - Any value from mCore.displayLib.ColorMode enum class.
+    @staticmethod
+    def colorMode():
+
+        return Display._colorMode
+
+    #
+    ## @brief Check whether color is enabled for given output.
+    #
+    #  In ColorMode.kAuto mode color is enabled only if `out` is a TTY and NO_COLOR environment
+    #  variable is not set. Result of TTY check is cached for each output.
+    #
+    #  @param out [ file | None | in  ] - sys.stdout or sys.stderr
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    @staticmethod
+    def isColorEnabled(out):
+
+        if Display._colorMode == ColorMode.kAlways:
+            return True
+
+        if Display._colorMode == ColorMode.kNever:
+            return False
+
+        cached = Display._ttyCache.get(id(out))
+        if cached is not None and cached[0] is out:
+            return cached[1]
+
+        try:
+            isTTY = bool(out.isatty()) and not os.environ.get('NO_COLOR')
+        except (AttributeError, ValueError):
+            isTTY = False
+
+        if len(Display._ttyCache) > 16:
+            Display._ttyCache = {}
+
+        Display._ttyCache[id(out)] = (out, isTTY)
+
+        return isTTY
+
+    #
+    ## @}
+
+    ## @name SINKS
+
+    ## @{
+    #
+    ## @brief Register given sink.
+    #
+    #  Once a sink is registered, displayed text is written to registered sinks only, therefore a
+    #  mCore.displayLib.StreamSink should be registered to keep displaying text on console.
+    #  Registered sinks are flushed at exit.
+    #
+    #  @param sink [ mCore.displayLib.Sink | None | in  ] - Sink.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - False if given sink is already registered, True otherwise.
+    @staticmethod
+    def addSink(sink):
+
+        with Display._sinkLock:
+
+            if sink in Display._sinks:
+                return False
+
+            Display._sinks = Display._sinks + (sink,)
+
+            if not Display._flushAtExit:
+                atexit.register(Display.flush)
+                Display._flushAtExit = True
+
+        return True
+
+    #
+    ## @brief Unregister given sink, the sink is closed.
+    #
+    #  @param sink [ mCore.displayLib.Sink | None | in  ] - Sink.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - False if given sink is not registered, True otherwise.
+    @staticmethod
+    def removeSink(sink):
+
+        with Display._sinkLock:
+
+            if sink not in Display._sinks:
+                return False
+
+            Display._sinks = tuple([x for x in Display._sinks if x is not sink])
+
+        sink.close()
+
+        return True
+
+    #
+    ## @brief List registered sinks.
+    #
+    #  @exception N/A
+    #
+    #  @return list of mCore.displayLib.Sink - Sinks.
+    @staticmethod
+    def listSinks():
+
+        return list(Display._sinks)
+
+    #
+    ## @brief Flush registered sinks.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    @staticmethod
+    def flush():
+
+        for sink in Display._sinks:
+            sink.flush()
+
+    #
+    ## @}
+
     #
     ## @brief Get display color string for given `color` based on current platform.
     #
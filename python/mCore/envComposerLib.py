@@ -0,0 +1,564 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/envComposerLib.py @brief [ FILE   ] - Cached environment composition.
+## @package mCore.envComposerLib    @brief [ MODULE ] - Cached environment composition.
+#
+#  setEnvironment functions of packageEnvLib modules are called once, changes each of them makes
+#  in the environment are recorded and kept in a local cache file. Later compositions of the same
+#  packages replay recorded changes without importing packageEnvLib modules.
+#
+# @code
+#
+#import mCore.packageRegistryLib
+#import mCore.envComposerLib
+#
+#registry = mCore.packageRegistryLib.PackageRegistry()
+#composer = mCore.envComposerLib.EnvironmentComposer.fromRegistry(registry, ['mAsset'])
+#
+#composer.compose()
+# #{'cached': True, 'packages': 3, 'initialized': ['mCore', 'mFileSystem', 'mAsset']}
+#
+# @endcode
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import base64
+import hashlib
+import importlib.util
+import json
+import os
+import pickle
+import sys
+import time
+
+import mCore.cacheLib
+import mCore.enumAbs
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ str ] - Name of the package environment module.
+PACKAGE_ENV_FILE_NAME = 'packageEnvLib.py'
+
+## [ str ] - Name of the function of package environment modules.
+SET_ENVIRONMENT_FUNCTION_NAME = 'setEnvironment'
+
+## [ str ] - Name of the cache file in cache directory.
+CACHE_FILE_NAME = 'envComposer.json'
+
+## [ int ] - Version of the cache file.
+_CACHE_FILE_VERSION = 3
+
+## [ int ] - Maximum number of compositions kept in the cache file, least recently used ones are removed.
+_MAX_CACHE_ENTRIES = 16
+
+## [ int ] - Seconds, which modification time of a file may lag behind its changes.
+_MTIME_GRANULARITY = 2
+
+#
+## @brief [ ENUM CLASS ] - Environment change operation enum class.
+class DeltaOperation(mCore.enumAbs.Enum):
+
+    ## [ str ] - Set the variable.
+    kSet        = 'set'
+
+    ## [ str ] - Remove the variable.
+    kUnset      = 'unset'
+
+    ## [ str ] - Add value to the beginning of the variable.
+    kPrepend    = 'prepend'
+
+    ## [ str ] - Add value to the end of the variable.
+    kAppend     = 'append'
+
+#
+## @brief Get changes between given environments.
+#
+#  Changes are relative to the previous value where possible, so they can be replayed on an
+#  environment, which differs from the one they are recorded on.
+#
+#  @param before [ dict | None | in  ] - Environment before the change.
+#  @param after  [ dict | None | in  ] - Environment after the change.
+#
+#  @exception N/A
+#
+#  @return list of list - Name of the variable, value of mCore.envComposerLib.DeltaOperation and value.
+def getEnvironmentDelta(before, after):
+
+    delta = []
+
+    for name in sorted(set(before).union(after)):
+
+        oldValue = before.get(name)
+        newValue = after.get(name)
+
+        if oldValue == newValue:
+            continue
+
+        if newValue is None:
+            delta.append([name, DeltaOperation.kUnset, ''])
+        elif oldValue and newValue.endswith(oldValue):
+            delta.append([name, DeltaOperation.kPrepend, newValue[:-len(oldValue)]])
+        elif oldValue and newValue.startswith(oldValue):
+            delta.append([name, DeltaOperation.kAppend, newValue[len(oldValue):]])
+        else:
+            delta.append([name, DeltaOperation.kSet, newValue])
+
+    return delta
+
+#
+## @brief Apply given changes to given environment.
+#
+#  Path separators at the edge of prepended and appended values are removed if the variable doesn't
+#  exist or is empty.
+#
+#  @param delta       [ list of list | None       | in  ] - Changes returned by mCore.envComposerLib.getEnvironmentDelta function.
+#  @param environment [ dict         | os.environ | in  ] - Environment.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def applyEnvironmentDelta(delta, environment=None):
+
+    if environment is None:
+        environment = os.environ
+
+    for name, operation, value in delta:
+
+        if operation == DeltaOperation.kSet:
+            environment[name] = value
+
+        elif operation == DeltaOperation.kUnset:
+            environment.pop(name, None)
+
+        elif operation == DeltaOperation.kPrepend:
+            current = environment.get(name)
+            environment[name] = value + current if current else value.rstrip(os.pathsep)
+
+        elif operation == DeltaOperation.kAppend:
+            current = environment.get(name)
+            environment[name] = current + value if current else value.lstrip(os.pathsep)
+
+#
+## @brief [ CLASS ] - Records method calls made on an env entry container.
+#
+#  Calls are forwarded to the container and kept in call order, so they can be made again on
+#  another container. Changes made on attributes of the container rather than by calling its
+#  methods aren't recorded.
+class _EnvEntryContainerRecorder(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param container [ mMeco.libs.entryLib.EnvEntryContainer | None | in  ] - Env entry container.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, container):
+
+        ## [ mMeco.libs.entryLib.EnvEntryContainer ] - Env entry container.
+        self._container = container
+
+        ## [ list of tuple ] - Name of the method, positional and keyword arguments of each call.
+        self._calls     = []
+
+    #
+    ## @brief Get attribute of the container, methods are wrapped to record their calls.
+    #
+    #  @param name [ str | None | in  ] - Name of the attribute.
+    #
+    #  @exception AttributeError - If the container doesn't have the attribute.
+    #
+    #  @return object - Attribute.
+    def __getattr__(self, name):
+
+        attribute = getattr(self._container, name)
+        if not callable(attribute):
+            return attribute
+
+        def record(*args, **kwargs):
+
+            self._calls.append((name, args, kwargs))
+
+            return attribute(*args, **kwargs)
+
+        return record
+
+    #
+    ## @brief Iterate the container.
+    #
+    #  @exception N/A
+    #
+    #  @return iterator - Iterator.
+    def __iter__(self):
+
+        return iter(self._container)
+
+    #
+    ## @brief Get length of the container.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Length.
+    def __len__(self):
+
+        return len(self._container)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get recorded calls encoded to be kept in the cache file.
+    #
+    #  Calls are pickled together, so arguments shared between them stay shared when they are replayed.
+    #
+    #  @exception N/A
+    #
+    #  @return str  - Encoded calls, empty string if no call is recorded.
+    #  @return None - If arguments of the calls can't be pickled.
+    def encode(self):
+
+        if not self._calls:
+            return ''
+
+        try:
+            data = pickle.dumps(self._calls, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return None
+
+        return base64.b64encode(data).decode('ascii')
+
+    #
+    ## @brief Make given encoded calls on given container.
+    #
+    #  @param container [ mMeco.libs.entryLib.EnvEntryContainer | None | in  ] - Env entry container.
+    #  @param data      [ str                                   | None | in  ] - Calls returned by encode method.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    @staticmethod
+    def replay(container, data):
+
+        if not data:
+            return
+
+        for name, args, kwargs in pickle.loads(base64.b64decode(data)):
+            getattr(container, name)(*args, **kwargs)
+
+#
+## @brief [ CLASS ] - Composes the environment of given packages.
+#
+#  Cache key of a composition consists of names, versions, order of the packages and modification
+#  time and size of their packageEnvLib modules, so editing a module without changing the version
+#  of its package also calls setEnvironment functions again. Python version and platform are part
+#  of the key as well, since functions may depend on them.
+#
+#  Variables, which functions set rather than prepend or append to, are replayed only if they have
+#  the value they had when the changes were recorded, otherwise setEnvironment functions are called
+#  again. Methods functions call on the env entry container are recorded and called again on the
+#  container provided to the composer, compositions aren't cached if arguments of the calls can't
+#  be pickled.
+class EnvironmentComposer(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param packages          [ list of mCore.packageRegistryLib.PackageInfo | None       | in  ] - Packages in load order.
+    #  @param allLib            [ mMeco.libs.allLib.All                        | None       | in  ] - All libraries passed to setEnvironment functions.
+    #  @param envEntryContainer [ mMeco.libs.entryLib.EnvEntryContainer        | None       | in  ] - Env entry container passed to setEnvironment functions.
+    #  @param environment       [ dict                                         | os.environ | in  ] - Environment setEnvironment functions change.
+    #  @param cacheFilePath     [ str                                          | None       | in  ] - Absolute path of the cache file, a file in cache directory is used if not provided.
+    #  @param useCache          [ bool                                         | True       | in  ] - Whether to read and write the cache file.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, packages, allLib=None, envEntryContainer=None, environment=None, cacheFilePath=None, useCache=True):
+
+        ## [ list of mCore.packageRegistryLib.PackageInfo ] - Packages in load order.
+        self._packages          = list(packages)
+
+        ## [ mMeco.libs.allLib.All ] - All libraries passed to setEnvironment functions.
+        self._allLib            = allLib
+
+        ## [ mMeco.libs.entryLib.EnvEntryContainer ] - Env entry container passed to setEnvironment functions.
+        self._envEntryContainer = envEntryContainer
+
+        ## [ dict ] - Environment setEnvironment functions change.
+        self._environment       = os.environ if environment is None else environment
+
+        ## [ str ] - Absolute path of the cache file.
+        self._cacheFilePath     = None
+
+        if useCache:
+            self._cacheFilePath = cacheFilePath or mCore.cacheLib.getCacheFilePath(CACHE_FILE_NAME)
+
+        ## [ list of dict ] - Recorded changes of the packages, keys of dict instances are: name, initialize, delta, required, entries.
+        self._deltas            = []
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get stamps of the packageEnvLib modules of the packages.
+    #
+    #  @exception N/A
+    #
+    #  @return list of list - Name, version, absolute path of the module, its modification time and size, None values for packages without the module.
+    def _getStamps(self):
+
+        stamps = []
+
+        for info in self._packages:
+
+            filePath = os.path.join(os.path.dirname(info.filePath()), PACKAGE_ENV_FILE_NAME)
+
+            try:
+                stat = os.stat(filePath)
+            except OSError:
+                stamps.append([info.name(), info.version(), None, None, None])
+            else:
+                stamps.append([info.name(), info.version(), filePath, stat.st_mtime_ns, stat.st_size])
+
+        return stamps
+
+    #
+    ## @brief Get cache key of given stamps.
+    #
+    #  @param stamps [ list of list | None | in  ] - Stamps returned by _getStamps method.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Key.
+    def _getKey(self, stamps):
+
+        # Functions may add entries only if they get a container
+        data = json.dumps([list(sys.version_info[:2]), sys.platform, self._envEntryContainer is not None, stamps], separators=(',', ':'))
+
+        return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+    #
+    ## @brief Call setEnvironment function of given package and record its changes.
+    #
+    #  @param info     [ mCore.packageRegistryLib.PackageInfo | None | in  ] - Package.
+    #  @param filePath [ str                                  | None | in  ] - Absolute path of the packageEnvLib module.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are: name, initialize, delta, required, which contains values of the set variables before the call, and entries, which contains encoded calls made on the env entry container.
+    def _runHook(self, info, filePath):
+
+        moduleName  = '{}.packageEnvLib'.format(os.path.basename(os.path.dirname(filePath)))
+        spec        = importlib.util.spec_from_file_location(moduleName, filePath)
+        module      = importlib.util.module_from_spec(spec)
+
+        spec.loader.exec_module(module)
+
+        function = getattr(module, SET_ENVIRONMENT_FUNCTION_NAME, None)
+        if function is None:
+            return {'name': info.name(), 'initialize': True, 'delta': [], 'required': {}, 'entries': ''}
+
+        recorder    = None if self._envEntryContainer is None else _EnvEntryContainerRecorder(self._envEntryContainer)
+        before      = dict(self._environment)
+        initialize  = function(self._allLib, recorder)
+        delta       = getEnvironmentDelta(before, dict(self._environment))
+
+        return {'name'      : info.name(),
+                'initialize': initialize is not False,
+                'delta'     : delta,
+                'required'  : dict([(x[0], before.get(x[0]) or '') for x in delta if x[1] == DeltaOperation.kSet]),
+                'entries'   : '' if recorder is None else recorder.encode()}
+
+    #
+    ## @brief Get whether given recorded changes can be replayed on the environment.
+    #
+    #  Changes are applied to a copy of the environment to check the values of the set variables.
+    #
+    #  @param deltas [ list of dict | None | in  ] - Recorded changes of the packages.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def _canReplay(self, deltas):
+
+        environment = dict(self._environment)
+
+        for item in deltas:
+
+            for name, value in item['required'].items():
+                if (environment.get(name) or '') != value:
+                    return False
+
+            applyEnvironmentDelta(item['delta'], environment)
+
+        return True
+
+    #
+    ## @brief Write given composition into the cache file.
+    #
+    #  @param key    [ str          | None | in  ] - Cache key.
+    #  @param stamps [ list of list | None | in  ] - Stamps returned by _getStamps method.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def _save(self, key, stamps):
+
+        if any([x['entries'] is None for x in self._deltas]):
+            return False
+
+        # Modules modified within the granularity may be modified again without changing the key
+        racyTime = (time.time() - _MTIME_GRANULARITY) * 1000000000
+        if any([x[3] is not None and x[3] >= racyTime for x in stamps]):
+            return False
+
+        data    = mCore.cacheLib.readJsonFile(self._cacheFilePath, {})
+        entries = data.get('entries', {}) if data.get('version') == _CACHE_FILE_VERSION else {}
+
+        entries[key] = {'time': time.time(), 'deltas': self._deltas}
+
+        if len(entries) > _MAX_CACHE_ENTRIES:
+            for oldKey in sorted(entries, key=lambda x: entries[x]['time'])[:len(entries) - _MAX_CACHE_ENTRIES]:
+                del entries[oldKey]
+
+        return mCore.cacheLib.writeJsonFile(self._cacheFilePath, {'version': _CACHE_FILE_VERSION, 'entries': entries})
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Packages in load order.
+    #
+    #  @exception N/A
+    #
+    #  @return list of mCore.packageRegistryLib.PackageInfo - Packages.
+    def packages(self):
+
+        return list(self._packages)
+
+    #
+    ## @brief Recorded changes of the packages from the last composition.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Keys of dict instances are: name, initialize, delta, required, entries.
+    def deltas(self):
+
+        return self._deltas
+
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Compose the environment.
+    #
+    #  Recorded changes are applied to the environment and recorded calls are made on the env entry
+    #  container if the composition is cached and the changes can be replayed on the environment,
+    #  setEnvironment functions are called otherwise.
+    #
+    #  @param force [ bool | False | in  ] - Whether to call setEnvironment functions even if the composition is cached.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Summary with cached, packages and initialized keys, which are whether the composition is replayed, number of packages and names of the packages, which should be initialized.
+    def compose(self, force=False):
+
+        stamps  = self._getStamps()
+        key     = self._getKey(stamps)
+        cached  = False
+
+        if self._cacheFilePath and not force:
+
+            data = mCore.cacheLib.readJsonFile(self._cacheFilePath, {})
+
+            if data.get('version') == _CACHE_FILE_VERSION and key in data.get('entries', {}):
+                deltas = data['entries'][key]['deltas']
+
+                if self._canReplay(deltas):
+                    self._deltas    = deltas
+                    cached          = True
+
+        if cached:
+            for item in self._deltas:
+                applyEnvironmentDelta(item['delta'], self._environment)
+                _EnvEntryContainerRecorder.replay(self._envEntryContainer, item['entries'])
+
+        else:
+            self._deltas = []
+
+            for info, stamp in zip(self._packages, stamps):
+                if stamp[2] is None:
+                    self._deltas.append({'name': info.name(), 'initialize': True, 'delta': [], 'required': {}, 'entries': ''})
+                else:
+                    self._deltas.append(self._runHook(info, stamp[2]))
+
+            if self._cacheFilePath:
+                self._save(key, stamps)
+
+        return {'cached'        : cached,
+                'packages'      : len(self._packages),
+                'initialized'   : [x['name'] for x in self._deltas if x['initialize']]}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # CLASS METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create a composer for given packages and their dependencies in given registry.
+    #
+    #  @param cls      [ object                                   | None | in  ] - Class object.
+    #  @param registry [ mCore.packageRegistryLib.PackageRegistry | None | in  ] - Package registry.
+    #  @param names    [ list of str                              | None | in  ] - Names of the packages, all packages are used if not provided.
+    #  @param kwargs   [ dict                                     | None | in  ] - Keyword arguments of the constructor.
+    #
+    #  @exception ValueError                                - If a package isn't in the registry.
+    #  @exception mCore.dependencyLib.CyclicDependencyError - If packages depend on each other cyclically.
+    #
+    #  @return mCore.envComposerLib.EnvironmentComposer - Composer.
+    @classmethod
+    def fromRegistry(cls, registry, names=None, **kwargs):
+
+        import mCore.dependencyLib
+
+        graph = mCore.dependencyLib.DependencyGraph.fromRegistry(registry)
+
+        return cls([registry.package(x) for x in graph.loadOrder(names)], **kwargs)
@@ -0,0 +1,438 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/importIndexLib.py @brief [ FILE   ] - Indexed module finder.
+## @package mCore.importIndexLib    @brief [ MODULE ] - Indexed module finder.
+#
+#  Finding a top level module stats each entry of sys.path until a match is found, which costs
+#  many metadata calls when many directories are on sys.path, especially on network file systems.
+#  ImportIndex finder keeps an index of top level modules of all sys.path directories, so finding a
+#  module takes a single lookup. The index is kept in a local cache file, directories are listed
+#  again only if their modification time is changed.
+#
+# @code
+#
+#import mCore.importIndexLib
+#
+#mCore.importIndexLib.install()
+#
+#import mAsset.assetLib
+#
+# @endcode
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import importlib.machinery
+import importlib.util
+import os
+import sys
+import time
+
+import mCore.cacheLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ str ] - Name of the cache file in cache directory, cache tag of the interpreter is added to it.
+CACHE_FILE_NAME = 'importIndex.{}.json'
+
+## [ int ] - Version of the cache file.
+_CACHE_FILE_VERSION = 1
+
+## [ int ] - Seconds, which modification time of a directory may lag behind its changes.
+_MTIME_GRANULARITY = 2
+
+## [ str ] - Kind of package entries.
+_PACKAGE = 'package'
+
+## [ str ] - Kind of module entries.
+_MODULE = 'module'
+
+## [ mCore.importIndexLib.ImportIndex ] - Installed finder.
+_IMPORT_INDEX = None
+
+#
+## @brief List top level modules in given directory.
+#
+#  Priority of the entries is the same as the one of the path based finder. Regular packages come
+#  before modules, extension modules come before source modules, which come before bytecode modules.
+#  Namespace packages aren't listed, they are found by the path based finder.
+#
+#  @param directory [ str | None | in  ] - Absolute path of the directory.
+#
+#  @exception OSError - If the directory can't be listed.
+#
+#  @return dict - Module names as keys and list of kind and file name as values.
+def _scanDirectory(directory):
+
+    suffixes    = importlib.machinery.EXTENSION_SUFFIXES + importlib.machinery.SOURCE_SUFFIXES + importlib.machinery.BYTECODE_SUFFIXES
+    priorities  = dict([(x, i) for i, x in enumerate(suffixes)])
+    bySize      = sorted(suffixes, key=len, reverse=True)
+    entries     = {}
+    modules     = {}
+
+    with os.scandir(directory) as iterator:
+
+        for entry in iterator:
+
+            name = entry.name
+
+            try:
+                isDirectory = entry.is_dir()
+            except OSError:
+                continue
+
+            if isDirectory:
+
+                if not name.isidentifier():
+                    continue
+
+                for suffix in suffixes:
+                    initFileName = '__init__{}'.format(suffix)
+                    if os.path.isfile(os.path.join(entry.path, initFileName)):
+                        entries[name] = [_PACKAGE, os.path.join(name, initFileName)]
+                        break
+
+                continue
+
+            for suffix in bySize:
+
+                if not name.endswith(suffix):
+                    continue
+
+                moduleName = name[:-len(suffix)]
+                if moduleName.isidentifier():
+                    current = modules.get(moduleName)
+                    if current is None or priorities[suffix] < current[0]:
+                        modules[moduleName] = (priorities[suffix], name)
+
+                break
+
+    for moduleName, module in modules.items():
+        entries.setdefault(moduleName, [_MODULE, module[1]])
+
+    return entries
+
+#
+## @brief [ CLASS ] - Meta path finder, which finds top level modules from an index of sys.path.
+#
+#  The index is validated against sys.path and modification times of its directories when it is
+#  built, each directory costs a single stat call unless it is changed. A module, which is not in the
+#  index or whose file doesn't exist anymore, is left to the path based finder.
+#
+#  Entries of sys.path, which aren't directories such as zip files, can't be indexed; modules after
+#  them are left to the path based finder too. importlib.invalidate_caches validates the index again.
+class ImportIndex(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param cacheFilePath [ str | None | in  ] - Absolute path of the cache file, a file in cache directory is used if not provided.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, cacheFilePath=None):
+
+        if not cacheFilePath:
+            cacheFilePath = mCore.cacheLib.getCacheFilePath(CACHE_FILE_NAME.format(sys.implementation.cache_tag))
+
+        ## [ str ] - Absolute path of the cache file.
+        self._cacheFilePath = cacheFilePath
+
+        ## [ list of str ] - sys.path, which the index is built for.
+        self._paths         = None
+
+        ## [ str ] - Current working directory, which the index is built for.
+        self._cwd           = None
+
+        ## [ dict ] - Module names as keys and tuple of sys.path position, kind and absolute path as values.
+        self._entries       = {}
+
+        ## [ int ] - Position of the first sys.path entry, which couldn't be indexed.
+        self._barrier       = None
+
+        ## [ dict ] - Directories as keys and list of modification time and entries as values.
+        self._directories   = {}
+
+        ## [ bool ] - Whether the cache file is read.
+        self._isCacheRead   = False
+
+        ## [ bool ] - Whether the index is being built, modules imported meanwhile are left to the path based finder.
+        self._isBuilding    = False
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get whether the index is built for current sys.path.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def _isValid(self):
+
+        if self._paths != sys.path:
+            return False
+
+        if '' in self._paths:
+            try:
+                return os.getcwd() == self._cwd
+            except OSError:
+                return False
+
+        return True
+
+    #
+    ## @brief Build the index for current sys.path.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _build(self):
+
+        if not self._isCacheRead:
+
+            data = mCore.cacheLib.readJsonFile(self._cacheFilePath, {})
+            if data.get('version') == _CACHE_FILE_VERSION:
+                self._directories = data.get('directories', {})
+
+            self._isCacheRead = True
+
+        paths       = list(sys.path)
+        racyTime    = (time.time() - _MTIME_GRANULARITY) * 1000000000
+        entries     = {}
+        barrier     = None
+        isChanged   = False
+
+        try:
+            cwd = os.getcwd()
+        except OSError:
+            cwd = None
+
+        for position, path in enumerate(paths):
+
+            directory = cwd if path == '' else path
+
+            if not isinstance(directory, str):
+                barrier = position
+                break
+
+            try:
+                mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                # Entries, which don't exist, can't contain modules
+                continue
+
+            record = self._directories.get(directory)
+
+            if not record or record[0] != mtime:
+
+                try:
+                    record = [mtime, _scanDirectory(directory)]
+                except OSError:
+                    barrier = position
+                    break
+
+                # Changes made in the same time slot as the modification time may not be reflected by it
+                if mtime < racyTime:
+                    self._directories[directory] = record
+                    isChanged = True
+                else:
+                    self._directories.pop(directory, None)
+
+            for name, entry in record[1].items():
+                if name not in entries:
+                    entries[name] = (position, entry[0], os.path.join(directory, entry[1]))
+
+        self._paths     = paths
+        self._cwd       = cwd
+        self._entries   = entries
+        self._barrier   = barrier
+
+        if isChanged:
+            mCore.cacheLib.writeJsonFile(self._cacheFilePath, {'version': _CACHE_FILE_VERSION, 'directories': self._directories})
+
+    #
+    ## @brief Build the index if it isn't built for current sys.path.
+    #
+    #  Modules imported while building the index, such as the ones imported by mCore.cacheLib, are left
+    #  to the path based finder.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _validate(self):
+
+        if self._isValid():
+            return
+
+        self._isBuilding = True
+
+        try:
+            self._build()
+        finally:
+            self._isBuilding = False
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Find spec of given module.
+    #
+    #  Method is called by the import system.
+    #
+    #  @param fullname [ str         | None | in  ] - Full name of the module.
+    #  @param path     [ list of str | None | in  ] - Search locations of the parent package, None for top level modules.
+    #  @param target   [ module      | None | in  ] - Module to reload.
+    #
+    #  @exception N/A
+    #
+    #  @return importlib.machinery.ModuleSpec - Spec.
+    #  @return None                           - If the module isn't a top level module or it isn't in the index.
+    def find_spec(self, fullname, path=None, target=None):
+
+        if path is not None or self._isBuilding:
+            return None
+
+        self._validate()
+
+        entry = self._entries.get(fullname)
+        if entry is None:
+            return None
+
+        position, kind, location = entry
+
+        if self._barrier is not None and position > self._barrier:
+            return None
+
+        if not os.path.isfile(location):
+            return None
+
+        if kind == _PACKAGE:
+            return importlib.util.spec_from_file_location(fullname, location, submodule_search_locations=[os.path.dirname(location)])
+
+        return importlib.util.spec_from_file_location(fullname, location)
+
+    #
+    ## @brief Validate the index against sys.path and its directories on next search.
+    #
+    #  Method is called by importlib.invalidate_caches.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def invalidate_caches(self):
+
+        self._paths = None
+
+    #
+    ## @brief Build the index for current sys.path now.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def refresh(self):
+
+        self._paths = None
+
+        self._validate()
+
+    #
+    ## @brief Get the location of given top level module from the index.
+    #
+    #  @param name [ str | None | in  ] - Name of the module.
+    #
+    #  @exception N/A
+    #
+    #  @return str  - Absolute path of the module file or __init__ file of the package.
+    #  @return None - If the module isn't in the index.
+    def location(self, name):
+
+        self._validate()
+
+        entry = self._entries.get(name)
+
+        return entry[2] if entry else None
+
+#
+## @brief Install the finder into sys.meta_path before the path based finder.
+#
+#  @param cacheFilePath [ str | None | in  ] - Absolute path of the cache file, a file in cache directory is used if not provided.
+#
+#  @exception N/A
+#
+#  @return mCore.importIndexLib.ImportIndex - Installed finder.
+def install(cacheFilePath=None):
+
+    global _IMPORT_INDEX
+
+    uninstall()
+
+    _IMPORT_INDEX = ImportIndex(cacheFilePath)
+
+    try:
+        position = sys.meta_path.index(importlib.machinery.PathFinder)
+    except ValueError:
+        position = len(sys.meta_path)
+
+    sys.meta_path.insert(position, _IMPORT_INDEX)
+
+    return _IMPORT_INDEX
+
+#
+## @brief Uninstall the finder from sys.meta_path.
+#
+#  @exception N/A
+#
+#  @return bool - Whether the finder was installed.
+def uninstall():
+
+    global _IMPORT_INDEX
+
+    if _IMPORT_INDEX is None:
+        return False
+
+    if _IMPORT_INDEX in sys.meta_path:
+        sys.meta_path.remove(_IMPORT_INDEX)
+
+    _IMPORT_INDEX = None
+
+    return True
+
+#
+## @brief Get the installed finder.
+#
+#  @exception N/A
+#
+#  @return mCore.importIndexLib.ImportIndex - Finder.
+#  @return None                             - If the finder isn't installed.
+def getImportIndex():
+
+    return _IMPORT_INDEX
@@ -0,0 +1,606 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/importProfilerLib.py @brief [ FILE   ] - Import time profiler.
+## @package mCore.importProfilerLib    @brief [ MODULE ] - Import time profiler.
+#
+#  Target module or script is run in a new interpreter with `-X importtime` option, import times of
+#  the modules are aggregated by packages, which are found from packageInfoLib modules statically.
+#
+# @code
+#
+#import mCore.importProfilerLib
+#
+#profile = mCore.importProfilerLib.ImportProfile.create('mAsset.assetLib', runCount=3)
+#profile.displayReport()
+#profile.save('/tmp/mAsset.json')
+#
+#previous = mCore.importProfilerLib.ImportProfile.load('/tmp/mAsset.previous.json')
+#profile.displayComparison(previous)
+#
+# @endcode
+#
+#  Same functionality is available on command line.
+#
+# @code
+#
+#python -m mCore.importProfilerLib -m mAsset.assetLib --runs 3 --save /tmp/mAsset.json
+#python -m mCore.importProfilerLib -m mAsset.assetLib --compare /tmp/mAsset.json
+#python -m mCore.importProfilerLib /tools/bin/assetBrowser.py --limit 20
+#
+# @endcode
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import argparse
+import collections
+import importlib.machinery
+import json
+import os
+import re
+import subprocess
+import sys
+import sysconfig
+
+import mCore.displayLib
+import mCore.packageRegistryLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ str ] - Name of the group of standard library and built-in modules.
+STANDARD_LIBRARY = '<stdlib>'
+
+## [ int ] - Version of saved profile files.
+_PROFILE_FILE_VERSION = 1
+
+## [ re.Pattern ] - Line of -X importtime output.
+_IMPORT_TIME_PATTERN = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)\s*$')
+
+#
+## @brief [ NAMED TUPLE CLASS ] - Import time of a module.
+#
+#  Attributes.
+#
+#  name           [ str      ] - Full name of the module.
+#  selfTime       [ int      ] - Microseconds spent on the module itself.
+#  cumulativeTime [ int      ] - Microseconds spent on the module and modules it imported.
+#  depth          [ int      ] - Depth of the module in import tree.
+#  parent         [ str      ] - Name of the module, which imported the module, None for top level imports.
+ImportRecord = collections.namedtuple('ImportRecord', ('name', 'selfTime', 'cumulativeTime', 'depth', 'parent'))
+
+#
+## @brief Parse given -X importtime output.
+#
+#  Output lists modules after the modules they import, therefore parents of the modules are found by
+#  walking the lines backwards. Lines, which are not import time lines, are skipped.
+#
+#  @param text [ str | None | in  ] - Output.
+#
+#  @exception N/A
+#
+#  @return list of mCore.importProfilerLib.ImportRecord - Records in the order of the output.
+def parseImportTime(text):
+
+    lines = []
+
+    for line in text.splitlines():
+
+        match = _IMPORT_TIME_PATTERN.match(line)
+        if match:
+            lines.append((match.group(4), int(match.group(1)), int(match.group(2)), len(match.group(3)) // 2))
+
+    records = []
+    parents = []
+
+    for name, selfTime, cumulativeTime, depth in reversed(lines):
+
+        del parents[depth:]
+
+        records.append(ImportRecord(name, selfTime, cumulativeTime, depth, parents[-1] if parents else None))
+
+        parents.append(name)
+
+    records.reverse()
+
+    return records
+
+#
+## @brief Run given target in a new interpreter with -X importtime option.
+#
+#  @param target           [ str         | None       | in  ] - Name of a module or path of a script.
+#  @param isScript         [ bool        | False      | in  ] - Whether the target is a script.
+#  @param arguments        [ list of str | None       | in  ] - Arguments of the script.
+#  @param pythonExecutable [ str         | None       | in  ] - Python executable, current one is used if not provided.
+#  @param environment      [ dict        | None       | in  ] - Environment, current one is used if not provided.
+#
+#  @exception subprocess.CalledProcessError - If the target fails.
+#
+#  @return list of mCore.importProfilerLib.ImportRecord - Records.
+def runImportTime(target, isScript=False, arguments=None, pythonExecutable=None, environment=None):
+
+    command = [pythonExecutable or sys.executable, '-X', 'importtime']
+
+    if isScript:
+        command.append(target)
+        command.extend(arguments or [])
+    else:
+        command.extend(['-c', 'import {}'.format(target)])
+
+    process = subprocess.Popen(command,
+                               stdout=subprocess.DEVNULL,
+                               stderr=subprocess.PIPE,
+                               env=environment,
+                               universal_newlines=True)
+
+    _, error = process.communicate()
+
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, command, stderr=error)
+
+    return parseImportTime(error)
+
+#
+## @brief [ CLASS ] - Class to find packages of top level Python packages and modules.
+#
+#  Meco packages contain packageInfoLib module in one of their Python packages, which lists all the
+#  Python packages of the package. Packages are looked up from a package registry.
+class PackageResolver(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param paths    [ list of str                                   | None | in  ] - Paths to find the modules in, sys.path is used if not provided.
+    #  @param registry [ mCore.packageRegistryLib.PackageRegistry      | None | in  ] - Package registry, a new one is created for `paths` if not provided.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, paths=None, registry=None):
+
+        ## [ list of str ] - Paths to find the modules in.
+        self._paths             = list(paths) if paths else list(sys.path)
+
+        ## [ dict ] - Top level names as keys and tuple of package name and version as values.
+        self._packages          = {}
+
+        ## [ mCore.packageRegistryLib.PackageRegistry ] - Package registry.
+        self._registry          = registry or mCore.packageRegistryLib.PackageRegistry(self._paths)
+
+        ## [ tuple of str ] - Standard library directories.
+        self._stdlibDirectories = tuple(set([os.path.realpath(sysconfig.get_paths()[x]) + os.sep for x in ('stdlib', 'platstdlib')]))
+
+        ## [ tuple of str ] - Site packages directories.
+        self._siteDirectories   = tuple(set([os.path.realpath(sysconfig.get_paths()[x]) + os.sep for x in ('purelib', 'platlib')]))
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Find the package of given top level name.
+    #
+    #  @param name [ str | None | in  ] - Top level name of a Python package or module.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Package name and version.
+    def _resolve(self, name):
+
+        if name in sys.builtin_module_names or name in getattr(sys, 'stdlib_module_names', ()):
+            return STANDARD_LIBRARY, ''
+
+        try:
+            spec = importlib.machinery.PathFinder.find_spec(name, self._paths)
+        except (ImportError, ValueError):
+            spec = None
+
+        if spec is None:
+            return name, ''
+
+        if spec.submodule_search_locations:
+            location = list(spec.submodule_search_locations)[0]
+        else:
+            location = spec.origin
+
+        if not location:
+            return name, ''
+
+        location = os.path.realpath(location)
+
+        if location.startswith(self._stdlibDirectories) and not location.startswith(self._siteDirectories):
+            return STANDARD_LIBRARY, ''
+
+        info = self._registry.findPythonPackage(name)
+        if info is None or info.pythonDirectory() != os.path.dirname(location):
+            return name, ''
+
+        return info.name(), info.version()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get the package of given module.
+    #
+    #  Packages of the Python packages, which don't belong to a Meco package, are named after the top
+    #  level Python package.
+    #
+    #  @param moduleName [ str | None | in  ] - Full name of the module.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Package name and version.
+    def resolve(self, moduleName):
+
+        name = moduleName.split('.', 1)[0]
+
+        package = self._packages.get(name)
+        if package is None:
+            package = self._packages[name] = self._resolve(name)
+
+        return package
+
+#
+## @brief [ CLASS ] - Import times aggregated by packages.
+#
+#  Self time of a package is the time spent on its own modules. Cumulative time of a package is the
+#  time spent on importing it from other packages, including the packages it imports.
+class ImportProfile(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param target   [ str  | None | in  ] - Name of the module or path of the script, which is profiled.
+    #  @param packages [ dict | None | in  ] - Package names as keys and dict with version, modules, self and cumulative keys as values, times are in microseconds.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, target, packages):
+
+        ## [ str ] - Name of the module or path of the script, which is profiled.
+        self._target    = target
+
+        ## [ dict ] - Package names as keys and dict with version, modules, self and cumulative keys as values.
+        self._packages  = packages
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Name of the module or path of the script, which is profiled.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Target.
+    def target(self):
+
+        return self._target
+
+    #
+    ## @brief Packages.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Package names as keys and dict with version, modules, self and cumulative keys as values, times are in microseconds.
+    def packages(self):
+
+        return self._packages
+
+    #
+    ## @brief Total import time.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Microseconds.
+    def total(self):
+
+        return sum([x['self'] for x in self._packages.values()])
+
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get the report of the packages ordered by their self time.
+    #
+    #  @param limit [ int | None | in  ] - Maximum number of packages.
+    #
+    #  @exception N/A
+    #
+    #  @return list of tuple - Rows of package, version, number of modules, self and cumulative time, times are in milliseconds.
+    def report(self, limit=None):
+
+        rows = [(name,
+                 data['version'],
+                 data['modules'],
+                 data['self']       / 1000.0,
+                 data['cumulative'] / 1000.0) for name, data in self._packages.items()]
+
+        rows.sort(key=lambda x: x[3], reverse=True)
+
+        return rows[:limit] if limit else rows
+
+    #
+    ## @brief Compare the profile with given previous profile.
+    #
+    #  A package is regressed if its self time increased more than both `threshold` ratio and `minimum`.
+    #
+    #  @param other     [ mCore.importProfilerLib.ImportProfile | None | in  ] - Previous profile.
+    #  @param threshold [ float                                 | 0.2  | in  ] - Ratio of self time change.
+    #  @param minimum   [ float                                 | 1.0  | in  ] - Milliseconds of self time change.
+    #
+    #  @exception N/A
+    #
+    #  @return list of tuple - Rows of package, previous self time, self time, change and status ordered by change, times are in milliseconds, status is one of regressed, improved, new, removed or empty string.
+    def compare(self, other, threshold=0.2, minimum=1.0):
+
+        rows = []
+
+        for name in set(self._packages).union(other.packages()):
+
+            current  = self._packages.get(name)
+            previous = other.packages().get(name)
+
+            currentTime  = current['self']  / 1000.0 if current  else 0.0
+            previousTime = previous['self'] / 1000.0 if previous else 0.0
+            change       = currentTime - previousTime
+
+            if not previous:
+                status = 'new'
+            elif not current:
+                status = 'removed'
+            elif abs(change) >= minimum and abs(change) >= previousTime * threshold:
+                status = 'regressed' if change > 0 else 'improved'
+            else:
+                status = ''
+
+            rows.append((name, previousTime, currentTime, change, status))
+
+        rows.sort(key=lambda x: x[3], reverse=True)
+
+        return rows
+
+    #
+    ## @brief Display the report of the packages as a table.
+    #
+    #  @param limit    [ int  | None | in  ] - Maximum number of packages.
+    #  @param useColor [ bool | True | in  ] - Use color to display the header.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def displayReport(self, limit=None, useColor=True):
+
+        total = self.total() / 1000.0 or 1.0
+        rows  = [list(row[:3]) + ['{:.3f}'.format(row[3]), '{:.3f}'.format(row[4]), '{:.1f}'.format(row[3] / total * 100)] for row in self.report(limit)]
+
+        mCore.displayLib.Display.displayTable(rows,
+                                              header=('Package', 'Version', 'Modules', 'Self (ms)', 'Cumulative (ms)', 'Self (%)'),
+                                              useColor=useColor)
+
+    #
+    ## @brief Display the comparison with given previous profile as a table.
+    #
+    #  @param other     [ mCore.importProfilerLib.ImportProfile | None | in  ] - Previous profile.
+    #  @param threshold [ float                                 | 0.2  | in  ] - Ratio of self time change.
+    #  @param minimum   [ float                                 | 1.0  | in  ] - Milliseconds of self time change.
+    #  @param useColor  [ bool                                  | True | in  ] - Use color to display the header and the status column.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Names of the regressed packages.
+    def displayComparison(self, other, threshold=0.2, minimum=1.0, useColor=True):
+
+        rows = self.compare(other, threshold=threshold, minimum=minimum)
+
+        mCore.displayLib.Display.displayTable([[row[0]] + ['{:+.3f}'.format(x) if i == 2 else '{:.3f}'.format(x) for i, x in enumerate(row[1:4])] + [row[4]] for row in rows],
+                                              header=('Package', 'Previous (ms)', 'Current (ms)', 'Change (ms)', 'Status'),
+                                              statusColumn=4,
+                                              statusColors={'regressed': mCore.displayLib.ColorName.kFailure,
+                                                            'improved' : mCore.displayLib.ColorName.kSuccess},
+                                              useColor=useColor)
+
+        return [row[0] for row in rows if row[4] == 'regressed']
+
+    #
+    ## @brief Save the profile into given JSON file.
+    #
+    #  @param filePath [ str | None | in  ] - Absolute path of the file.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def save(self, filePath):
+
+        with open(filePath, 'w') as _file:
+            json.dump({'version': _PROFILE_FILE_VERSION, 'target': self._target, 'packages': self._packages}, _file, indent=4, sort_keys=True)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # CLASS METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create a profile from given records.
+    #
+    #  @param cls      [ object                                        | None | in  ] - Class object.
+    #  @param target   [ str                                           | None | in  ] - Name of the module or path of the script, which is profiled.
+    #  @param records  [ list of mCore.importProfilerLib.ImportRecord  | None | in  ] - Records.
+    #  @param resolver [ mCore.importProfilerLib.PackageResolver       | None | in  ] - Package resolver, a new one is created if not provided.
+    #
+    #  @exception N/A
+    #
+    #  @return mCore.importProfilerLib.ImportProfile - Profile.
+    @classmethod
+    def fromRecords(cls, target, records, resolver=None):
+
+        resolver = resolver or PackageResolver()
+        packages = {}
+
+        for record in records:
+
+            name, version = resolver.resolve(record.name)
+
+            data = packages.get(name)
+            if data is None:
+                data = packages[name] = {'version': version, 'modules': 0, 'self': 0, 'cumulative': 0}
+
+            data['modules'] += 1
+            data['self']    += record.selfTime
+
+            # Modules imported by the modules of the same package are already in their cumulative time
+            if record.parent is None or resolver.resolve(record.parent)[0] != name:
+                data['cumulative'] += record.cumulativeTime
+
+        return cls(target, packages)
+
+    #
+    ## @brief Profile given target.
+    #
+    #  Target is run `runCount` times, the fastest time of each module is used to reduce the noise.
+    #
+    #  @param cls              [ object      | None  | in  ] - Class object.
+    #  @param target           [ str         | None  | in  ] - Name of a module or path of a script.
+    #  @param isScript         [ bool        | False | in  ] - Whether the target is a script.
+    #  @param arguments        [ list of str | None  | in  ] - Arguments of the script.
+    #  @param runCount         [ int         | 1     | in  ] - Number of runs.
+    #  @param pythonExecutable [ str         | None  | in  ] - Python executable, current one is used if not provided.
+    #  @param environment      [ dict        | None  | in  ] - Environment, current one is used if not provided.
+    #  @param resolver         [ mCore.importProfilerLib.PackageResolver | None | in  ] - Package resolver, a new one is created if not provided.
+    #
+    #  @exception subprocess.CalledProcessError - If the target fails.
+    #
+    #  @return mCore.importProfilerLib.ImportProfile - Profile.
+    @classmethod
+    def create(cls, target, isScript=False, arguments=None, runCount=1, pythonExecutable=None, environment=None, resolver=None):
+
+        records = None
+
+        for _ in range(max(runCount, 1)):
+
+            run = runImportTime(target, isScript=isScript, arguments=arguments, pythonExecutable=pythonExecutable, environment=environment)
+
+            if records is None:
+                records = run
+                continue
+
+            fastest = {}
+            for record in run:
+                fastest[record.name] = record
+
+            records = [x._replace(selfTime=min(x.selfTime, fastest[x.name].selfTime),
+                                  cumulativeTime=min(x.cumulativeTime, fastest[x.name].cumulativeTime)) if x.name in fastest else x for x in records]
+
+        return cls.fromRecords(target, records, resolver=resolver)
+
+    #
+    ## @brief Load a profile from given JSON file.
+    #
+    #  @param cls      [ object | None | in  ] - Class object.
+    #  @param filePath [ str    | None | in  ] - Absolute path of the file.
+    #
+    #  @exception ValueError - If the file is not a profile file.
+    #
+    #  @return mCore.importProfilerLib.ImportProfile - Profile.
+    @classmethod
+    def load(cls, filePath):
+
+        with open(filePath, 'r') as _file:
+            data = json.load(_file)
+
+        if not isinstance(data, dict) or data.get('version') != _PROFILE_FILE_VERSION:
+            raise ValueError('{} is not an import profile file'.format(filePath))
+
+        return cls(data.get('target'), data['packages'])
+
+#
+## @brief Run the profiler from command line.
+#
+#  @param arguments [ list of str | None | in  ] - Command line arguments, sys.argv is used if not provided.
+#
+#  @exception N/A
+#
+#  @return int - Exit code, 1 if any package regressed compared to the previous profile.
+def main(arguments=None):
+
+    parser = argparse.ArgumentParser(prog='python -m mCore.importProfilerLib',
+                                     description='Profile import time of a module or a script by packages.')
+
+    parser.add_argument('-m', dest='module', help='Module to import.')
+    parser.add_argument('--runs', type=int, default=1, help='Number of runs, fastest time of each module is used.')
+    parser.add_argument('--limit', type=int, default=None, help='Maximum number of packages to display.')
+    parser.add_argument('--save', default=None, help='Save the profile into given JSON file.')
+    parser.add_argument('--compare', default=None, help='Compare the profile with given saved profile.')
+    parser.add_argument('--threshold', type=float, default=0.2, help='Ratio of self time change to report a regression.')
+    parser.add_argument('--minimum', type=float, default=1.0, help='Milliseconds of self time change to report a regression.')
+    parser.add_argument('script', nargs=argparse.REMAINDER, help='Script to run and its arguments.')
+
+    arguments = parser.parse_args(arguments)
+
+    if bool(arguments.module) == bool(arguments.script):
+        parser.error('either -m module or a script must be provided')
+
+    if arguments.module:
+        profile = ImportProfile.create(arguments.module, runCount=arguments.runs)
+    else:
+        profile = ImportProfile.create(arguments.script[0], isScript=True, arguments=arguments.script[1:], runCount=arguments.runs)
+
+    profile.displayReport(limit=arguments.limit)
+
+    mCore.displayLib.Display.displayInfo('Total: {:.3f} ms'.format(profile.total() / 1000.0))
+
+    if arguments.save:
+        profile.save(arguments.save)
+
+    if arguments.compare:
+
+        regressed = profile.displayComparison(ImportProfile.load(arguments.compare), threshold=arguments.threshold, minimum=arguments.minimum)
+
+        if regressed:
+            mCore.displayLib.Display.displayFailure('Regressed: {}'.format(', '.join(regressed)))
+            return 1
+
+    return 0
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    sys.exit(main())
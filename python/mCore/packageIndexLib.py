@@ -0,0 +1,383 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/packageIndexLib.py @brief [ FILE   ] - Package search index.
+## @package mCore.packageIndexLib    @brief [ MODULE ] - Package search index.
+#
+#  Inverted index of KEYWORDS, PLATFORMS, APPLICATIONS and PYTHON_VERSIONS constants of packageInfoLib
+#  modules. Each value of these constants maps to the set of packages providing it, so queries
+#  intersect a few sets instead of scanning the metadata of every package.
+#
+# @code
+#
+#import mCore.packageRegistryLib
+#import mCore.packageIndexLib
+#
+#index = mCore.packageIndexLib.PackageIndex.fromRegistry(mCore.packageRegistryLib.PackageRegistry())
+#
+#index.search(keywords=['name'], platform='Linux', pythonVersion='3')
+# #['mCore']
+#
+# @endcode
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import bisect
+
+import mCore.enumAbs
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ ENUM CLASS ] - Indexed constants of packageInfoLib modules.
+class Field(mCore.enumAbs.Enum):
+
+    ## [ str ] - Keywords to find the package.
+    kKeywords       = 'KEYWORDS'
+
+    ## [ str ] - Platforms the package is meant to be used on.
+    kPlatforms      = 'PLATFORMS'
+
+    ## [ str ] - Applications the package is meant to be initialized for.
+    kApplications   = 'APPLICATIONS'
+
+    ## [ str ] - Python versions supported by the package.
+    kPythonVersions = 'PYTHON_VERSIONS'
+
+## [ tuple of str ] - Indexed constants.
+FIELDS = (Field.kKeywords, Field.kPlatforms, Field.kApplications, Field.kPythonVersions)
+
+## [ str ] - Application value of the packages, which are meant to be initialized for all applications.
+ALL_APPLICATIONS = 'all'
+
+#
+## @brief Get normalized values of given constant.
+#
+#  @param value [ variant | None | in  ] - Value of the constant, str or collection of str.
+#
+#  @exception N/A
+#
+#  @return frozenset of str - Lower case values.
+def _getTerms(value):
+
+    if not value:
+        return frozenset()
+
+    if isinstance(value, str):
+        value = [value]
+
+    return frozenset([str(x).strip().lower() for x in value if x is not None and str(x).strip()])
+
+#
+## @brief [ CLASS ] - Inverted index of package metadata.
+#
+#  Values are case insensitive. Keywords can be matched by their prefixes, sorted keywords are
+#  searched with bisection. Python versions match if one of them is the dotted prefix of the other,
+#  so 3 matches 3.9 and vice versa. Packages with all as application match any application.
+#
+#  Packages can be set and removed one by one, only postings of the changed package are updated.
+class PackageIndex(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self):
+
+        ## [ dict ] - Fields as keys and dict of values and set of package names as values.
+        self._postings  = dict([(x, {}) for x in FIELDS])
+
+        ## [ dict ] - Fields as keys and sorted list of their values as values.
+        self._terms     = dict([(x, []) for x in FIELDS])
+
+        ## [ dict ] - Package names as keys and dict of fields and frozenset of their values as values.
+        self._packages  = {}
+
+    #
+    ## @brief Get whether given package is in the index.
+    #
+    #  @param name [ str | None | in  ] - Name of the package.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def __contains__(self, name):
+
+        return name in self._packages
+
+    #
+    ## @brief Get the number of packages in the index.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Number of packages.
+    def __len__(self):
+
+        return len(self._packages)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Add given package to the postings of given values.
+    #
+    #  @param field [ str         | None | in  ] - Field.
+    #  @param terms [ set of str  | None | in  ] - Values.
+    #  @param name  [ str         | None | in  ] - Name of the package.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _addPostings(self, field, terms, name):
+
+        postings = self._postings[field]
+
+        for term in terms:
+
+            names = postings.get(term)
+
+            if names is None:
+                postings[term] = set([name])
+                bisect.insort(self._terms[field], term)
+            else:
+                names.add(name)
+
+    #
+    ## @brief Remove given package from the postings of given values.
+    #
+    #  @param field [ str         | None | in  ] - Field.
+    #  @param terms [ set of str  | None | in  ] - Values.
+    #  @param name  [ str         | None | in  ] - Name of the package.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _removePostings(self, field, terms, name):
+
+        postings = self._postings[field]
+
+        for term in terms:
+
+            names = postings[term]
+            names.discard(name)
+
+            if not names:
+                del postings[term]
+                fieldTerms = self._terms[field]
+                del fieldTerms[bisect.bisect_left(fieldTerms, term)]
+
+    #
+    ## @brief Get packages having a value starting with given prefix.
+    #
+    #  @param field  [ str | None | in  ] - Field.
+    #  @param prefix [ str | None | in  ] - Prefix.
+    #
+    #  @exception N/A
+    #
+    #  @return set of str - Names of the packages.
+    def _matchPrefix(self, field, prefix):
+
+        terms       = self._terms[field]
+        postings    = self._postings[field]
+        names       = set()
+
+        for i in range(bisect.bisect_left(terms, prefix), len(terms)):
+
+            if not terms[i].startswith(prefix):
+                break
+
+            names.update(postings[terms[i]])
+
+        return names
+
+    #
+    ## @brief Get packages supporting given Python version.
+    #
+    #  @param version [ str | None | in  ] - Lower case version such as 3 or 3.9.
+    #
+    #  @exception N/A
+    #
+    #  @return set of str - Names of the packages.
+    def _matchPythonVersion(self, version):
+
+        postings    = self._postings[Field.kPythonVersions]
+        names       = self._matchPrefix(Field.kPythonVersions, version + '.')
+
+        names.update(postings.get(version, ()))
+
+        # Less specific versions such as 3 for 3.9
+        parts = version.split('.')
+        for i in range(1, len(parts)):
+            names.update(postings.get('.'.join(parts[:i]), ()))
+
+        return names
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Add given package to the index or update it.
+    #
+    #  @param name [ str  | None | in  ] - Name of the package.
+    #  @param data [ dict | None | in  ] - Constants of the packageInfoLib module of the package.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether the index is changed.
+    def setPackage(self, name, data):
+
+        fields      = dict([(x, _getTerms(data.get(x))) for x in FIELDS])
+        previous    = self._packages.get(name)
+
+        if previous == fields:
+            return False
+
+        for field in FIELDS:
+
+            terms = fields[field]
+
+            if previous:
+                self._removePostings(field, previous[field] - terms, name)
+                terms = terms - previous[field]
+
+            self._addPostings(field, terms, name)
+
+        self._packages[name] = fields
+
+        return True
+
+    #
+    ## @brief Remove given package from the index.
+    #
+    #  @param name [ str | None | in  ] - Name of the package.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether the package was in the index.
+    def removePackage(self, name):
+
+        fields = self._packages.pop(name, None)
+        if fields is None:
+            return False
+
+        for field in FIELDS:
+            self._removePostings(field, fields[field], name)
+
+        return True
+
+    #
+    ## @brief Get indexed values of given field.
+    #
+    #  @param field  [ str | None | in  ] - Field, value of mCore.packageIndexLib.Field.
+    #  @param prefix [ str | ''   | in  ] - Prefix of the values, all values are returned if not provided.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Sorted lower case values.
+    def terms(self, field, prefix=''):
+
+        terms   = self._terms[field]
+        prefix  = prefix.lower()
+        start   = bisect.bisect_left(terms, prefix)
+        end     = bisect.bisect_left(terms, prefix + '\uffff') if prefix else len(terms)
+
+        return terms[start:end]
+
+    #
+    ## @brief Search packages matching all given criteria.
+    #
+    #  @param keywords      [ list of str | None | in  ] - Keywords, package must match all of them.
+    #  @param platform      [ str         | None | in  ] - Platform such as Linux.
+    #  @param application   [ str         | None | in  ] - Application, packages for all applications match any.
+    #  @param pythonVersion [ str         | None | in  ] - Python version such as 3 or 3.9.
+    #  @param prefix        [ bool        | True | in  ] - Whether keywords match the ones starting with them.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Sorted names of the packages, all packages if no criteria is provided.
+    def search(self, keywords=None, platform=None, application=None, pythonVersion=None, prefix=True):
+
+        keywordPostings = self._postings[Field.kKeywords]
+        matches         = []
+
+        for keyword in _getTerms(keywords):
+            if prefix:
+                matches.append(self._matchPrefix(Field.kKeywords, keyword))
+            else:
+                matches.append(keywordPostings.get(keyword, set()))
+
+        if platform:
+            matches.append(self._postings[Field.kPlatforms].get(platform.lower(), set()))
+
+        if application:
+            applicationPostings = self._postings[Field.kApplications]
+            matches.append(applicationPostings.get(application.lower(), set()) | applicationPostings.get(ALL_APPLICATIONS, set()))
+
+        if pythonVersion:
+            matches.append(self._matchPythonVersion(str(pythonVersion).lower()))
+
+        if not matches:
+            return sorted(self._packages)
+
+        # Intersect the smallest sets first
+        matches.sort(key=len)
+
+        names = set(matches[0])
+        for match in matches[1:]:
+            if not names:
+                break
+            names.intersection_update(match)
+
+        return sorted(names)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # CLASS METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create an index of the packages in given registry.
+    #
+    #  @param cls      [ object                                   | None | in  ] - Class object.
+    #  @param registry [ mCore.packageRegistryLib.PackageRegistry | None | in  ] - Package registry.
+    #
+    #  @exception N/A
+    #
+    #  @return mCore.packageIndexLib.PackageIndex - Index.
+    @classmethod
+    def fromRegistry(cls, registry):
+
+        index = cls()
+
+        for info in registry.packages():
+            index.setPackage(info.name(), info.data())
+
+        return index
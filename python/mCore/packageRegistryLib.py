@@ -0,0 +1,762 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/packageRegistryLib.py @brief [ FILE   ] - Package metadata registry.
+## @package mCore.packageRegistryLib    @brief [ MODULE ] - Package metadata registry.
+#
+#  Constants of packageInfoLib modules are read statically, packages aren't imported. Read metadata
+#  is kept in a local cache file with modification time and size of the packageInfoLib modules, so
+#  only changed packages are read again.
+#
+# @code
+#
+#import mCore.packageRegistryLib
+#
+#registry = mCore.packageRegistryLib.PackageRegistry(['/tools/packages/python'])
+#
+#registry.package('mCore').version()
+# #1.0.0
+#
+#registry.findPythonPackage('mCore').dependentPackages()
+# #['mFileSystem']
+#
+# @endcode
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import ast
+import concurrent.futures
+import os
+import sys
+import time
+
+import mCore.cacheLib
+import mCore.platformLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ str ] - Name of the package info module.
+PACKAGE_INFO_FILE_NAME = 'packageInfoLib.py'
+
+## [ str ] - Name of the cache file in cache directory.
+CACHE_FILE_NAME = 'packageRegistry.json'
+
+## [ int ] - Version of the cache file.
+_CACHE_FILE_VERSION = 1
+
+## [ int ] - Seconds, which modification time of a file may lag behind its changes.
+_MTIME_GRANULARITY = 2
+
+#
+## @brief Convert given literal value into a value, which can be stored in JSON.
+#
+#  @param value [ variant | None | in  ] - Value.
+#
+#  @exception N/A
+#
+#  @return variant - Value.
+def _toJsonValue(value):
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_toJsonValue(x) for x in value]
+
+    if isinstance(value, dict):
+        return dict([(str(k), _toJsonValue(v)) for k, v in value.items()])
+
+    if isinstance(value, (bytes, complex)):
+        return repr(value)
+
+    return value
+
+#
+## @brief Read given packageInfoLib module without importing it.
+#
+#  Module level assignments of literal values are read, others are skipped.
+#
+#  @param filePath [ str | None | in  ] - Absolute path of the packageInfoLib module.
+#
+#  @exception N/A
+#
+#  @return dict - Names of the constants as keys and their values as values.
+def readPackageInfo(filePath):
+
+    try:
+        with open(filePath, 'rb') as _file:
+            tree = ast.parse(_file.read(), filePath)
+    except (IOError, OSError, SyntaxError, ValueError):
+        return {}
+
+    data = {}
+
+    for node in tree.body:
+
+        if not isinstance(node, ast.Assign):
+            continue
+
+        for target in node.targets:
+
+            if not isinstance(target, ast.Name):
+                continue
+
+            try:
+                data[target.id] = _toJsonValue(ast.literal_eval(node.value))
+            except ValueError:
+                continue
+
+    return data
+
+#
+## @brief [ CLASS ] - Metadata of a package.
+class PackageInfo(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param filePath [ str  | None | in  ] - Absolute path of the packageInfoLib module.
+    #  @param data     [ dict | None | in  ] - Constants of the module.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, filePath, data):
+
+        ## [ str ] - Absolute path of the packageInfoLib module.
+        self._filePath  = filePath
+
+        ## [ dict ] - Constants of the module.
+        self._data      = data
+
+    #
+    ## @brief String representation.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Representation.
+    def __repr__(self):
+
+        return '<PackageInfo {} {} {}>'.format(self.name(), self.version(), self._filePath)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Absolute path of the packageInfoLib module.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Path.
+    def filePath(self):
+
+        return self._filePath
+
+    #
+    ## @brief Absolute path of the directory, which contains the Python packages of the package.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Path.
+    def pythonDirectory(self):
+
+        return os.path.dirname(os.path.dirname(self._filePath))
+
+    #
+    ## @brief Constants of the packageInfoLib module.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Names of the constants as keys and their values as values.
+    def data(self):
+
+        return self._data
+
+    #
+    ## @brief Name of the package.
+    #
+    #  Name of the Python package, which contains packageInfoLib module, is used if NAME isn't provided.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Name.
+    def name(self):
+
+        return self._data.get('NAME') or os.path.basename(os.path.dirname(self._filePath))
+
+    #
+    ## @brief Version of the package.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Version, empty string if VERSION isn't provided.
+    def version(self):
+
+        return self._data.get('VERSION') or ''
+
+    #
+    ## @brief Python packages of the package.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Names of the Python packages.
+    def pythonPackages(self):
+
+        return self._data.get('PYTHON_PACKAGES') or [os.path.basename(os.path.dirname(self._filePath))]
+
+    #
+    ## @brief Packages the package depends on.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Names of the packages.
+    def dependentPackages(self):
+
+        return self._data.get('DEPENDENT_PACKAGES') or []
+
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get value of given constant.
+    #
+    #  @param key          [ str     | None | in  ] - Name of the constant such as KEYWORDS.
+    #  @param defaultValue [ variant | None | in  ] - Value to return if the constant isn't provided.
+    #
+    #  @exception N/A
+    #
+    #  @return variant - Value.
+    def get(self, key, defaultValue=None):
+
+        return self._data.get(key, defaultValue)
+
+#
+## @brief [ CLASS ] - Immutable view of the packages of a registry at a point in time.
+#
+#  Registry replaces its lookups instead of modifying them, so a snapshot can be read by any
+#  thread without locks while the registry is being updated.
+class PackageSnapshot(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param packages       [ dict | None | in  ] - Package names as keys and mCore.packageRegistryLib.PackageInfo instances as values.
+    #  @param pythonPackages [ dict | None | in  ] - Python package names as keys and mCore.packageRegistryLib.PackageInfo instances as values.
+    #  @param generation     [ int  | None | in  ] - Number of times the lookups of the registry are built.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, packages, pythonPackages, generation):
+
+        ## [ dict ] - Package names as keys and mCore.packageRegistryLib.PackageInfo instances as values.
+        self._packages          = packages
+
+        ## [ dict ] - Python package names as keys and mCore.packageRegistryLib.PackageInfo instances as values.
+        self._pythonPackages    = pythonPackages
+
+        ## [ int ] - Number of times the lookups of the registry are built.
+        self._generation        = generation
+
+    #
+    ## @brief Get the number of packages.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Number of packages.
+    def __len__(self):
+
+        return len(self._packages)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Number of times the lookups of the registry are built, it increases with each change.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Generation.
+    def generation(self):
+
+        return self._generation
+
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get given package.
+    #
+    #  @param name [ str | None | in  ] - Name of the package.
+    #
+    #  @exception N/A
+    #
+    #  @return mCore.packageRegistryLib.PackageInfo - Package.
+    #  @return None                                 - If the package isn't found.
+    def package(self, name):
+
+        return self._packages.get(name)
+
+    #
+    ## @brief Get all the packages.
+    #
+    #  @exception N/A
+    #
+    #  @return list of mCore.packageRegistryLib.PackageInfo - Packages ordered by their names.
+    def packages(self):
+
+        return [self._packages[x] for x in sorted(self._packages)]
+
+    #
+    ## @brief Get the package, which contains given Python package.
+    #
+    #  @param name [ str | None | in  ] - Name of the Python package.
+    #
+    #  @exception N/A
+    #
+    #  @return mCore.packageRegistryLib.PackageInfo - Package.
+    #  @return None                                 - If the Python package doesn't belong to a package.
+    def findPythonPackage(self, name):
+
+        return self._pythonPackages.get(name)
+
+#
+## @brief [ CLASS ] - Registry of packages found in given root directories.
+#
+#  Root directories are Python directories such as sys.path entries, packageInfoLib modules are
+#  searched in the Python packages directly under them. If more than one package has the same name,
+#  the one in the earlier root is used, the same way modules are found on sys.path.
+#
+#  Roots are listed in parallel, packageInfoLib modules are read again only if their modification
+#  time or size is changed.
+class PackageRegistry(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param roots         [ list of str | None | in  ] - Root directories, sys.path is used if not provided.
+    #  @param cacheFilePath [ str         | None | in  ] - Absolute path of the cache file, a file in cache directory is used if not provided.
+    #  @param useCache      [ bool        | True | in  ] - Whether to read and write the cache file.
+    #  @param maxWorkers    [ int         | None | in  ] - Number of threads, based on CPUs available to the process if not provided.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, roots=None, cacheFilePath=None, useCache=True, maxWorkers=None):
+
+        roots = [os.path.realpath(x) for x in (roots or sys.path) if x and isinstance(x, str)]
+
+        ## [ list of str ] - Root directories.
+        self._roots             = sorted(set(roots), key=roots.index)
+
+        ## [ str ] - Absolute path of the cache file.
+        self._cacheFilePath     = (cacheFilePath or mCore.cacheLib.getCacheFilePath(CACHE_FILE_NAME)) if useCache else None
+
+        ## [ int ] - Number of threads.
+        self._maxWorkers        = maxWorkers
+
+        ## [ dict ] - Absolute paths of packageInfoLib modules as keys and list of modification time, size and constants as values.
+        self._files             = {}
+
+        ## [ dict ] - Root directories as keys and list of absolute paths of packageInfoLib modules in them as values.
+        self._rootFiles         = {}
+
+        ## [ dict ] - Package names as keys and mCore.packageRegistryLib.PackageInfo instances as values.
+        self._packages          = {}
+
+        ## [ dict ] - Python package names as keys and mCore.packageRegistryLib.PackageInfo instances as values.
+        self._pythonPackages    = {}
+
+        ## [ bool ] - Whether the registry has been refreshed.
+        self._isRefreshed       = False
+
+        ## [ mCore.packageRegistryLib.PackageSnapshot ] - Current snapshot of the lookups.
+        self._snapshot          = PackageSnapshot({}, {}, 0)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Find packageInfoLib modules in given root directory.
+    #
+    #  @param root [ str | None | in  ] - Absolute path of the root directory.
+    #
+    #  @exception N/A
+    #
+    #  @return list of tuple - Absolute path, modification time and size of the modules sorted by path.
+    @staticmethod
+    def _scanRoot(root):
+
+        files = []
+
+        try:
+            iterator = os.scandir(root)
+        except OSError:
+            return files
+
+        with iterator:
+
+            for entry in iterator:
+
+                try:
+                    if not entry.is_dir():
+                        continue
+                except OSError:
+                    continue
+
+                filePath = os.path.join(entry.path, PACKAGE_INFO_FILE_NAME)
+
+                try:
+                    stat = os.stat(filePath)
+                except OSError:
+                    continue
+
+                files.append((filePath, stat.st_mtime_ns, stat.st_size))
+
+        files.sort()
+
+        return files
+
+    #
+    ## @brief Read given packageInfoLib module if it is changed since it is read last time.
+    #
+    #  @param filePath [ str | None | in  ] - Absolute path of the module.
+    #  @param mtime    [ int | None | in  ] - Modification time in nanoseconds.
+    #  @param size     [ int | None | in  ] - Size in bytes.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether the module is read.
+    def _update(self, filePath, mtime, size):
+
+        record = self._files.get(filePath)
+        if record and record[0] == mtime and record[1] == size:
+            return False
+
+        self._files[filePath] = [mtime, size, readPackageInfo(filePath)]
+
+        return True
+
+    #
+    ## @brief Build package lookups from the modules found in the roots.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _build(self):
+
+        packages        = {}
+        pythonPackages  = {}
+
+        for root in self._roots:
+
+            for filePath in self._rootFiles.get(root, []):
+
+                info = PackageInfo(filePath, self._files[filePath][2])
+
+                packages.setdefault(info.name(), info)
+
+                for pythonPackage in info.pythonPackages():
+                    pythonPackages.setdefault(pythonPackage, info)
+
+        self._packages          = packages
+        self._pythonPackages    = pythonPackages
+        self._snapshot          = PackageSnapshot(packages, pythonPackages, self._snapshot.generation() + 1)
+
+    #
+    ## @brief Read given package again if it is changed without building the lookups.
+    #
+    #  Only the root directory is resolved, packages are kept by their paths under the roots like
+    #  _scanRoot method does, so symbolic links to packages are not followed.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of a packageInfoLib module or the Python package, which contains it.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - mCore.packageRegistryLib.PackageInfo instance or None if the module doesn't exist or it isn't in the roots and whether the module is changed, added or removed.
+    def _refreshPath(self, path):
+
+        path = os.path.normpath(os.path.abspath(path))
+        if os.path.basename(path) != PACKAGE_INFO_FILE_NAME:
+            path = os.path.join(path, PACKAGE_INFO_FILE_NAME)
+
+        packagePath = os.path.dirname(path)
+
+        root = os.path.realpath(os.path.dirname(packagePath))
+        if root not in self._rootFiles:
+            return None, False
+
+        path = os.path.join(root, os.path.basename(packagePath), PACKAGE_INFO_FILE_NAME)
+
+        files = self._rootFiles[root]
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stat = None
+
+        if stat is None:
+
+            if path in files:
+                files.remove(path)
+                self._files.pop(path, None)
+                return None, True
+
+            return None, False
+
+        isNew = path not in files
+        if isNew:
+            files.append(path)
+            files.sort()
+
+        isChanged = self._update(path, stat.st_mtime_ns, stat.st_size) or isNew
+
+        return PackageInfo(path, self._files[path][2]), isChanged
+
+    #
+    ## @brief Refresh the registry if it hasn't been refreshed yet.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _ensureRefreshed(self):
+
+        if not self._isRefreshed:
+            self.refresh()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Root directories.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Absolute paths.
+    def roots(self):
+
+        return list(self._roots)
+
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Find packages in the roots and read the ones, which are new or changed.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Summary with packages, read and removed keys, which are the number of found packageInfoLib modules, number of read ones and number of ones, which don't exist anymore.
+    def refresh(self):
+
+        if not self._isRefreshed and self._cacheFilePath:
+            data = mCore.cacheLib.readJsonFile(self._cacheFilePath, {})
+            if data.get('version') == _CACHE_FILE_VERSION:
+                self._files = data.get('files', {})
+
+        maxWorkers = self._maxWorkers or min(32, mCore.platformLib.getPlatformInfo().effectiveCpuCount * 4)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(maxWorkers, len(self._roots)))) as executor:
+            scanned = list(executor.map(PackageRegistry._scanRoot, self._roots))
+
+        found           = set()
+        summary         = {'packages': 0, 'read': 0, 'removed': 0}
+        rootFiles       = {}
+
+        for root, files in zip(self._roots, scanned):
+
+            rootFiles[root] = [x[0] for x in files]
+
+            for filePath, mtime, size in files:
+                found.add(filePath)
+                if self._update(filePath, mtime, size):
+                    summary['read'] += 1
+
+        # Modules of the roots, which don't exist anymore, entries of other roots are kept in the cache
+        for filePath in list(self._files):
+            if filePath not in found and os.path.dirname(os.path.dirname(filePath)) in rootFiles:
+                del self._files[filePath]
+                summary['removed'] += 1
+
+        summary['packages'] = len(found)
+
+        self._rootFiles     = rootFiles
+        self._isRefreshed   = True
+
+        self._build()
+
+        if summary['read'] or summary['removed']:
+            self.save()
+
+        return summary
+
+    #
+    ## @brief Read given package again if it is changed.
+    #
+    #  Method can be used by file system watchers to update a single package without scanning the roots.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of a packageInfoLib module or the Python package, which contains it.
+    #
+    #  @exception N/A
+    #
+    #  @return mCore.packageRegistryLib.PackageInfo - Package.
+    #  @return None                                 - If the module doesn't exist or it isn't in the roots.
+    def refreshPackage(self, path):
+
+        self._ensureRefreshed()
+
+        info, isChanged = self._refreshPath(path)
+
+        if isChanged:
+            self._build()
+            self.save()
+
+        return info
+
+    #
+    ## @brief Read given packages again if they are changed.
+    #
+    #  Lookups are built and the cache file is written once for all the packages.
+    #
+    #  @param paths [ list of str | None | in  ] - Absolute paths of packageInfoLib modules or the Python packages, which contain them.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Number of changed, added or removed packages.
+    def refreshPackages(self, paths):
+
+        self._ensureRefreshed()
+
+        count = 0
+
+        for path in paths:
+            if self._refreshPath(path)[1]:
+                count += 1
+
+        if count:
+            self._build()
+            self.save()
+
+        return count
+
+    #
+    ## @brief Get current snapshot of the packages.
+    #
+    #  @exception N/A
+    #
+    #  @return mCore.packageRegistryLib.PackageSnapshot - Snapshot.
+    def snapshot(self):
+
+        self._ensureRefreshed()
+
+        return self._snapshot
+
+    #
+    ## @brief Write the registry into the cache file.
+    #
+    #  Modules modified within the granularity of file modification times aren't written, since
+    #  their modifications may not change their modification time.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result, False if cache isn't used.
+    def save(self):
+
+        if not self._cacheFilePath:
+            return False
+
+        racyTime    = (time.time() - _MTIME_GRANULARITY) * 1000000000
+        files       = dict([(k, v) for k, v in self._files.items() if v[0] < racyTime])
+
+        return mCore.cacheLib.writeJsonFile(self._cacheFilePath, {'version': _CACHE_FILE_VERSION, 'files': files})
+
+    #
+    ## @brief Get given package.
+    #
+    #  @param name [ str | None | in  ] - Name of the package.
+    #
+    #  @exception N/A
+    #
+    #  @return mCore.packageRegistryLib.PackageInfo - Package.
+    #  @return None                                 - If the package isn't found.
+    def package(self, name):
+
+        self._ensureRefreshed()
+
+        return self._packages.get(name)
+
+    #
+    ## @brief Get all the packages.
+    #
+    #  @exception N/A
+    #
+    #  @return list of mCore.packageRegistryLib.PackageInfo - Packages ordered by their names.
+    def packages(self):
+
+        self._ensureRefreshed()
+
+        return [self._packages[x] for x in sorted(self._packages)]
+
+    #
+    ## @brief Get the package, which contains given Python package.
+    #
+    #  @param name [ str | None | in  ] - Name of the Python package.
+    #
+    #  @exception N/A
+    #
+    #  @return mCore.packageRegistryLib.PackageInfo - Package.
+    #  @return None                                 - If the Python package doesn't belong to a package.
+    def findPythonPackage(self, name):
+
+        self._ensureRefreshed()
+
+        return self._pythonPackages.get(name)
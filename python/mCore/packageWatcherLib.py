@@ -0,0 +1,704 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/packageWatcherLib.py @brief [ FILE   ] - Package registry watcher.
+## @package mCore.packageWatcherLib    @brief [ MODULE ] - Package registry watcher.
+#
+#  Root directories of a package registry are watched with Linux inotify, directories are polled
+#  on other platforms. Only the packages, which are changed, are read again and the lookups of the
+#  registry are swapped in at once, readers use snapshots without locks.
+#
+# @code
+#
+#import mCore.packageRegistryLib
+#import mCore.packageWatcherLib
+#
+#watcher = mCore.packageWatcherLib.PackageWatcher(mCore.packageRegistryLib.PackageRegistry())
+#watcher.start()
+#
+#watcher.snapshot().package('mCore').version()
+# #1.0.0
+#
+#watcher.stop()
+#
+# @endcode
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import ctypes
+import os
+import select
+import struct
+import sys
+import threading
+import traceback
+
+import mCore.displayLib
+import mCore.enumAbs
+import mCore.packageRegistryLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ int ] - File was opened for writing and closed.
+IN_CLOSE_WRITE  = 0x00000008
+
+## [ int ] - File was moved out of the directory.
+IN_MOVED_FROM   = 0x00000040
+
+## [ int ] - File was moved into the directory.
+IN_MOVED_TO     = 0x00000080
+
+## [ int ] - File was created in the directory.
+IN_CREATE       = 0x00000100
+
+## [ int ] - File was deleted from the directory.
+IN_DELETE       = 0x00000200
+
+## [ int ] - Watched directory was deleted.
+IN_DELETE_SELF  = 0x00000400
+
+## [ int ] - Event queue overflowed, events are lost.
+IN_Q_OVERFLOW   = 0x00004000
+
+## [ int ] - Watch was removed.
+IN_IGNORED      = 0x00008000
+
+## [ int ] - Watch only directories.
+IN_ONLYDIR      = 0x01000000
+
+## [ int ] - Subject of the event is a directory.
+IN_ISDIR        = 0x40000000
+
+## [ int ] - Events watched on root directories.
+_ROOT_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_ONLYDIR
+
+## [ int ] - Events watched on package directories.
+_PACKAGE_MASK = IN_CLOSE_WRITE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF | IN_ONLYDIR
+
+## [ struct.Struct ] - Header of inotify events: watch descriptor, mask, cookie and length of the name.
+_EVENT_HEADER = struct.Struct('iIII')
+
+#
+## @brief [ ENUM CLASS ] - Watcher backend enum class.
+class Backend(mCore.enumAbs.Enum):
+
+    ## [ str ] - Linux inotify.
+    kInotify    = 'inotify'
+
+    ## [ str ] - Polling modification times.
+    kPolling    = 'polling'
+
+#
+## @brief Get inotify functions of the C library.
+#
+#  @exception N/A
+#
+#  @return ctypes.CDLL - C library.
+#  @return None        - If inotify isn't available.
+def _loadInotify():
+
+    if not sys.platform.startswith('linux'):
+        return None
+
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+    except OSError:
+        return None
+
+    if not hasattr(libc, 'inotify_init1') or not hasattr(libc, 'inotify_add_watch'):
+        return None
+
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+
+    return libc
+
+#
+## @brief List directories directly under given root directory.
+#
+#  @param root [ str | None | in  ] - Absolute path of the root directory.
+#
+#  @exception N/A
+#
+#  @return list of str - Absolute paths.
+def _listDirectories(root):
+
+    directories = []
+
+    try:
+        iterator = os.scandir(root)
+    except OSError:
+        return directories
+
+    with iterator:
+        for entry in iterator:
+            try:
+                if entry.is_dir():
+                    directories.append(entry.path)
+            except OSError:
+                continue
+
+    return directories
+
+#
+## @brief [ CLASS ] - Watches directories with Linux inotify.
+class _InotifyWatcher(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param libc  [ ctypes.CDLL | None | in  ] - C library.
+    #  @param roots [ list of str | None | in  ] - Absolute paths of the root directories.
+    #
+    #  @exception OSError - If inotify instance can't be created.
+    #
+    #  @return None - None.
+    def __init__(self, libc, roots):
+
+        ## [ ctypes.CDLL ] - C library.
+        self._libc          = libc
+
+        ## [ int ] - File descriptor of the inotify instance.
+        self._descriptor    = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+
+        if self._descriptor < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+
+        ## [ dict ] - Watch descriptors as keys and absolute paths of the directories and whether they are roots as values.
+        self._watches       = {}
+
+        ## [ set ] - Absolute paths of the root directories.
+        self._roots         = set(roots)
+
+        self._watchRoots()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Watch given directory.
+    #
+    #  @param path   [ str  | None | in  ] - Absolute path of the directory.
+    #  @param isRoot [ bool | None | in  ] - Whether the directory is a root directory.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def _addWatch(self, path, isRoot):
+
+        mask        = _ROOT_MASK if isRoot else _PACKAGE_MASK
+        descriptor  = self._libc.inotify_add_watch(self._descriptor, os.fsencode(path), mask)
+
+        if descriptor < 0:
+            return False
+
+        self._watches[descriptor] = (path, isRoot)
+
+        return True
+
+    #
+    ## @brief Watch the roots and the directories under them.
+    #
+    #  Watches are added again after events are lost, since events of created and removed directories
+    #  may be among them. Adding a watch for a watched directory returns its existing descriptor.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _watchRoots(self):
+
+        self._watches = {}
+
+        for root in self._roots:
+            self._addWatch(root, True)
+            for directory in _listDirectories(root):
+                self._addWatch(directory, False)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief File descriptor, which becomes readable when there are events.
+    #
+    #  @exception N/A
+    #
+    #  @return int - File descriptor.
+    def fileno(self):
+
+        return self._descriptor
+
+    #
+    ## @brief Read pending events.
+    #
+    #  @exception N/A
+    #
+    #  @return set of str - Absolute paths of the changed package directories.
+    #  @return None       - If events are lost and all the roots must be scanned, watches are added again in this case.
+    def read(self):
+
+        paths       = set()
+        overflow    = False
+
+        while True:
+
+            try:
+                data = os.read(self._descriptor, 65536)
+            except BlockingIOError:
+                break
+
+            offset = 0
+
+            while offset < len(data):
+
+                descriptor, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+
+                name    = data[offset + _EVENT_HEADER.size:offset + _EVENT_HEADER.size + length].rstrip(b'\0')
+                offset += _EVENT_HEADER.size + length
+
+                if mask & IN_Q_OVERFLOW:
+                    overflow = True
+                    continue
+
+                watch = self._watches.get(descriptor)
+                if watch is None:
+                    continue
+
+                if mask & IN_IGNORED:
+                    del self._watches[descriptor]
+                    continue
+
+                directory, isRoot = watch
+
+                if isRoot:
+
+                    if not mask & IN_ISDIR:
+                        continue
+
+                    path = os.path.join(directory, os.fsdecode(name))
+
+                    # New directory may already contain a packageInfoLib module, e.g. if it is moved in
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        self._addWatch(path, False)
+
+                    paths.add(path)
+
+                elif mask & IN_DELETE_SELF or os.fsdecode(name) == mCore.packageRegistryLib.PACKAGE_INFO_FILE_NAME:
+                    paths.add(directory)
+
+        if overflow:
+            self._watchRoots()
+            return None
+
+        return paths
+
+    #
+    ## @brief Close the inotify instance.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def close(self):
+
+        if self._descriptor >= 0:
+            os.close(self._descriptor)
+            self._descriptor = -1
+
+#
+## @brief [ CLASS ] - Watches directories by polling modification times.
+class _PollingWatcher(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param roots [ list of str | None | in  ] - Absolute paths of the root directories.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, roots):
+
+        ## [ dict ] - Absolute paths of the root directories as keys and their modification times as values.
+        self._roots     = dict([(x, None) for x in roots])
+
+        ## [ dict ] - Absolute paths of the package directories as keys and modification time and size of their packageInfoLib modules as values.
+        self._stamps    = {}
+
+        # Initial state isn't a change
+        self.read()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get modification time and size of the packageInfoLib module in given directory.
+    #
+    #  @param directory [ str | None | in  ] - Absolute path of the directory.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Modification time and size, None if the module doesn't exist.
+    @staticmethod
+    def _getStamp(directory):
+
+        try:
+            stat = os.stat(os.path.join(directory, mCore.packageRegistryLib.PACKAGE_INFO_FILE_NAME))
+        except OSError:
+            return None
+
+        return stat.st_mtime_ns, stat.st_size
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Find changes since the last call.
+    #
+    #  Roots are listed again only if their modification time is changed, packageInfoLib modules of
+    #  known directories are checked with a single stat call each.
+    #
+    #  @exception N/A
+    #
+    #  @return set of str - Absolute paths of the changed package directories.
+    def read(self):
+
+        paths   = set()
+        stamps  = self._stamps
+
+        for root, previousTime in list(self._roots.items()):
+
+            try:
+                mtime = os.stat(root).st_mtime_ns
+            except OSError:
+                mtime = None
+
+            if mtime == previousTime:
+                continue
+
+            self._roots[root] = mtime
+
+            directories = set(_listDirectories(root))
+
+            for directory in [x for x in stamps if os.path.dirname(x) == root and x not in directories]:
+                del stamps[directory]
+                paths.add(directory)
+
+            for directory in directories:
+                if directory not in stamps:
+                    stamps[directory] = _PollingWatcher._getStamp(directory)
+                    paths.add(directory)
+
+        for directory, previousStamp in list(stamps.items()):
+
+            if directory in paths:
+                continue
+
+            stamp = _PollingWatcher._getStamp(directory)
+
+            if stamp != previousStamp:
+                stamps[directory] = stamp
+                paths.add(directory)
+
+        return paths
+
+    #
+    ## @brief File descriptor, polling watchers don't have one.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def fileno(self):
+
+        return None
+
+    #
+    ## @brief Close the watcher.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def close(self):
+
+        self._stamps = {}
+
+#
+## @brief [ CLASS ] - Keeps a package registry up to date as its root directories change.
+#
+#  Only the packages in changed directories are read again through
+#  mCore.packageRegistryLib.PackageRegistry.refreshPackages, roots are scanned again only if inotify
+#  reports lost events. Registry is only updated by the thread of the watcher once it is started,
+#  readers call snapshot method and use the returned snapshot, which never changes.
+class PackageWatcher(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param registry [ mCore.packageRegistryLib.PackageRegistry | None  | in  ] - Package registry.
+    #  @param interval [ float                                    | 1.0   | in  ] - Seconds between polls if inotify isn't used.
+    #  @param latency  [ float                                    | 0.05  | in  ] - Seconds to wait for more events after an event, so bursts of events are handled at once.
+    #  @param backend  [ str                                      | None  | in  ] - Value of mCore.packageWatcherLib.Backend, inotify is used if it is available and not provided.
+    #  @param onChange [ function                                 | None  | in  ] - Function called with the new snapshot and the changed directories after each update.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, registry, interval=1.0, latency=0.05, backend=None, onChange=None):
+
+        ## [ mCore.packageRegistryLib.PackageRegistry ] - Package registry.
+        self._registry  = registry
+
+        ## [ float ] - Seconds between polls.
+        self._interval  = interval
+
+        ## [ float ] - Seconds to wait for more events after an event.
+        self._latency   = latency
+
+        ## [ str ] - Requested backend.
+        self._backend   = backend
+
+        ## [ function ] - Function called after each update.
+        self._onChange  = onChange
+
+        ## [ object ] - Backend watcher.
+        self._watcher   = None
+
+        ## [ mCore.packageRegistryLib.PackageSnapshot ] - Current snapshot.
+        self._snapshot  = None
+
+        ## [ threading.Thread ] - Watcher thread.
+        self._thread    = None
+
+        ## [ threading.Event ] - Event set to stop the thread.
+        self._stopEvent = threading.Event()
+
+        ## [ tuple ] - File descriptors of the pipe used to wake the thread up.
+        self._wakePipe  = None
+
+        ## [ bool ] - Whether the roots must be scanned on the next poll since changes may have been lost.
+        self._isRefreshNeeded = False
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create the backend watcher.
+    #
+    #  @exception ValueError - If requested backend isn't available.
+    #
+    #  @return None - None.
+    def _createWatcher(self):
+
+        roots = self._registry.roots()
+
+        if self._backend in (None, Backend.kInotify):
+
+            libc = _loadInotify()
+
+            if libc is not None:
+                try:
+                    self._watcher = _InotifyWatcher(libc, roots)
+                    return
+                except OSError:
+                    pass
+
+            if self._backend == Backend.kInotify:
+                raise ValueError('inotify is not available')
+
+        self._watcher = _PollingWatcher(roots)
+
+    #
+    ## @brief Run the watcher loop until it is stopped.
+    #
+    #  Errors raised while handling changes are displayed and the loop continues, the roots are
+    #  scanned on the next poll since changes being handled are lost.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _run(self):
+
+        descriptor = self._watcher.fileno()
+
+        while not self._stopEvent.is_set():
+
+            if descriptor is None:
+                self._stopEvent.wait(self._interval)
+            else:
+                timeout  = self._interval if self._isRefreshNeeded else None
+                readable = select.select([descriptor, self._wakePipe[0]], [], [], timeout)[0]
+                if self._wakePipe[0] in readable:
+                    break
+
+                if readable:
+                    self._stopEvent.wait(self._latency)
+
+            if self._stopEvent.is_set():
+                break
+
+            try:
+                self.poll()
+            except Exception:
+                self._isRefreshNeeded = True
+                mCore.displayLib.Display.displayFailure('Package watcher failed to handle changes:\n{}'.format(traceback.format_exc()), stdErr=True)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Package registry.
+    #
+    #  @exception N/A
+    #
+    #  @return mCore.packageRegistryLib.PackageRegistry - Registry.
+    def registry(self):
+
+        return self._registry
+
+    #
+    ## @brief Backend in use.
+    #
+    #  @exception N/A
+    #
+    #  @return str  - Value of mCore.packageWatcherLib.Backend.
+    #  @return None - If the watcher isn't started.
+    def backend(self):
+
+        if self._watcher is None:
+            return None
+
+        return Backend.kPolling if isinstance(self._watcher, _PollingWatcher) else Backend.kInotify
+
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get current snapshot of the packages, method doesn't lock.
+    #
+    #  @exception N/A
+    #
+    #  @return mCore.packageRegistryLib.PackageSnapshot - Snapshot.
+    def snapshot(self):
+
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._snapshot = self._registry.snapshot()
+
+        return snapshot
+
+    #
+    ## @brief Start watching the roots.
+    #
+    #  @param useThread [ bool | True | in  ] - Whether to handle changes in a thread, poll method must be called otherwise.
+    #
+    #  @exception ValueError - If requested backend isn't available.
+    #
+    #  @return None - None.
+    def start(self, useThread=True):
+
+        if self._watcher is not None:
+            return
+
+        # Watches are added before the registry is refreshed, so changes in between aren't lost
+        self._createWatcher()
+        self._registry.refresh()
+        self._snapshot = self._registry.snapshot()
+
+        if not useThread:
+            return
+
+        self._stopEvent.clear()
+        self._wakePipe  = os.pipe()
+        self._thread    = threading.Thread(target=self._run, name='PackageWatcher')
+
+        self._thread.daemon = True
+        self._thread.start()
+
+    #
+    ## @brief Stop watching the roots.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def stop(self):
+
+        self._stopEvent.set()
+
+        if self._thread is not None:
+            os.write(self._wakePipe[1], b'\0')
+            self._thread.join()
+            self._thread = None
+
+        if self._wakePipe is not None:
+            for descriptor in self._wakePipe:
+                os.close(descriptor)
+            self._wakePipe = None
+
+        if self._watcher is not None:
+            self._watcher.close()
+            self._watcher = None
+
+    #
+    ## @brief Handle pending changes.
+    #
+    #  @exception N/A
+    #
+    #  @return set of str - Absolute paths of the changed package directories, None if all the roots are scanned.
+    def poll(self):
+
+        paths = self._watcher.read()
+
+        if paths is None or self._isRefreshNeeded:
+            paths = None
+            self._registry.refresh()
+            self._isRefreshNeeded = False
+        elif not paths or not self._registry.refreshPackages(paths):
+            return paths
+
+        self._snapshot = self._registry.snapshot()
+
+        if self._onChange:
+            self._onChange(self._snapshot, paths)
+
+        return paths
@@ -0,0 +1,347 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/pathListLib.py @brief [ FILE   ] - Path list variables.
+## @package mCore.pathListLib    @brief [ MODULE ] - Path list variables.
+#
+# @code
+#
+#import mCore.pathListLib
+#
+#pathList = mCore.pathListLib.PathList.fromEnvironment('PYTHONPATH')
+#
+#pathList.prepend(['/tools/mCore/python', '/tools/mAsset/python'])
+#pathList.append('/usr/lib/python3/dist-packages/')
+#
+#pathList.setEnvironment('PYTHONPATH')
+#
+#pathList.pruned()
+# #1
+#
+# @endcode
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import collections
+import os
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Ordered list of paths without duplicates such as PATH and PYTHONPATH.
+#
+#  Paths are kept in an ordered dictionary keyed by their normalized form, so prepending,
+#  appending, removing and checking a path take constant time.
+#
+#  Duplicates are resolved the way path lookups do: prepending an existing path moves it to the
+#  beginning, appending an existing path keeps it where it is, since the later copy would never be
+#  reached. Dropped duplicates and empty entries are counted as pruned.
+class PathList(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param paths     [ str, list of str | None       | in  ] - Paths, str is split by the separator.
+    #  @param separator [ str              | os.pathsep | in  ] - Separator of the paths.
+    #  @param normalize [ bool             | True       | in  ] - Whether to normalize paths, case is normalized on case insensitive platforms.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, paths=None, separator=os.pathsep, normalize=True):
+
+        ## [ str ] - Separator of the paths.
+        self._separator = separator
+
+        ## [ bool ] - Whether to normalize paths.
+        self._normalize = normalize
+
+        ## [ collections.OrderedDict ] - Keys of the paths as keys and paths as values.
+        self._paths     = collections.OrderedDict()
+
+        ## [ int ] - Number of pruned duplicates and empty entries.
+        self._pruned    = 0
+
+        if paths:
+            self.append(paths)
+
+    #
+    ## @brief Get whether given path is in the list.
+    #
+    #  @param path [ str | None | in  ] - Path.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def __contains__(self, path):
+
+        item = self._normalizePath(path)
+
+        return item is not None and item[0] in self._paths
+
+    #
+    ## @brief Get the number of paths.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Number of paths.
+    def __len__(self):
+
+        return len(self._paths)
+
+    #
+    ## @brief Iterate over the paths.
+    #
+    #  @exception N/A
+    #
+    #  @return iterator - Paths.
+    def __iter__(self):
+
+        return iter(self._paths.values())
+
+    #
+    ## @brief String representation.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Representation.
+    def __repr__(self):
+
+        return '<PathList {}>'.format(self.toString())
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Normalize given path.
+    #
+    #  @param path [ str | None | in  ] - Path.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Key and the path.
+    #  @return None  - If the path is empty.
+    def _normalizePath(self, path):
+
+        path = path.strip()
+        if not path:
+            return None
+
+        if not self._normalize:
+            return path, path
+
+        path = os.path.normpath(path)
+
+        return os.path.normcase(path), path
+
+    #
+    ## @brief Split given paths.
+    #
+    #  @param paths [ str, list of str | None | in  ] - Paths, str is split by the separator.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Paths.
+    def _splitPaths(self, paths):
+
+        if isinstance(paths, str):
+            return paths.split(self._separator)
+
+        return paths
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Number of pruned duplicates and empty entries.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Number.
+    def pruned(self):
+
+        return self._pruned
+
+    #
+    ## @brief Separator of the paths.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Separator.
+    def separator(self):
+
+        return self._separator
+
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Add given paths to the beginning.
+    #
+    #  Order of given paths is kept, first one becomes the first path of the list.
+    #
+    #  @param paths [ str, list of str | None | in  ] - Paths, str is split by the separator.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Number of added paths, which weren't in the list.
+    def prepend(self, paths):
+
+        added = 0
+
+        for path in reversed(self._splitPaths(paths)):
+
+            item = self._normalizePath(path)
+            if item is None:
+                self._pruned += 1
+                continue
+
+            if item[0] in self._paths:
+                self._pruned += 1
+            else:
+                self._paths[item[0]] = item[1]
+                added += 1
+
+            self._paths.move_to_end(item[0], last=False)
+
+        return added
+
+    #
+    ## @brief Add given paths to the end.
+    #
+    #  @param paths [ str, list of str | None | in  ] - Paths, str is split by the separator.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Number of added paths, which weren't in the list.
+    def append(self, paths):
+
+        added = 0
+
+        for path in self._splitPaths(paths):
+
+            item = self._normalizePath(path)
+
+            if item is None or item[0] in self._paths:
+                self._pruned += 1
+                continue
+
+            self._paths[item[0]] = item[1]
+            added += 1
+
+        return added
+
+    #
+    ## @brief Remove given path.
+    #
+    #  @param path [ str | None | in  ] - Path.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether the path was in the list.
+    def remove(self, path):
+
+        item = self._normalizePath(path)
+
+        return item is not None and self._paths.pop(item[0], None) is not None
+
+    #
+    ## @brief Get the paths.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Paths.
+    def toList(self):
+
+        return list(self._paths.values())
+
+    #
+    ## @brief Join the paths by the separator.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Paths.
+    def toString(self):
+
+        return self._separator.join(self._paths.values())
+
+    #
+    ## @brief Set given environment variable to the paths.
+    #
+    #  Variable is removed if the list is empty.
+    #
+    #  @param name        [ str  | None       | in  ] - Name of the environment variable.
+    #  @param environment [ dict | os.environ | in  ] - Environment.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Value of the variable.
+    def setEnvironment(self, name, environment=None):
+
+        if environment is None:
+            environment = os.environ
+
+        value = self.toString()
+
+        if value:
+            environment[name] = value
+        else:
+            environment.pop(name, None)
+
+        return value
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # CLASS METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Create a list from given environment variable.
+    #
+    #  @param cls         [ object | None       | in  ] - Class object.
+    #  @param name        [ str    | None       | in  ] - Name of the environment variable.
+    #  @param environment [ dict   | os.environ | in  ] - Environment.
+    #  @param kwargs      [ dict   | None       | in  ] - Keyword arguments of the constructor.
+    #
+    #  @exception N/A
+    #
+    #  @return mCore.pathListLib.PathList - List.
+    @classmethod
+    def fromEnvironment(cls, name, environment=None, **kwargs):
+
+        if environment is None:
+            environment = os.environ
+
+        return cls(environment.get(name, ''), **kwargs)
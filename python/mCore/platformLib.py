@@ -25,6 +25,9 @@
 # ----------------------------------------------------------------------------------------------------
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
+import collections
+import mmap
+import os
 import platform
 
 import mCore.enumAbs
@@ -48,8 +51,293 @@ class Name(mCore.enumAbs.Enum):
     ## [ str ] - Windows.
     kWindows = 'Windows'
 
+#
+## @brief [ CLASS ] - Immutable snapshot of platform and hardware facts.
+#
+#  Snapshot of the current process is created once, see mCore.platformLib.getPlatformInfo.
+#  Facts are plain attributes:
+#
+#  system            [ str          ] - Platform name, one of the following, Darwin, Linux, Windows.
+#  release           [ str          ] - Release of the platform.
+#  machine           [ str          ] - Machine type, such as x86_64.
+#  isWindows         [ bool         ] - Whether current platform is Windows.
+#  isWindows10       [ bool         ] - Whether current platform is Windows 10.
+#  isLinux           [ bool         ] - Whether current platform is Linux.
+#  isDarwin          [ bool         ] - Whether current platform is OSX.
+#  others            [ tuple of str ] - All platform names but the current one.
+#  cpuCount          [ int          ] - Number of logical CPUs of the host.
+#  availableCpuCount [ int          ] - Number of logical CPUs the process is allowed to run on.
+#  cpuQuota          [ float, None  ] - CPU quota of the cgroup in CPUs, None if there is no quota.
+#  effectiveCpuCount [ int          ] - Number of CPUs the process can use, based on available CPUs and CPU quota.
+#  memoryLimit       [ int, None    ] - Memory limit of the cgroup in bytes, None if there is no limit.
+#  pageSize          [ int          ] - Memory page size in bytes.
+#
+#  @code
+#import mCore.platformLib
+#
+#info = mCore.platformLib.getPlatformInfo()
+#
+#info.isLinux
+# #True
+#
+#info.effectiveCpuCount
+# #4
+#  @endcode
+class PlatformInfo(collections.namedtuple('PlatformInfo', ('system',
+                                                           'release',
+                                                           'machine',
+                                                           'isWindows',
+                                                           'isWindows10',
+                                                           'isLinux',
+                                                           'isDarwin',
+                                                           'others',
+                                                           'cpuCount',
+                                                           'availableCpuCount',
+                                                           'cpuQuota',
+                                                           'effectiveCpuCount',
+                                                           'memoryLimit',
+                                                           'pageSize'))):
+
+    __slots__ = ()
+
+## [ str ] - Root directory of cgroup file system.
+_CGROUP_ROOT = '/sys/fs/cgroup'
+
+## [ str ] - File, which lists the cgroups of the current process.
+_PROC_CGROUP_FILE = '/proc/self/cgroup'
+
+## [ int ] - Limits greater than this value mean no limit for cgroup v1.
+_CGROUP_UNLIMITED = 2 ** 60
+
+## [ mCore.platformLib.PlatformInfo ] - Snapshot of the current process.
+_PLATFORM_INFO = None
+
+#
+## @brief Read given file.
+#
+#  @param filePath [ str | None | in  ] - Absolute path of the file.
+#
+#  @exception N/A
+#
+#  @return str  - Content of the file.
+#  @return None - If the file can't be read.
+def _readFile(filePath):
+
+    try:
+        with open(filePath) as _file:
+            return _file.read().strip()
+    except (IOError, OSError):
+        return None
+
+#
+## @brief Parse given cgroup limit.
+#
+#  @param text [ str | None | in  ] - Text.
+#
+#  @exception N/A
+#
+#  @return int  - Limit.
+#  @return None - If the text is not a positive integer.
+def _parseCgroupLimit(text):
+
+    try:
+        value = int(text)
+    except (TypeError, ValueError):
+        return None
+
+    return value if value > 0 else None
+
+#
+## @brief Get the directories of the cgroup of the current process for given controller.
+#
+#  Directories of the cgroup path are listed first, root directories are listed last since cgroup
+#  paths are usually not visible in containers.
+#
+#  @param controller [ str | None | in  ] - Controller such as cpu or memory, empty string for cgroup v2.
+#
+#  @exception N/A
+#
+#  @return list of str - Absolute paths of the directories.
+def _getCgroupDirectories(controller):
+
+    base        = os.path.join(_CGROUP_ROOT, controller) if controller else _CGROUP_ROOT
+    directories = []
+
+    for line in (_readFile(_PROC_CGROUP_FILE) or '').splitlines():
+
+        parts = line.split(':', 2)
+        if len(parts) != 3:
+            continue
+
+        if controller in parts[1].split(',') or (not controller and parts[0] == '0'):
+            directories.append(os.path.join(base, parts[2].lstrip('/')))
+
+    directories.append(base)
+
+    return directories
+
+#
+## @brief Get CPU quota of the cgroup of the current process.
+#
+#  Values, which can't be parsed, are treated as no quota.
+#
+#  @exception N/A
+#
+#  @return float - Quota in CPUs.
+#  @return None  - If there is no quota.
+def _getCgroupCpuQuota():
+
+    for directory in _getCgroupDirectories(''):
+
+        data = _readFile(os.path.join(directory, 'cpu.max'))
+        if data is None:
+            continue
+
+        quota, _, period = data.partition(' ')
+        quota            = _parseCgroupLimit(quota)
+        period           = _parseCgroupLimit(period)
+
+        if quota is None or period is None:
+            return None
+
+        return quota / float(period)
+
+    for directory in _getCgroupDirectories('cpu'):
+
+        quota  = _readFile(os.path.join(directory, 'cpu.cfs_quota_us'))
+        period = _readFile(os.path.join(directory, 'cpu.cfs_period_us'))
+
+        if quota is None or period is None:
+            continue
+
+        quota  = _parseCgroupLimit(quota)
+        period = _parseCgroupLimit(period)
+
+        if quota is None or period is None:
+            return None
+
+        return quota / float(period)
+
+    return None
+
+#
+## @brief Get memory limit of the cgroup of the current process.
+#
+#  Values, which can't be parsed, are treated as no limit.
+#
+#  @exception N/A
+#
+#  @return int  - Limit in bytes.
+#  @return None - If there is no limit.
+def _getCgroupMemoryLimit():
+
+    for directory in _getCgroupDirectories(''):
+
+        data = _readFile(os.path.join(directory, 'memory.max'))
+        if data is None:
+            continue
+
+        return _parseCgroupLimit(data)
+
+    for directory in _getCgroupDirectories('memory'):
+
+        data = _readFile(os.path.join(directory, 'memory.limit_in_bytes'))
+        if data is None:
+            continue
+
+        limit = _parseCgroupLimit(data)
+
+        return None if limit is None or limit >= _CGROUP_UNLIMITED else limit
+
+    return None
+
+#
+## @brief Get memory page size.
+#
+#  @exception N/A
+#
+#  @return int - Page size in bytes.
+def _getPageSize():
+
+    try:
+        return os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        return mmap.PAGESIZE
+
+#
+## @brief Create platform info snapshot of the current process.
+#
+#  @exception N/A
+#
+#  @return mCore.platformLib.PlatformInfo - Snapshot.
+def _createPlatformInfo():
+
+    # platform module calls os.uname on POSIX platforms anyway
+    if hasattr(os, 'uname'):
+        system, _, release, _, machine = os.uname()
+    else:
+        system, release, machine = platform.system(), platform.release(), platform.machine()
+
+    isWindows10 = False
+    if system == Name.kWindows:
+        try:
+            isWindows10 = int(str(release).split('.')[:1][0]) > 10
+        except ValueError:
+            isWindows10 = False
+
+    others = Name.listAttributes(stringOnly=True, getValues=True, removeK=True)
+    if system in others:
+        others.pop(others.index(system))
+
+    cpuCount = os.cpu_count() or 1
+
+    try:
+        availableCpuCount = len(os.sched_getaffinity(0))
+    except AttributeError:
+        availableCpuCount = cpuCount
+
+    cpuQuota          = _getCgroupCpuQuota() if system == Name.kLinux else None
+    effectiveCpuCount = availableCpuCount
+
+    if cpuQuota is not None:
+        effectiveCpuCount = max(1, min(effectiveCpuCount, int(-(-cpuQuota // 1))))
+
+    return PlatformInfo(system=system,
+                        release=release,
+                        machine=machine,
+                        isWindows=system == Name.kWindows,
+                        isWindows10=isWindows10,
+                        isLinux=system == Name.kLinux,
+                        isDarwin=system == Name.kDarwin,
+                        others=tuple(others),
+                        cpuCount=cpuCount,
+                        availableCpuCount=availableCpuCount,
+                        cpuQuota=cpuQuota,
+                        effectiveCpuCount=effectiveCpuCount,
+                        memoryLimit=_getCgroupMemoryLimit() if system == Name.kLinux else None,
+                        pageSize=_getPageSize())
+
+#
+## @brief Get platform info snapshot of the current process.
+#
+#  Snapshot is created once for the process.
+#
+#  @exception N/A
+#
+#  @return mCore.platformLib.PlatformInfo - Snapshot.
+def getPlatformInfo():
+
+    global _PLATFORM_INFO
+
+    if _PLATFORM_INFO is None:
+        _PLATFORM_INFO = _createPlatformInfo()
+
+    return _PLATFORM_INFO
+
 #
 ## @brief [ CLASS ] - Platform related class.
+#
+#  Results are read from mCore.platformLib.PlatformInfo snapshot of the current process.
 class Platform(object):
     #
     # ------------------------------------------------------------------------------------------------
@@ -64,7 +352,7 @@ class Platform(object):
     @staticmethod
     def isWindows():
 
-        return platform.system() == Name.kWindows
+        return getPlatformInfo().isWindows
 
     #
     ## @brief Check whether current platform is Windows 10.
@@ -75,10 +363,7 @@ class Platform(object):
     @staticmethod
     def isWindows10():
 
-        if platform.system() != Name.kWindows:
-            return False
-
-        return int(str(platform.release()).split('.')[:1][0]) > 10
+        return getPlatformInfo().isWindows10
 
     #
     ## @brief Check whether current platform is Linux.
@@ -89,7 +374,7 @@ class Platform(object):
     @staticmethod
     def isLinux():
 
-        return platform.system() == Name.kLinux
+        return getPlatformInfo().isLinux
 
     #
     ## @brief Check whether current platform is OSX.
@@ -100,7 +385,7 @@ class Platform(object):
     @staticmethod
     def isDarwin():
 
-        return platform.system() == Name.kDarwin
+        return getPlatformInfo().isDarwin
 
     #
     ## @brief Get the name of current platform.
@@ -113,7 +398,7 @@ class Platform(object):
     @staticmethod
     def system():
 
-        return platform.system()
+        return getPlatformInfo().system
 
     #
     ## @brief Get all platform names but the current one.
@@ -124,10 +409,15 @@ class Platform(object):
     @staticmethod
     def getOthers():
 
-        platformList = Name.listAttributes(stringOnly=True,
-                                           getValues=True,
-                                           removeK=True)
+        return list(getPlatformInfo().others)
 
-        platformList.pop(platformList.index(Platform.system()))
+    #
+    ## @brief Get platform info snapshot of the current process.
+    #
+    #  @exception N/A
+    #
+    #  @return mCore.platformLib.PlatformInfo - Snapshot.
+    @staticmethod
+    def info():
 
-        return platformList
+        return getPlatformInfo()
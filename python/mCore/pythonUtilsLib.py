@@ -25,11 +25,18 @@
 # ----------------------------------------------------------------------------------------------------
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
+import  concurrent.futures
+import  importlib.util
 import  os
+import  py_compile
+import  struct
 import  sys
+import  time
 
-import  mFileSystem.directoryLib
-import  mFileSystem.fileLib
+import  mCore.cacheLib
+import  mCore.displayLib
+import  mCore.enumAbs
+import  mCore.platformLib
 
 
 #
@@ -88,21 +95,412 @@ def createPythonModule(path, name='__init__.py', content=None):
 
     return pythonModuleFilePath
 
+#
+## @brief [ ENUM CLASS ] - Scaffolding operation enum class.
+class ScaffoldOperation(mCore.enumAbs.Enum):
+
+    ## [ str ] - Create a directory and its missing parent directories.
+    kMakeDirectories = 'makedirs'
+
+    ## [ str ] - Create a file if it doesn't exist.
+    kCreateFile      = 'create'
+
+#
+## @brief Get directory and file operations needed to create Python packages in given spec.
+#
+#  Only leaf directories are created since creating a directory creates its parents too. Each package,
+#  including the ones nested packages are created in, gets an __init__.py file.
+#
+#  @param path                  [ str  | None | in  ] - Absolute path, where the Python packages will be created.
+#  @param spec                  [ dict | None | in  ] - Spec, see createPythonPackages function.
+#  @param createUnitTestPackage [ bool | None | in  ] - Whether to create unit test Python package under Python packages.
+#
+#  @exception ValueError - If a package path in the spec is absolute or outside of `path`.
+#  @exception ValueError - If a module name in the spec is not a file name.
+#
+#  @return list of tuple - Operation from ScaffoldOperation enum class, absolute path and content for files.
+def _getScaffoldOperations(path, spec, createUnitTestPackage):
+
+    files       = {}
+    directories = set()
+
+    for package, modules in spec.items():
+
+        package = os.path.normpath(package.replace('/', os.sep))
+        if os.path.isabs(package) or package == os.pardir or package.startswith(os.pardir + os.sep):
+            raise ValueError('Package path {} should be relative and inside {}'.format(package, path))
+
+        packagePath = path if package == os.curdir else os.path.join(path, package)
+
+        for name, content in (modules or {}).items():
+
+            if not name or '/' in name or os.sep in name or name in (os.curdir, os.pardir):
+                raise ValueError('Module name {} should be a file name, use package paths for nested packages'.format(name))
+
+            files[os.path.join(packagePath, name)] = content
+
+        packageDirectories = [packagePath]
+        if createUnitTestPackage and os.path.basename(package) != 'tests':
+            packageDirectories.append(os.path.join(packagePath, 'tests'))
+
+        for directory in packageDirectories:
+
+            directories.add(directory)
+
+            while directory != path:
+                files.setdefault(os.path.join(directory, '__init__.py'), None)
+                directory = os.path.dirname(directory)
+
+    directories = sorted(directories)
+    leaves      = [x for i, x in enumerate(directories) if i + 1 == len(directories) or not directories[i + 1].startswith(x + os.sep)]
+
+    operations = [(ScaffoldOperation.kMakeDirectories, x, None) for x in leaves]
+    operations.extend([(ScaffoldOperation.kCreateFile, x, files[x]) for x in sorted(files)])
+
+    return operations
+
+#
+## @brief Create given files exclusively.
+#
+#  @param files [ list of tuple | None | in  ] - Absolute paths and content of the files.
+#
+#  @exception N/A
+#
+#  @return list of bool - Whether each file is created, False if it exists.
+def _createFiles(files):
+
+    created = []
+
+    for filePath, content in files:
+
+        try:
+            _file = open(filePath, 'x')
+        except FileExistsError:
+            created.append(False)
+            continue
+
+        with _file:
+            if content:
+                _file.write(content)
+
+        created.append(True)
+
+    return created
+
+#
+## @brief Create Python packages and modules in given spec.
+#
+#  Spec is a dict, which contains relative paths of Python packages as keys and dicts with names and
+#  content of the Python modules as values.
+#
+#  @code
+#  createPythonPackages('/tools', {'mAsset'          : {'assetLib.py': 'NAME = 1\n'},
+#                                  'mAsset/exporters': None})
+#  @endcode
+#
+#  Behaviour is the same as createPythonPackage and createPythonModule functions, existing files
+#  aren't modified. Operations are computed without touching the file system; leaf directories are
+#  created concurrently first, files are then created concurrently without checking their existence
+#  beforehand, so each file costs a single file system round trip.
+#
+#  @param path                  [ str  | None  | in  ] - Path, where the Python packages will be created.
+#  @param spec                  [ dict | None  | in  ] - Spec.
+#  @param createUnitTestPackage [ bool | True  | in  ] - Whether to create unit test Python package under Python packages.
+#  @param dryRun                [ bool | False | in  ] - Only return the operations, which would be performed.
+#  @param maxWorkers            [ int  | None  | in  ] - Number of threads, based on CPUs available to the process if not provided.
+#
+#  @exception ValueError - If a package path in the spec is absolute or outside of `path`.
+#  @exception ValueError - If a module name in the spec is not a file name.
+#
+#  @return list of tuple - Operation from ScaffoldOperation enum class and absolute path. Files, which exist, are excluded if `dryRun` is False.
+def createPythonPackages(path, spec, createUnitTestPackage=True, dryRun=False, maxWorkers=None):
+
+    operations = _getScaffoldOperations(os.path.abspath(path), spec, createUnitTestPackage)
+
+    if dryRun:
+        return [x[:2] for x in operations]
+
+    directories = [x[1] for x in operations if x[0] == ScaffoldOperation.kMakeDirectories]
+    files       = [x for x in operations if x[0] == ScaffoldOperation.kCreateFile]
+
+    if not maxWorkers:
+        maxWorkers = min(32, mCore.platformLib.getPlatformInfo().effectiveCpuCount * 4)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+
+        for future in [executor.submit(os.makedirs, x, exist_ok=True) for x in directories]:
+            future.result()
+
+        # Spread files over the threads evenly in a few batches to keep task overhead low
+        batchSize = max(1, -(-len(files) // (maxWorkers * 4)))
+        created   = [executor.submit(_createFiles, [x[1:] for x in files[x:x + batchSize]]) for x in range(0, len(files), batchSize)]
+        created   = [y for x in created for y in x.result()]
+
+    result = [(ScaffoldOperation.kMakeDirectories, x) for x in directories]
+    result.extend([x[:2] for x, isCreated in zip(files, created) if isCreated])
+
+    return result
+
+## [ tuple of str ] - Extensions of Python object files.
+PYTHON_OBJECT_EXTENSIONS = ('.pyc', '.pyo')
+
+## [ int ] - Number of files removed by a single task.
+_REMOVE_BATCH_SIZE = 256
+
+## [ str ] - Name of the manifest file of removeStalePythonObjects function in cache directory.
+STALE_MANIFEST_FILE_NAME = 'pythonObjectManifest.json'
+
+## [ int ] - Version of the manifest file.
+_STALE_MANIFEST_VERSION = 1
+
+## [ int ] - Seconds, which modification time of a directory may lag behind its changes.
+_MTIME_GRANULARITY = 2
+
+## [ tuple of int ] - Optimization levels supported by compilePythonObjects function.
+OPTIMIZATION_LEVELS = (0, 1, 2)
+
+## [ int ] - Number of source files compiled by a single task.
+_COMPILE_BATCH_SIZE = 64
+
+#
+## @brief Get given paths without duplicates and paths nested in other paths.
+#
+#  Paths, which are not directories, are skipped.
+#
+#  @param paths [ list of str | None | in  ] - Paths.
+#
+#  @exception N/A
+#
+#  @return list of str - Real paths of the directories.
+def _getRootDirectories(paths):
+
+    directories = sorted(set([os.path.realpath(x) for x in paths if x and os.path.isdir(x)]))
+    roots       = []
+
+    for directory in directories:
+
+        if roots and (directory == roots[-1] or directory.startswith(roots[-1].rstrip(os.sep) + os.sep)):
+            continue
+
+        roots.append(directory)
+
+    return roots
+
+#
+## @brief Walk given directories and collect Python object files.
+#
+#  Each directory is listed once, symbolic links to directories are not followed.
+#
+#  @param roots [ list of str | None | in  ] - Absolute paths of the directories.
+#
+#  @exception N/A
+#
+#  @return tuple - List of Python object files outside of __pycache__ directories and list of __pycache__ directories.
+def _collectPythonObjects(roots):
+
+    files       = []
+    cacheDirs   = []
+    stack       = list(roots)
+
+    while stack:
+
+        directory = stack.pop()
+
+        try:
+            iterator = os.scandir(directory)
+        except OSError:
+            continue
+
+        with iterator:
+
+            for entry in iterator:
+
+                try:
+                    isDirectory = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+
+                if isDirectory:
+                    if entry.name == '__pycache__':
+                        cacheDirs.append(entry.path)
+                    else:
+                        stack.append(entry.path)
+
+                elif entry.name.endswith(PYTHON_OBJECT_EXTENSIONS):
+                    files.append(entry.path)
+
+    return files, cacheDirs
+
+#
+## @brief Remove given files.
+#
+#  @param files [ list of str | None | in  ] - Absolute paths of the files.
+#
+#  @exception N/A
+#
+#  @return tuple - List of removed files, total size of removed files in bytes and number of errors.
+def _removeFiles(files):
+
+    removed = []
+    size    = 0
+    errors  = 0
+
+    for filePath in files:
+
+        try:
+            fileSize = os.lstat(filePath).st_size
+            os.remove(filePath)
+        except OSError:
+            errors += 1
+            continue
+
+        removed.append(filePath)
+        size += fileSize
+
+    return removed, size, errors
+
+#
+## @brief Remove Python object files in given __pycache__ directory and the directory itself if it becomes empty.
+#
+#  @param directory [ str | None | in  ] - Absolute path of the __pycache__ directory.
+#
+#  @exception N/A
+#
+#  @return tuple - List of removed files, total size of removed files in bytes, number of errors and whether the directory is removed.
+def _removeCacheDirectory(directory):
+
+    try:
+        files = [x.path for x in os.scandir(directory) if x.name.endswith(PYTHON_OBJECT_EXTENSIONS)]
+    except OSError:
+        return [], 0, 1, False
+
+    removed, size, errors = _removeFiles(files)
+
+    try:
+        os.rmdir(directory)
+    except OSError:
+        return removed, size, errors, False
+
+    return removed, size, errors, True
+
 #
 ## @brief Remove all files with .pyc and .pyo extension recursively.
 #
 #  If `path` is not provided `sys.path` will be used.
 #  Function suspends `PermissionError` if raised.
 #
+#  Each directory is listed once, duplicate paths and paths nested in other paths are walked once.
+#  Files are removed by a thread pool, __pycache__ directories are removed as a whole if they don't
+#  contain anything but Python object files.
+#
+#  @warning THIS METHOD HAS BEEN PROVIDED FOR INTERNAL USE ONLY.
+#
+#  @param path       [ str, list of str | None  | in  ] - Path.
+#  @param verbose    [ bool             | False | in  ] - Display deleted files.
+#  @param maxWorkers [ int              | None  | in  ] - Number of threads, based on CPUs available to the process if not provided.
+#
+#  @exception N/A
+#
+#  @return dict - Summary with files, directories, bytes and errors keys, which are the number of removed files, number of removed __pycache__ directories, total size of removed files and number of files couldn't be removed.
+def removePythonObjects(path=None, verbose=False, maxWorkers=None):
+
+    if not path:
+        path = sys.path
+    else:
+        if isinstance(path, str):
+            path = [path]
+
+    files, cacheDirs = _collectPythonObjects(_getRootDirectories(path))
+
+    summary = {'files': 0, 'directories': 0, 'bytes': 0, 'errors': 0}
+
+    if not files and not cacheDirs:
+        return summary
+
+    if not maxWorkers:
+        maxWorkers = min(32, mCore.platformLib.getPlatformInfo().effectiveCpuCount * 4)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+
+        futures = [executor.submit(_removeCacheDirectory, x) for x in cacheDirs]
+        futures.extend([executor.submit(_removeFiles, files[x:x + _REMOVE_BATCH_SIZE]) for x in range(0, len(files), _REMOVE_BATCH_SIZE)])
+
+        for future in futures:
+
+            result = future.result()
+
+            summary['files']  += len(result[0])
+            summary['bytes']  += result[1]
+            summary['errors'] += result[2]
+
+            if len(result) > 3 and result[3]:
+                summary['directories'] += 1
+
+            if verbose:
+                for filePath in result[0]:
+                    sys.stdout.write('{}\n'.format(filePath))
+
+    return summary
+
+#
+## @brief Get stale Python object files in given directory listing.
+#
+#  Python object file is stale if its source file doesn't exist or modified after it.
+#
+#  @param sources   [ dict | None | in  ] - Names of the source files in the directory as keys and os.DirEntry instances as values.
+#  @param objects   [ list | None | in  ] - os.DirEntry instances of the Python object files in the directory.
+#  @param legacy    [ bool | None | in  ] - Whether the objects are next to sources rather than in __pycache__ directory.
+#
+#  @exception N/A
+#
+#  @return list of str - Absolute paths of stale files.
+def _getStalePythonObjects(sources, objects, legacy):
+
+    stale = []
+
+    for entry in objects:
+
+        # module.pyc next to source, module.cpython-38.opt-1.pyc in __pycache__
+        name   = entry.name[:-4] if legacy else entry.name.split('.', 1)[0]
+        source = sources.get('{}.py'.format(name))
+
+        if source is None:
+            stale.append(entry.path)
+            continue
+
+        try:
+            if source.stat().st_mtime_ns > entry.stat(follow_symlinks=False).st_mtime_ns:
+                stale.append(entry.path)
+        except OSError:
+            continue
+
+    return stale
+
+#
+## @brief Remove Python object files whose source file is missing or newer, incrementally.
+#
+#  If `path` is not provided `sys.path` will be used.
+#
+#  Modification times of the visited directories and names of their sub directories are kept in a
+#  manifest file. Directories, which haven't changed since the last run, are not listed, their sub
+#  directories are visited from the manifest, therefore a run on an unchanged tree costs a single
+#  stat call for each directory. Python object files, which are up to date, are kept, so imports
+#  don't need to compile them again.
+#
+#  Modification time of a directory changes when files are added, removed or renamed in it, so
+#  removed and replaced (saved by renaming) source files are detected. Source files modified in place
+#  are detected only when their directory changes, Python recompiles such files on import anyway.
+#
 #  @warning THIS METHOD HAS BEEN PROVIDED FOR INTERNAL USE ONLY.
 #
-#  @param path      [ str, list of str | None  | in  ] - Path.
-#  @param verbose   [ bool             | False | in  ] - Display deleted files.
+#  @param path             [ str, list of str | None  | in  ] - Path.
+#  @param manifestFilePath [ str              | None  | in  ] - Absolute path of the manifest file, a file in cache directory is used if not provided.
+#  @param verbose          [ bool             | False | in  ] - Display deleted files.
 #
 #  @exception N/A
 #
-#  @return None - None.
-def removePythonObjects(path=None, verbose=False):
+#  @return dict - Summary with files, directories, bytes, errors, scanned and skipped keys, which are the number of removed files, number of removed __pycache__ directories, total size of removed files, number of files couldn't be removed, number of listed directories and number of directories skipped by the manifest.
+def removeStalePythonObjects(path=None, manifestFilePath=None, verbose=False):
 
     if not path:
         path = sys.path
@@ -110,34 +508,325 @@ def removePythonObjects(path=None, verbose=False):
         if isinstance(path, str):
             path = [path]
 
-    _directory = mFileSystem.directoryLib.Directory()
-    _file      = mFileSystem.fileLib.File()
+    if not manifestFilePath:
+        manifestFilePath = mCore.cacheLib.getCacheFilePath(STALE_MANIFEST_FILE_NAME)
 
-    for p in path:
+    roots           = _getRootDirectories(path)
+    manifest        = mCore.cacheLib.readJsonFile(manifestFilePath, {})
+    directories     = manifest.get('directories', {}) if manifest.get('version') == _STALE_MANIFEST_VERSION else {}
+    rootPrefixes    = tuple([x.rstrip(os.sep) + os.sep for x in roots])
+    newDirectories  = dict([(k, v) for k, v in directories.items() if not (k in roots or k.startswith(rootPrefixes))])
+    racyTime        = (time.time() - _MTIME_GRANULARITY) * 1000000000
+    summary         = {'files': 0, 'directories': 0, 'bytes': 0, 'errors': 0, 'scanned': 0, 'skipped': 0}
+    stack           = list(roots)
 
-        if not _directory.setDirectory(directory=p):
+    while stack:
+
+        directory = stack.pop()
+
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            continue
+
+        record = directories.get(directory)
+        if record and record[0] == mtime:
+            newDirectories[directory] = record
+            stack.extend([os.path.join(directory, x) for x in record[1]])
+            summary['skipped'] += 1
             continue
 
-        pycFiles = _directory.listFilesRecursively(extension='pyc')
-        if pycFiles:
-            for i in pycFiles:
-                if _file.setFile(path=i):
+        summary['scanned'] += 1
+
+        subDirectories  = []
+        sources         = {}
+        objects         = []
+        stale           = []
+        cacheDirectory  = None
+
+        try:
+            with os.scandir(directory) as iterator:
+                for entry in iterator:
+
                     try:
-                        _file.remove()
-                        if verbose:
-                            sys.stdout.write('{}\n'.format(i))
-                    except PermissionError as error:
+                        isDirectory = entry.is_dir(follow_symlinks=False)
+                    except OSError:
                         continue
 
-        pyoFiles = _directory.listFilesRecursively(extension='pyo')
-        if pyoFiles:
-            for i in pyoFiles:
-                if _file.setFile(path=i):
+                    if isDirectory:
+                        if entry.name == '__pycache__':
+                            cacheDirectory = entry.path
+                        else:
+                            subDirectories.append(entry.name)
+
+                    elif entry.name.endswith('.py'):
+                        sources[entry.name] = entry
+
+                    elif entry.name.endswith(PYTHON_OBJECT_EXTENSIONS):
+                        objects.append(entry)
+
+        except OSError:
+            continue
+
+        stale.extend(_getStalePythonObjects(sources, objects, True))
+
+        cacheObjects = []
+        if cacheDirectory:
+            try:
+                with os.scandir(cacheDirectory) as iterator:
+                    cacheObjects = [x for x in iterator if x.name.endswith(PYTHON_OBJECT_EXTENSIONS)]
+            except OSError:
+                cacheObjects = []
+
+            stale.extend(_getStalePythonObjects(sources, cacheObjects, False))
+
+        if stale:
+
+            removed, size, errors = _removeFiles(stale)
+
+            summary['files']  += len(removed)
+            summary['bytes']  += size
+            summary['errors'] += errors
+
+            if verbose:
+                for filePath in removed:
+                    sys.stdout.write('{}\n'.format(filePath))
+
+            if cacheDirectory and set(removed).issuperset([x.path for x in cacheObjects]):
+                try:
+                    os.rmdir(cacheDirectory)
+                    summary['directories'] += 1
+                except OSError:
+                    pass
+
+            # Removing files changes the modification time of the directory
+            try:
+                mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+
+        # Changes made in the same time slot as the modification time may not be reflected by it
+        if mtime < racyTime:
+            newDirectories[directory] = [mtime, subDirectories]
+
+        stack.extend([os.path.join(directory, x) for x in subDirectories])
+
+    mCore.cacheLib.writeJsonFile(manifestFilePath, {'version': _STALE_MANIFEST_VERSION, 'directories': newDirectories})
+
+    return summary
+
+#
+## @brief Walk given directories and collect Python source files grouped by top level package.
+#
+#  Each directory is listed once, symbolic links to directories are not followed, __pycache__
+#  directories are skipped.
+#
+#  @param roots [ list of str | None | in  ] - Absolute paths of the directories.
+#
+#  @exception N/A
+#
+#  @return dict - Absolute paths of top level packages or modules as keys and list of absolute paths of source files as values.
+def _collectPythonSources(roots):
+
+    packages = {}
+
+    for root in roots:
+
+        stack = [(root, None)]
+
+        while stack:
+
+            directory, package = stack.pop()
+
+            try:
+                iterator = os.scandir(directory)
+            except OSError:
+                continue
+
+            with iterator:
+
+                for entry in iterator:
+
                     try:
-                        _file.remove()
-                        if verbose:
-                            sys.stdout.write('{}\n'.format(i))
-                    except PermissionError as error:
+                        isDirectory = entry.is_dir(follow_symlinks=False)
+                    except OSError:
                         continue
 
+                    if isDirectory:
+                        if entry.name != '__pycache__':
+                            stack.append((entry.path, package or entry.path))
+
+                    elif entry.name.endswith('.py'):
+                        packages.setdefault(package or entry.path, []).append(entry.path)
+
+    return packages
+
+#
+## @brief Get whether given Python object file has been compiled from current state of given source file.
+#
+#  Header of the file is compared with the interpreter's magic number and modification time and size
+#  of the source file, the same way the import system does. Hash of the source file is compared for
+#  hash based Python object files.
+#
+#  @param sourcePath [ str            | None | in  ] - Absolute path of the source file.
+#  @param sourceStat [ os.stat_result | None | in  ] - Stat result of the source file.
+#  @param objectPath [ str            | None | in  ] - Absolute path of the Python object file.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def _isPythonObjectUpToDate(sourcePath, sourceStat, objectPath):
+
+    try:
+        with open(objectPath, 'rb') as _file:
+            header = _file.read(16)
+    except (IOError, OSError):
+        return False
+
+    if len(header) != 16 or header[:4] != importlib.util.MAGIC_NUMBER:
+        return False
+
+    flags, mtime, size = struct.unpack('<3I', header[4:])
+
+    if flags:
+
+        try:
+            with open(sourcePath, 'rb') as _file:
+                return header[8:16] == importlib.util.source_hash(_file.read())
+        except (IOError, OSError):
+            return False
+
+    return mtime == (int(sourceStat.st_mtime) & 0xFFFFFFFF) and size == (sourceStat.st_size & 0xFFFFFFFF)
+
+#
+## @brief Compile given Python source files.
+#
+#  Function runs in worker processes of compilePythonObjects function.
+#
+#  @param files         [ list of str | None | in  ] - Absolute paths of the source files.
+#  @param optimizations [ list of int | None | in  ] - Optimization levels.
+#  @param force         [ bool        | None | in  ] - Whether to compile the files which are up to date.
+#
+#  @exception N/A
+#
+#  @return tuple - Number of compiled files, number of skipped files, list of error messages and elapsed time in seconds.
+def _compileFiles(files, optimizations, force):
+
+    compiled    = 0
+    skipped     = 0
+    errors      = []
+    start       = time.perf_counter()
+
+    for filePath in files:
+
+        try:
+            sourceStat = os.stat(filePath)
+        except OSError as error:
+            errors.append(str(error))
+            continue
+
+        for optimization in optimizations:
+
+            objectPath = importlib.util.cache_from_source(filePath, optimization=optimization or '')
+
+            if not force and _isPythonObjectUpToDate(filePath, sourceStat, objectPath):
+                skipped += 1
+                continue
+
+            try:
+                py_compile.compile(filePath, cfile=objectPath, doraise=True, optimize=optimization)
+            except (py_compile.PyCompileError, IOError, OSError) as error:
+                errors.append(str(error).strip())
+                continue
+
+            compiled += 1
+
+    return compiled, skipped, errors, time.perf_counter() - start
+
+#
+## @brief Compile Python source files recursively.
+#
+#  If `path` is not provided `sys.path` will be used.
+#
+#  Python object files are written into __pycache__ directories the same way the import system does,
+#  so the first import of each module doesn't need to compile it. Python object files, which are up to
+#  date, are skipped. Source files are compiled in batches by a process pool, batches of a small tree
+#  are compiled in the current process.
+#
+#  @warning THIS METHOD HAS BEEN PROVIDED FOR INTERNAL USE ONLY.
+#
+#  @param path          [ str, list of str | None  | in  ] - Path.
+#  @param optimizations [ list of int      | (0,)  | in  ] - Optimization levels, each of them from OPTIMIZATION_LEVELS.
+#  @param force         [ bool             | False | in  ] - Compile files even if they are up to date.
+#  @param verbose       [ bool             | False | in  ] - Display errors and per package timing.
+#  @param maxWorkers    [ int              | None  | in  ] - Number of processes, based on CPUs available to the process if not provided.
+#
+#  @exception ValueError - If an optimization level is not supported.
+#
+#  @return dict - Summary with compiled, skipped, errors, seconds and packages keys. Packages value contains absolute paths of the top level packages as keys and dicts with files, compiled, skipped, errors and seconds keys as values.
+def compilePythonObjects(path=None, optimizations=(0,), force=False, verbose=False, maxWorkers=None):
+
+    if not path:
+        path = sys.path
+    else:
+        if isinstance(path, str):
+            path = [path]
+
+    optimizations = sorted(set(optimizations))
+    for optimization in optimizations:
+        if optimization not in OPTIMIZATION_LEVELS:
+            raise ValueError('Optimization level {} is not supported, use one of {}'.format(optimization, OPTIMIZATION_LEVELS))
+
+    start    = time.perf_counter()
+    packages = _collectPythonSources(_getRootDirectories(path))
+    summary  = {'compiled': 0, 'skipped': 0, 'errors': 0, 'seconds': 0.0, 'packages': {}}
+    batches  = []
+
+    for package, files in packages.items():
+
+        summary['packages'][package] = {'files': len(files), 'compiled': 0, 'skipped': 0, 'errors': 0, 'seconds': 0.0}
+
+        batches.extend([(package, files[x:x + _COMPILE_BATCH_SIZE]) for x in range(0, len(files), _COMPILE_BATCH_SIZE)])
+
+    if not maxWorkers:
+        maxWorkers = mCore.platformLib.getPlatformInfo().effectiveCpuCount
+
+    maxWorkers = min(maxWorkers, len(batches))
+
+    if maxWorkers > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=maxWorkers) as executor:
+            results = [executor.submit(_compileFiles, x[1], optimizations, force) for x in batches]
+            results = [x.result() for x in results]
+    else:
+        results = [_compileFiles(x[1], optimizations, force) for x in batches]
+
+    errors = []
+
+    for batch, result in zip(batches, results):
+
+        packageSummary = summary['packages'][batch[0]]
+
+        packageSummary['compiled'] += result[0]
+        packageSummary['skipped']  += result[1]
+        packageSummary['errors']   += len(result[2])
+        packageSummary['seconds']  += result[3]
+
+        summary['compiled'] += result[0]
+        summary['skipped']  += result[1]
+        summary['errors']   += len(result[2])
+
+        errors.extend(result[2])
+
+    summary['seconds'] = time.perf_counter() - start
+
+    if verbose:
+
+        for error in errors:
+            mCore.displayLib.Display.displayFailure(error)
+
+        rows = sorted(summary['packages'].items(), key=lambda x: x[1]['seconds'], reverse=True)
+        rows = [(x[0], x[1]['files'], x[1]['compiled'], x[1]['skipped'], x[1]['errors'], '{:.3f}'.format(x[1]['seconds'])) for x in rows]
+
+        mCore.displayLib.Display.displayTable(rows, header=('Package', 'Files', 'Compiled', 'Skipped', 'Errors', 'Seconds'))
 
+    return summary
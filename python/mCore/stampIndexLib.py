@@ -0,0 +1,338 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/stampIndexLib.py @brief [ FILE   ] - Index of time stamped files in a directory.
+## @package mCore.stampIndexLib    @brief [ MODULE ] - Index of time stamped files in a directory.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import bisect
+import os
+import re
+import threading
+import time
+
+import mCore.dateTimeLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Index of the files in a directory, which have time stamps in their names.
+#
+#  Files are indexed by the first stamp found in their names, such as the stamps produced by
+#  mCore.dateTimeLib.getDateTimeForFileSystem. The directory is scanned once, subsequent queries
+#  rescan the directory only if its modification time changed, in which case only added files are
+#  parsed and only added and removed files are updated in the index.
+#
+#  Index is kept sorted by the stamps, therefore range queries find their bounds in O(log n).
+#
+#  @code
+#import mCore.stampIndexLib
+#
+#index = mCore.stampIndexLib.StampIndex('/projects/asset/publish')
+#
+#index.latest(2)
+# #['soldier_2013.05.20_19.32.22.ma', 'soldier_2013.05.19_10.01.45.ma']
+#
+#index.recent(86400)
+# #['soldier_2013.05.20_19.32.22.ma']
+#  @endcode
+class StampIndex(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC STATIC MEMBERS
+    # ------------------------------------------------------------------------------------------------
+    ## [ int ] - Seconds, which modification time of a directory may lag behind its changes.
+    MTIME_GRANULARITY = 2
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param directory   [ str  | None                                      | in  ] - Absolute path of the directory.
+    #  @param stampFormat [ enum | mCore.dateTimeLib.StampFormat.kFileSystem | in  ] - Any value from mCore.dateTimeLib.StampFormat enum class.
+    #  @param localTime   [ bool | True                                      | in  ] - Treat stamps as local time.
+    #
+    #  @exception ValueError - If given stamp format is not supported.
+    #
+    #  @return None - None.
+    def __init__(self, directory, stampFormat=mCore.dateTimeLib.StampFormat.kFileSystem, localTime=True):
+
+        template, _ = mCore.dateTimeLib.getStampLayout(stampFormat)
+
+        ## [ str ] - Absolute path of the directory.
+        self._directory     = directory
+
+        ## [ enum ] - Stamp format.
+        self._stampFormat   = stampFormat
+
+        ## [ bool ] - Treat stamps as local time.
+        self._localTime     = localTime
+
+        ## [ re.Pattern ] - Pattern to find stamps in file names.
+        self._pattern       = re.compile(''.join(['[0-9]' if x == '0' else re.escape(x) for x in template]))
+
+        ## [ list of tuple ] - Sorted (seconds, name) tuples.
+        self._entries       = []
+
+        ## [ dict ] - Names of indexed files as keys and seconds as values.
+        self._seconds       = {}
+
+        ## [ set ] - Names of the files, which don't have a valid stamp.
+        self._ignored       = set()
+
+        ## [ int ] - Modification time of the directory in nanoseconds when it was scanned.
+        self._mtime         = None
+
+        ## [ bool ] - Whether the directory may have changed without changing its modification time.
+        self._racy          = True
+
+        ## [ threading.Lock ] - Lock for the index.
+        self._lock          = threading.Lock()
+
+    #
+    ## @brief Get the number of indexed files.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Number of files.
+    def __len__(self):
+
+        self.refresh()
+
+        return len(self._entries)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Parse given stamps one by one, names of the files with invalid stamps are ignored.
+    #
+    #  @param stamps [ list of tuple | None | in  ] - (stamp, name) tuples.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Valid (stamp, name) tuples and their seconds.
+    def _parseEach(self, stamps):
+
+        valid   = []
+        seconds = []
+
+        for stamp, name in stamps:
+
+            try:
+                seconds.extend(mCore.dateTimeLib.parseStamps([stamp], self._stampFormat, self._localTime))
+            except ValueError:
+                self._ignored.add(name)
+            else:
+                valid.append((stamp, name))
+
+        return valid, seconds
+
+    #
+    ## @brief Scan the directory and update the index. Lock must be acquired by the caller.
+    #
+    #  @param mtime [ int | None | in  ] - Modification time of the directory in nanoseconds.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _scan(self, mtime):
+
+        scanTime = time.time()
+        names    = set()
+
+        try:
+            for entry in os.scandir(self._directory):
+                if entry.is_file():
+                    names.add(entry.name)
+        except OSError:
+            names = set()
+
+        known   = set(self._seconds)
+        removed = known - names
+        added   = [x for x in names - known if x not in self._ignored]
+
+        self._ignored &= names
+
+        for name in removed:
+            entry = (self._seconds.pop(name), name)
+            del self._entries[bisect.bisect_left(self._entries, entry)]
+
+        stamps = []
+        for name in added:
+            match = self._pattern.search(name)
+            if match:
+                stamps.append((match.group(0), name))
+            else:
+                self._ignored.add(name)
+
+        if stamps:
+
+            try:
+                seconds = mCore.dateTimeLib.parseStamps([x[0] for x in stamps], self._stampFormat, self._localTime)
+            except ValueError:
+                stamps, seconds = self._parseEach(stamps)
+
+            entries = list(zip(seconds, [x[1] for x in stamps]))
+
+            self._seconds.update([(x[1], x[0]) for x in entries])
+
+            if len(entries) > len(self._entries) // 8:
+                self._entries.extend(entries)
+                self._entries.sort()
+            else:
+                for entry in entries:
+                    bisect.insort(self._entries, entry)
+
+        self._mtime = mtime
+        self._racy  = mtime is None or mtime / 1000000000.0 + StampIndex.MTIME_GRANULARITY >= scanTime
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Absolute path of the directory.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the directory.
+    def directory(self):
+
+        return self._directory
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Update the index if the directory has changed since the last scan.
+    #
+    #  Directory is rescanned regardless of its modification time if it was modified too close to
+    #  the last scan to tell whether it changed afterwards.
+    #
+    #  @param force [ bool | False | in  ] - Rescan the directory regardless of its modification time.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether the directory has been rescanned.
+    def refresh(self, force=False):
+
+        try:
+            mtime = os.stat(self._directory).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        with self._lock:
+
+            if not force and not self._racy and mtime == self._mtime:
+                return False
+
+            self._scan(mtime)
+
+        return True
+
+    #
+    ## @brief Get the names of the latest files.
+    #
+    #  @param count [ int | 1 | in  ] - Number of files.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Names of the files, latest first.
+    def latest(self, count=1):
+
+        self.refresh()
+
+        with self._lock:
+            entries = self._entries[-count:] if count > 0 else []
+
+        return [x[1] for x in reversed(entries)]
+
+    #
+    ## @brief Get the names of the files with stamps in given range.
+    #
+    #  @param start [ int | None | in  ] - Start of the range in seconds, inclusive. Range has no start if not provided.
+    #  @param end   [ int | None | in  ] - End of the range in seconds, inclusive. Range has no end if not provided.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Names of the files, oldest first.
+    def between(self, start=None, end=None):
+
+        self.refresh()
+
+        with self._lock:
+
+            first = bisect.bisect_left(self._entries, (start,)) if start is not None else 0
+            last  = bisect.bisect_left(self._entries, (end + 1,)) if end is not None else len(self._entries)
+
+            entries = self._entries[first:last]
+
+        return [x[1] for x in entries]
+
+    #
+    ## @brief Get the names of the files stamped in given number of seconds until now.
+    #
+    #  @param seconds [ int | None | in  ] - Seconds.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Names of the files, oldest first.
+    def recent(self, seconds):
+
+        now = int(time.time())
+
+        # Stamps are indexed by wall clock seconds if they are not treated as local time
+        if not self._localTime:
+            now += time.localtime(now).tm_gmtoff
+
+        return self.between(now - seconds, None)
+
+    #
+    ## @brief Get the seconds of the stamp of given file.
+    #
+    #  @param name [ str | None | in  ] - Name of the file.
+    #
+    #  @exception N/A
+    #
+    #  @return int  - Seconds.
+    #  @return None - If the file is not indexed.
+    def seconds(self, name):
+
+        self.refresh()
+
+        return self._seconds.get(name)
@@ -0,0 +1,125 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/tests/benchmarkLibTest.py [ FILE   ] - Unit test module.
+## @package mCore.tests.benchmarkLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+import mCore.benchmarks.benchmarkLib
+import mCore.displayLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class BenchmarkTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory  = tempfile.mkdtemp()
+        self.stream     = io.StringIO()
+        self.sink       = mCore.displayLib.StreamSink(stream=self.stream, useColor=False)
+
+        mCore.displayLib.Display.addSink(self.sink)
+
+    def tearDown(self):
+
+        mCore.displayLib.Display.removeSink(self.sink)
+
+        shutil.rmtree(self.directory)
+
+    def test_workloads(self):
+
+        benchmarks  = mCore.benchmarks.benchmarkLib.getBenchmarks()
+        results     = mCore.benchmarks.benchmarkLib.runBenchmarks(benchmarks, scale=0.0001, repeat=1)
+        baseline    = mCore.benchmarks.benchmarkLib.readResults(mCore.benchmarks.benchmarkLib.BASELINE_FILE_PATH)
+
+        self.assertEqual(list(results['benchmarks']), [x.name() for x in benchmarks])
+        self.assertTrue(all([x['score'] > 0 for x in results['benchmarks'].values()]))
+
+        # Baseline must be updated when benchmarks are added
+        self.assertEqual(sorted(baseline['benchmarks']), sorted(results['benchmarks']))
+
+    def test_compareResults(self):
+
+        results  = {'benchmarks': {'a': {'score': 1.3}, 'b': {'score': 0.7}, 'c': {'score': 1.1}, 'd': {'score': 1.0}}}
+        baseline = {'benchmarks': {'a': {'score': 1.0}, 'b': {'score': 1.0}, 'c': {'score': 1.0}}}
+        rows     = mCore.benchmarks.benchmarkLib.compareResults(results, baseline, tolerance=0.25)
+
+        self.assertEqual([(x[0], x[4]) for x in rows], [('a', 'regressed'), ('b', 'improved'), ('c', ''), ('d', 'new')])
+        self.assertAlmostEqual(rows[0][3], 0.3)
+
+        results['scale']  = 0.5
+        baseline['scale'] = 1.0
+
+        with self.assertRaises(ValueError):
+            mCore.benchmarks.benchmarkLib.compareResults(results, baseline)
+
+    def test_main(self):
+
+        baselinePath    = os.path.join(self.directory, 'baseline.json')
+        arguments       = ['--filter', 'pathListLib', '--scale', '0.001', '--repeat', '1', '--baseline', baselinePath]
+
+        self.assertEqual(mCore.benchmarks.benchmarkLib.main(arguments + ['--save']), 0)
+
+        results = mCore.benchmarks.benchmarkLib.readResults(baselinePath)
+        results['benchmarks']['pathListLib.PathList']['score'] /= 10.0
+        mCore.benchmarks.benchmarkLib.writeResults(baselinePath, results)
+
+        self.assertEqual(mCore.benchmarks.benchmarkLib.main(arguments), 1)
+        self.assertIn('pathListLib.PathList', self.stream.getvalue())
+
+    def test_mainFilterSave(self):
+
+        baselinePath    = os.path.join(self.directory, 'baseline.json')
+        arguments       = ['--scale', '0.001', '--repeat', '1', '--baseline', baselinePath, '--save']
+
+        self.assertEqual(mCore.benchmarks.benchmarkLib.main(arguments + ['--filter', 'pathListLib']), 0)
+        self.assertEqual(mCore.benchmarks.benchmarkLib.main(arguments + ['--filter', 'versionLib.parseVersion']), 0)
+
+        results = mCore.benchmarks.benchmarkLib.readResults(baselinePath)
+        self.assertEqual(list(results['benchmarks']), ['pathListLib.PathList', 'versionLib.parseVersion'])
+
+    def test_mainScale(self):
+
+        baselinePath    = os.path.join(self.directory, 'baseline.json')
+        arguments       = ['--filter', 'pathListLib', '--repeat', '1', '--baseline', baselinePath]
+
+        self.assertEqual(mCore.benchmarks.benchmarkLib.main(arguments + ['--scale', '0.001', '--save']), 0)
+        self.assertEqual(mCore.benchmarks.benchmarkLib.main(arguments + ['--scale', '0.002']), 2)
+        self.assertEqual(mCore.benchmarks.benchmarkLib.main(arguments + ['--scale', '0.002', '--save']), 2)
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
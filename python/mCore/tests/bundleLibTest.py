@@ -0,0 +1,118 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/tests/bundleLibTest.py [ FILE   ] - Unit test module.
+## @package mCore.tests.bundleLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import mCore.bundleLib
+import mCore.packageRegistryLib
+import mCore.pythonUtilsLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class BundleTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory      = tempfile.mkdtemp()
+        self.bundleFilePath = os.path.join(self.directory, 'bundle.mcb')
+
+        mCore.pythonUtilsLib.createPythonPackages(self.directory,
+                                                  {'mBundleAsset'        : {'packageInfoLib.py': 'NAME = "mBundleAsset"\nDEPENDENT_PACKAGES = ["mBundleCore", "mMissing"]\n',
+                                                                            'assetLib.py'      : 'import mBundleCore.coreLib\nNAME = mBundleCore.coreLib.NAME\n'},
+                                                   'mBundleAsset/widgets': {'widgetLib.py'     : 'WIDTH = 1\n'},
+                                                   'mBundleCore'         : {'packageInfoLib.py': 'NAME = "mBundleCore"\n',
+                                                                            'coreLib.py'       : 'NAME = "core"\n'}})
+
+        self.registry = mCore.packageRegistryLib.PackageRegistry([self.directory], useCache=False)
+
+    def tearDown(self):
+
+        mCore.bundleLib.uninstall()
+
+        for name in list(sys.modules):
+            if name.startswith('mBundle'):
+                del sys.modules[name]
+
+        shutil.rmtree(self.directory)
+
+    def test_resolvePythonPackages(self):
+
+        directories = mCore.bundleLib.resolvePythonPackages(['mBundleAsset'], ignoreMissing=True, registry=self.registry)
+
+        self.assertEqual([os.path.basename(x) for x in directories], ['mBundleAsset', 'mBundleCore'])
+
+        with self.assertRaises(ValueError):
+            mCore.bundleLib.resolvePythonPackages(['mBundleAsset'], registry=self.registry)
+
+    def test_import(self):
+
+        directories = mCore.bundleLib.resolvePythonPackages(['mBundleAsset'], ignoreMissing=True, registry=self.registry)
+        summary     = mCore.bundleLib.createBundle(self.bundleFilePath, directories)
+
+        # Packages and their modules, tests packages are excluded
+        self.assertEqual(summary['modules'], 8)
+
+        importer = mCore.bundleLib.install(self.bundleFilePath)
+
+        self.assertIn('mBundleAsset.widgets.widgetLib', importer.moduleNames())
+        self.assertNotIn('mBundleAsset.tests', importer.moduleNames())
+
+        module = importlib.import_module('mBundleAsset.assetLib')
+
+        self.assertEqual(module.NAME, 'core')
+        self.assertIs(module.__loader__, importer)
+        self.assertIs(sys.modules['mBundleCore.coreLib'].__loader__, importer)
+        self.assertEqual(importlib.import_module('mBundleAsset.widgets.widgetLib').WIDTH, 1)
+        self.assertEqual(module.__file__, os.path.join(os.path.realpath(self.directory), 'mBundleAsset', 'assetLib.py'))
+        self.assertIn('NAME = ', importer.get_source('mBundleAsset.assetLib'))
+
+        self.assertEqual(mCore.bundleLib.uninstall(importer), 1)
+        self.assertNotIn(importer, sys.meta_path)
+
+    def test_invalidBundle(self):
+
+        with open(self.bundleFilePath, 'wb') as _file:
+            _file.write(b'0' * 64)
+
+        with self.assertRaises(ValueError):
+            mCore.bundleLib.BundleImporter(self.bundleFilePath)
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
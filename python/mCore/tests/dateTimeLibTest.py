@@ -0,0 +1,288 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/tests/dateTimeLibTest.py [ FILE   ] - Unit test module.
+## @package mCore.tests.dateTimeLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+import mCore.dateTimeLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class TimeStampTest(unittest.TestCase):
+
+    def test_formats(self):
+
+        self.assertTrue(re.match(r'^\d{4}\.\d{2}\.\d{2}_\d{2}\.\d{2}\.\d{2}$', mCore.dateTimeLib.getDateTimeForFileSystem()))
+        self.assertTrue(re.match(r'^\d{4}\.\d{2}\.\d{2} - \d{2}:\d{2}:\d{2}$'  , mCore.dateTimeLib.getDateTimeStamp()))
+        self.assertTrue(re.match(r'^\d{4}\.\d{2}\.\d{2}$'                          , mCore.dateTimeLib.getDateStamp()))
+        self.assertTrue(re.match(r'^\d{2}:\d{2}:\d{2}$'                              , mCore.dateTimeLib.getTimeStamp()))
+
+    def test_snapshot(self):
+
+        snapshot = mCore.dateTimeLib._TimeStampSnapshot(int(time.mktime((2013, 5, 20, 9, 2, 3, 0, 0, -1))))
+
+        self.assertEqual(snapshot.dateInt              , (2013, 5, 20))
+        self.assertEqual(snapshot.timeStr              , ('09', '02', '03'))
+        self.assertEqual(snapshot.dateTimeForFileSystem, '2013.05.20_09.02.03')
+        self.assertEqual(snapshot.dateTimeStamp        , '2013.05.20 - 09:02:03')
+
+    def test_cache(self):
+
+        timeStamp = mCore.dateTimeLib.TimeStamp()
+
+        first  = timeStamp._current()
+        second = timeStamp._current()
+
+        self.assertTrue(first is second or first.second != second.second)
+        self.assertIsInstance(timeStamp.dateIntList(), list)
+
+class StopwatchTest(unittest.TestCase):
+
+    def test_registry(self):
+
+        registry = mCore.dateTimeLib.TimingRegistry(sampleSize=10)
+
+        for nanoseconds in range(1, 101):
+            registry.record('load', nanoseconds)
+
+        statistics = registry.statistics('load')['load']
+
+        self.assertEqual(statistics['count'], 100)
+        self.assertEqual(statistics['total'], 5050)
+        self.assertEqual(statistics['min']  , 1)
+        self.assertEqual(statistics['max']  , 100)
+        self.assertTrue(1 <= statistics['p50'] <= statistics['p95'] <= 100)
+
+        registry.reset()
+
+        self.assertEqual(registry.statistics(), {})
+
+    def test_threads(self):
+
+        registry = mCore.dateTimeLib.TimingRegistry(sampleSize=10)
+
+        def record(nanoseconds, count):
+            for _ in range(count):
+                registry.record('load', nanoseconds)
+
+        threads = [threading.Thread(target=record, args=(1, 1000)), threading.Thread(target=record, args=(1000, 10))]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        statistics = registry.statistics()['load']
+
+        self.assertEqual(statistics['count'], 1010)
+        self.assertEqual(statistics['max']  , 1000)
+        self.assertEqual(statistics['p50']  , 1)
+        self.assertEqual(statistics['p95']  , 1)
+        self.assertEqual(registry._threadStatistics, [])
+
+        record(1000, 1000)
+
+        statistics = registry.statistics()['load']
+
+        self.assertEqual(statistics['count'], 2010)
+        self.assertEqual(statistics['p95']  , 1000)
+        self.assertEqual(len(registry._threadStatistics), 1)
+
+    def test_stopwatch(self):
+
+        registry = mCore.dateTimeLib.TimingRegistry()
+
+        @mCore.dateTimeLib.Stopwatch('decorated', registry=registry)
+        def function():
+            return True
+
+        self.assertTrue(function())
+        self.assertTrue(function())
+
+        with mCore.dateTimeLib.Stopwatch('block', registry=registry) as stopwatch:
+            pass
+
+        self.assertGreaterEqual(stopwatch.elapsedNs(), 0)
+        self.assertEqual(registry.statistics()['decorated']['count'], 2)
+        self.assertEqual([x[0] for x in registry.report() if x[0] == 'block'], ['block'])
+
+class StampTest(unittest.TestCase):
+
+    SECONDS = [0, 951782400, 1369078342, 4102444799]
+
+    INVALID = ['2013.13.45_99.99.99', '2013.02.30_10.00.00', '2013.00.10_10.00.00', '2013.05.00_10.00.00', '2013.05.20_24.00.00', '2013.05.20_19.60.00', '2013.05.20_19.32.60']
+
+    STAMPS  = ['1970.01.01_00.00.00', '2000.02.29_00.00.00', '2013.05.20_19.32.22', '2099.12.31_23.59.59']
+
+    def test_formatStamps(self):
+
+        self.assertEqual(mCore.dateTimeLib.formatStamps(StampTest.SECONDS, localTime=False), StampTest.STAMPS)
+        self.assertEqual(mCore.dateTimeLib.formatStamps([1369078342.9], mCore.dateTimeLib.StampFormat.kDateTime, localTime=False), ['2013.05.20 - 19:32:22'])
+        self.assertEqual(mCore.dateTimeLib.formatStamps([1369078342], mCore.dateTimeLib.StampFormat.kDate, localTime=False), ['2013.05.20'])
+        self.assertEqual(mCore.dateTimeLib.formatStamps([1369078342], mCore.dateTimeLib.StampFormat.kTime, localTime=False), ['19:32:22'])
+
+    def test_parseStamps(self):
+
+        self.assertEqual(mCore.dateTimeLib.parseStamps(StampTest.STAMPS, localTime=False), StampTest.SECONDS)
+        self.assertEqual(mCore.dateTimeLib.parseStamps(['19:32:22'], mCore.dateTimeLib.StampFormat.kTime), [70342])
+
+        self.assertRaises(ValueError, mCore.dateTimeLib.parseStamps, ['2013.05.20'])
+        self.assertRaises(ValueError, mCore.dateTimeLib.parseStamps, ['2013.05.20'], 'unknown')
+        self.assertRaises(ValueError, mCore.dateTimeLib.parseStamps, ['2013-05-20 19:32:22'], localTime=False)
+        self.assertRaises(ValueError, mCore.dateTimeLib.parseStamps, ['2013.05.2x_19.32.22'], localTime=False)
+
+    def test_parseInvalidStamps(self):
+
+        for stamp in StampTest.INVALID:
+            with self.assertRaisesRegex(ValueError, stamp):
+                mCore.dateTimeLib.parseStamps(['2012.02.29_10.00.00', stamp], localTime=False)
+
+        self.assertRaises(ValueError, mCore.dateTimeLib.parseStamps, ['24:00:00'], mCore.dateTimeLib.StampFormat.kTime)
+        self.assertRaises(ValueError, mCore.dateTimeLib.parseStamps, ['2013.02.29'], mCore.dateTimeLib.StampFormat.kDate)
+
+    def test_localTime(self):
+
+        seconds = int(time.time())
+        stamp   = mCore.dateTimeLib.formatStamps([seconds])[0]
+
+        self.assertEqual(stamp, time.strftime('%Y.%m.%d_%H.%M.%S', time.localtime(seconds)))
+        self.assertEqual(mCore.dateTimeLib.parseStamps([stamp]), [seconds])
+
+    def test_numpy(self):
+
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest('NumPy is not available')
+
+        stamps = mCore.dateTimeLib.formatStamps(numpy.array(StampTest.SECONDS, dtype=numpy.int64), localTime=False)
+
+        self.assertEqual(stamps.tolist(), StampTest.STAMPS)
+        self.assertEqual(mCore.dateTimeLib.parseStamps(stamps, localTime=False).tolist(), StampTest.SECONDS)
+        self.assertEqual(mCore.dateTimeLib.formatStamps(numpy.array(['2013-05-20T19:32:22'], dtype='datetime64[s]')).tolist(), ['2013.05.20_19.32.22'])
+        self.assertRaises(ValueError, mCore.dateTimeLib.parseStamps, numpy.array(['2013-05-20 19:32:22']), localTime=False)
+
+        for stamp in StampTest.INVALID:
+            with self.assertRaisesRegex(ValueError, stamp):
+                mCore.dateTimeLib.parseStamps(numpy.array(['2012.02.29_10.00.00', stamp]), localTime=False)
+
+            with self.assertRaisesRegex(ValueError, stamp):
+                mCore.dateTimeLib.parseStamps(numpy.array([b'2012.02.29_10.00.00', stamp.encode('ascii')]), localTime=False)
+
+        self.assertRaises(ValueError, mCore.dateTimeLib.parseStamps, numpy.array(['24:00:00']), mCore.dateTimeLib.StampFormat.kTime)
+        self.assertRaises(ValueError, mCore.dateTimeLib.parseStamps, numpy.array(['2013.02.29']), mCore.dateTimeLib.StampFormat.kDate)
+        self.assertEqual(mCore.dateTimeLib.parseStamps(numpy.array(['2012.02.29']), mCore.dateTimeLib.StampFormat.kDate, localTime=False).tolist(), [1330473600])
+
+        # Non ASCII digits aren't digits of stamps
+        self.assertRaises(ValueError, mCore.dateTimeLib.parseStamps, numpy.array(['2013.05.20_19.32.2\u0662']), localTime=False)
+
+class StampNameGeneratorTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+
+    def test_generate(self):
+
+        generator = mCore.dateTimeLib.StampNameGenerator(prefix='render_',
+                                                         suffix='.exr',
+                                                         sequenceFilePath=os.path.join(self.directory, 'sequence'))
+
+        self.assertTrue(re.match(r'^render_\d{4}\.\d{2}\.\d{2}_\d{2}\.\d{2}\.\d{2}\.\d{6}_\d{12}\.exr$', generator.generate()))
+
+    def test_sharedFile(self):
+
+        directories = mCore.dateTimeLib._SEQUENCE_DIRECTORIES
+        mCore.dateTimeLib._SEQUENCE_DIRECTORIES = (os.path.join(self.directory, 'missing'), self.directory)
+
+        umask = os.umask(0o077)
+
+        try:
+            mCore.dateTimeLib.StampNameGenerator().generate()
+        finally:
+            os.umask(umask)
+            mCore.dateTimeLib._SEQUENCE_DIRECTORIES = directories
+
+        sequenceFilePath = os.path.join(self.directory, mCore.dateTimeLib._SEQUENCE_FILE_NAME)
+
+        self.assertTrue(os.path.isfile(sequenceFilePath))
+
+        # Processes of other users share the file
+        if os.name == 'posix':
+            self.assertEqual(os.stat(sequenceFilePath).st_mode & 0o777, 0o666)
+
+    def test_corrupt(self):
+
+        sequenceFilePath = os.path.join(self.directory, 'sequence')
+
+        with open(sequenceFilePath, 'w') as _file:
+            _file.write('corrupt' * 8)
+
+        self.assertTrue(mCore.dateTimeLib.StampNameGenerator(sequenceFilePath=sequenceFilePath, blockSize=4).generate().endswith('_000000000000'))
+
+        with open(sequenceFilePath) as _file:
+            self.assertEqual(int(_file.read()), 4)
+
+    def test_unique(self):
+
+        sequenceFilePath = os.path.join(self.directory, 'sequence')
+        names            = []
+
+        def generate():
+            names.extend(mCore.dateTimeLib.StampNameGenerator(sequenceFilePath=sequenceFilePath, blockSize=16).generateMany(500))
+
+        threads = [threading.Thread(target=generate) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(set(names)), 2000)
+        self.assertEqual(len(set([x[-12:] for x in names])), 2000)
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
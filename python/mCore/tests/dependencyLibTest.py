@@ -0,0 +1,115 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/tests/dependencyLibTest.py [ FILE   ] - Unit test module.
+## @package mCore.tests.dependencyLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import shutil
+import tempfile
+import unittest
+
+import mCore.dependencyLib
+import mCore.packageRegistryLib
+import mCore.pythonUtilsLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class DependencyGraphTest(unittest.TestCase):
+
+    DEPENDENCIES = {'mAsset'        : ['mCore', 'mFileSystem'],
+                    'mFileSystem'   : ['mCore'],
+                    'mShot'         : ['mAsset', 'mRender'],
+                    'mCore'         : []}
+
+    def test_loadOrder(self):
+
+        graph = mCore.dependencyLib.DependencyGraph(DependencyGraphTest.DEPENDENCIES)
+
+        self.assertEqual(graph.loadOrder(['mAsset']), ['mCore', 'mFileSystem', 'mAsset'])
+        self.assertEqual(graph.loadOrder(), ['mCore', 'mFileSystem', 'mAsset', 'mShot'])
+        self.assertEqual(graph.missingPackages(), {'mRender': ['mShot']})
+        self.assertRaises(ValueError, graph.loadOrder, ['mRender'])
+
+    def test_closure(self):
+
+        graph = mCore.dependencyLib.DependencyGraph(DependencyGraphTest.DEPENDENCIES)
+
+        self.assertEqual(graph.closure('mShot'), frozenset(['mAsset', 'mCore', 'mFileSystem']))
+        self.assertIs(graph.closure('mShot'), graph.closure('mShot'))
+
+        self.assertTrue(graph.setDependencies('mFileSystem', ['mCore', 'mPath']))
+        self.assertFalse(graph.setDependencies('mFileSystem', ['mCore', 'mPath']))
+        self.assertTrue(graph.setDependencies('mPath', []))
+
+        self.assertEqual(graph.closure('mShot'), frozenset(['mAsset', 'mCore', 'mFileSystem', 'mPath']))
+        self.assertEqual(graph.dependents('mPath'), ['mFileSystem'])
+
+        self.assertTrue(graph.removePackage('mPath'))
+        self.assertEqual(graph.closure('mShot'), frozenset(['mAsset', 'mCore', 'mFileSystem']))
+        self.assertEqual(graph.missingPackages(), {'mPath': ['mFileSystem'], 'mRender': ['mShot']})
+
+    def test_cycles(self):
+
+        graph = mCore.dependencyLib.DependencyGraph(DependencyGraphTest.DEPENDENCIES)
+
+        self.assertEqual(graph.findCycles(), [])
+
+        graph.setDependencies('mCore', ['mAsset'])
+
+        self.assertEqual(graph.findCycles(), [['mAsset', 'mCore', 'mAsset']])
+
+        with self.assertRaises(mCore.dependencyLib.CyclicDependencyError) as context:
+            graph.loadOrder(['mShot'])
+
+        self.assertEqual(context.exception.cycle[0], context.exception.cycle[-1])
+        self.assertEqual(graph.closure('mCore'), frozenset(['mAsset', 'mFileSystem']))
+
+    def test_fromRegistry(self):
+
+        directory = tempfile.mkdtemp()
+
+        try:
+            for name, content in (('mCore' , 'NAME = "mCore"\n'),
+                                  ('mAsset', 'NAME = "mAsset"\nDEPENDENT_PACKAGES = ["mCore"]\n')):
+                packagePath = mCore.pythonUtilsLib.createPythonPackage(directory, name, createUnitTestPackage=False)
+                mCore.pythonUtilsLib.createPythonModule(packagePath, 'packageInfoLib.py', content)
+
+            registry = mCore.packageRegistryLib.PackageRegistry([directory], useCache=False)
+            graph    = mCore.dependencyLib.DependencyGraph.fromRegistry(registry)
+
+            self.assertEqual(graph.loadOrder(), ['mCore', 'mAsset'])
+
+        finally:
+            shutil.rmtree(directory)
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,284 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/tests/displayLibTest.py [ FILE   ] - Unit test module.
+## @package mCore.tests.displayLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import io
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import mCore.displayLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class DisplayTableTest(unittest.TestCase):
+
+    ROWS = [('asset:soldier', 12, 'ok'),
+            ('asset:sword'  , 4 , 'missing')]
+
+    def test_displayTable(self):
+
+        out   = io.StringIO()
+        count = mCore.displayLib.Display.displayTable(DisplayTableTest.ROWS,
+                                                     header=('Name Space', 'Count', 'Status'),
+                                                     useColor=False,
+                                                     out=out)
+
+        self.assertEqual(count, 2)
+        self.assertEqual(out.getvalue().splitlines(), ['Name Space     Count  Status',
+                                                       '-------------  -----  -------',
+                                                       'asset:soldier  12     ok',
+                                                       'asset:sword    4      missing'])
+
+    def test_displayTableSampled(self):
+
+        out = io.StringIO()
+        mCore.displayLib.Display.displayTable(iter(DisplayTableTest.ROWS), sampleSize=1, useColor=False, out=out)
+
+        self.assertEqual(out.getvalue().splitlines(), ['asset:soldier  12  ok',
+                                                       'asset:sword    4   mi'])
+
+    def test_displayTableWidths(self):
+
+        out = io.StringIO()
+        mCore.displayLib.Display.displayTable(DisplayTableTest.ROWS, widths=[5, 3, 7], useColor=False, out=out)
+
+        self.assertEqual(out.getvalue().splitlines(), ['asset  12   ok',
+                                                       'asset  4    missing'])
+
+    def test_displayTableChunks(self):
+
+        out = io.StringIO()
+        out.write = writes = _WriteCounter(out.write)
+
+        count = mCore.displayLib.Display.displayTable(([x] for x in range(25)), chunkSize=10, useColor=False, out=out)
+
+        self.assertEqual(count, 25)
+        self.assertEqual(writes.count, 3)
+        self.assertEqual(out.getvalue().splitlines(), [str(x) for x in range(25)])
+
+    def test_displayTableStatusColors(self):
+
+        out = io.StringIO()
+
+        mCore.displayLib.Display.setColorMode(mCore.displayLib.ColorMode.kAlways)
+
+        try:
+            mCore.displayLib.Display.displayTable([('a', 'ok'), ('b', ['ok']), ('c', {'ok': 1})],
+                                                  statusColumn=1,
+                                                  statusColors={'ok': mCore.displayLib.ColorName.kSuccess},
+                                                  out=out)
+        finally:
+            mCore.displayLib.Display.setColorMode(mCore.displayLib.ColorMode.kAuto)
+
+        lines = out.getvalue().splitlines()
+
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].endswith('ok'))
+        self.assertEqual(lines[1], "b  ['ok']")
+        self.assertEqual(lines[2], "c  {'ok': 1}")
+
+    def test_displayTableEmpty(self):
+
+        out = io.StringIO()
+
+        self.assertEqual(mCore.displayLib.Display.displayTable([], out=out), 0)
+        self.assertEqual(out.getvalue(), '')
+
+class SinkTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+
+        for sink in mCore.displayLib.Display.listSinks():
+            mCore.displayLib.Display.removeSink(sink)
+
+        shutil.rmtree(self.directory)
+
+    def test_render(self):
+
+        message = mCore.displayLib.Message('text', level=mCore.displayLib.ColorName.kInfo, color='<{}>', endNewLine=False)
+
+        self.assertEqual(message.render(mCore.displayLib.Format.kPlain), '\ntext')
+        self.assertEqual(message.render(mCore.displayLib.Format.kColor), '\n<text>')
+        self.assertIs(message.render(mCore.displayLib.Format.kColor), message.render(mCore.displayLib.Format.kColor))
+
+        data = json.loads(message.render(mCore.displayLib.Format.kJson))
+
+        self.assertEqual(data['level'], 'info')
+        self.assertEqual(data['text'], 'text')
+
+    def test_fanOut(self):
+
+        out        = io.StringIO()
+        plainPath  = os.path.join(self.directory, 'display.log')
+        jsonPath   = os.path.join(self.directory, 'display.jsonl')
+        streamSink = mCore.displayLib.StreamSink(stream=out, useColor=False)
+        plainSink  = mCore.displayLib.RotatingFileSink(plainPath)
+        jsonSink   = mCore.displayLib.RotatingFileSink(jsonPath, format=mCore.displayLib.Format.kJson)
+
+        self.assertTrue(mCore.displayLib.Display.addSink(streamSink))
+        self.assertTrue(mCore.displayLib.Display.addSink(plainSink))
+        self.assertTrue(mCore.displayLib.Display.addSink(jsonSink))
+        self.assertFalse(mCore.displayLib.Display.addSink(jsonSink))
+
+        mCore.displayLib.Display.displayWarning('first', startNewLine=False)
+        mCore.displayLib.Display.displayInfo('second', startNewLine=False)
+
+        self.assertEqual(out.getvalue(), 'first\nsecond\n')
+        self.assertFalse(os.path.isfile(plainPath))
+
+        mCore.displayLib.Display.flush()
+
+        with open(plainPath) as _file:
+            self.assertEqual(_file.read(), 'first\nsecond\n')
+
+        with open(jsonPath) as _file:
+            self.assertEqual([json.loads(x)['level'] for x in _file], ['warning', 'info'])
+
+        self.assertTrue(mCore.displayLib.Display.removeSink(streamSink))
+        self.assertFalse(mCore.displayLib.Display.removeSink(streamSink))
+
+    def test_rotate(self):
+
+        filePath = os.path.join(self.directory, 'display.log')
+        sink     = mCore.displayLib.RotatingFileSink(filePath, maxBytes=10, backupCount=2, bufferSize=1)
+
+        for text in ('aaaaaaa', 'bbbbbbb', 'ccccccc', 'ddddddd'):
+            sink.write(mCore.displayLib.Message(text, startNewLine=False))
+
+        sink.close()
+
+        with open(filePath) as _file:
+            self.assertEqual(_file.read(), 'ddddddd\n')
+
+        with open('{}.1'.format(filePath)) as _file:
+            self.assertEqual(_file.read(), 'ccccccc\n')
+
+        with open('{}.2'.format(filePath)) as _file:
+            self.assertEqual(_file.read(), 'bbbbbbb\n')
+
+        self.assertFalse(os.path.isfile('{}.3'.format(filePath)))
+
+    def test_flushInterval(self):
+
+        out  = io.StringIO()
+        sink = mCore.displayLib.StreamSink(stream=out, useColor=False, bufferSize=10, flushInterval=0.05)
+
+        sink.write(mCore.displayLib.Message('idle', startNewLine=False))
+
+        self.assertEqual(out.getvalue(), '')
+
+        for _ in range(100):
+            if out.getvalue():
+                break
+            time.sleep(0.05)
+
+        self.assertEqual(out.getvalue(), 'idle\n')
+
+        sink.close()
+
+    def test_abstract(self):
+
+        self.assertRaises(TypeError, mCore.displayLib.Sink)
+
+class OutputTest(unittest.TestCase):
+
+    def tearDown(self):
+
+        mCore.displayLib.Display.setOutputFormat(mCore.displayLib.Format.kColor)
+        mCore.displayLib.Display.setColorMode(mCore.displayLib.ColorMode.kAuto)
+
+    def test_json(self):
+
+        out = io.StringIO()
+
+        mCore.displayLib.Display.setOutputFormat(mCore.displayLib.Format.kJson)
+        mCore.displayLib.Display.display('text "quoted"\n', color='<{}>', out=out, level=mCore.displayLib.ColorName.kWarning, fields={'asset': 'soldier'})
+        mCore.displayLib.Display.display(['a', 1], out=out)
+
+        lines = [json.loads(x) for x in out.getvalue().splitlines()]
+
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(lines[0]['level'], 'warning')
+        self.assertEqual(lines[0]['text'], 'text "quoted"\n')
+        self.assertEqual(lines[0]['fields'], {'asset': 'soldier'})
+        self.assertIsInstance(lines[0]['timestamp'], float)
+        self.assertEqual(lines[1]['level'], None)
+        self.assertEqual(lines[1]['text'], 'a 1')
+        self.assertNotIn('fields', lines[1])
+
+    def test_jsonNonString(self):
+
+        out = io.StringIO()
+
+        mCore.displayLib.Display.setOutputFormat(mCore.displayLib.Format.kJson)
+        mCore.displayLib.Display.display(5, out=out)
+
+        self.assertEqual(json.loads(out.getvalue())['text'], '5')
+        self.assertEqual(json.loads(mCore.displayLib.Message(5).render(mCore.displayLib.Format.kJson))['text'], '5')
+
+    def test_colorMode(self):
+
+        out = io.StringIO()
+
+        self.assertFalse(mCore.displayLib.Display.isColorEnabled(out))
+
+        mCore.displayLib.Display.display('text', startNewLine=False, color='<{}>', out=out)
+
+        mCore.displayLib.Display.setColorMode(mCore.displayLib.ColorMode.kAlways)
+        mCore.displayLib.Display.display('text', startNewLine=False, color='<{}>', out=out)
+
+        self.assertEqual(out.getvalue(), 'text\n<text>\n')
+
+class _WriteCounter(object):
+
+    def __init__(self, write):
+
+        self.write = write
+        self.count = 0
+
+    def __call__(self, text):
+
+        self.count += 1
+        self.write(text)
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,210 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/tests/envComposerLibTest.py [ FILE   ] - Unit test module.
+## @package mCore.tests.envComposerLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import mCore.envComposerLib
+import mCore.packageRegistryLib
+import mCore.pythonUtilsLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class EnvironmentDeltaTest(unittest.TestCase):
+
+    def test_delta(self):
+
+        before  = {'PATH': '/usr/bin', 'HOME': '/home/user', 'EDITOR': 'vi'}
+        after   = {'PATH': '/opt/bin:/usr/bin', 'HOME': '/home/other', 'LANG': 'C'}
+        delta   = mCore.envComposerLib.getEnvironmentDelta(before, after)
+
+        self.assertEqual(delta, [['EDITOR', 'unset'  , ''],
+                                 ['HOME'  , 'set'    , '/home/other'],
+                                 ['LANG'  , 'set'    , 'C'],
+                                 ['PATH'  , 'prepend', '/opt/bin:']])
+
+        self.assertEqual(mCore.envComposerLib.getEnvironmentDelta({'PATH': 'a'}, {'PATH': 'a:b'}), [['PATH', 'append', ':b']])
+        self.assertEqual(mCore.envComposerLib.getEnvironmentDelta({'PATH': 'a'}, {'PATH': 'b:a:c'}), [['PATH', 'set', 'b:a:c']])
+
+        environment = dict(before)
+        mCore.envComposerLib.applyEnvironmentDelta(delta, environment)
+
+        self.assertEqual(environment, {'PATH': '/opt/bin:/usr/bin', 'HOME': '/home/other', 'LANG': 'C'})
+
+        environment = {}
+        mCore.envComposerLib.applyEnvironmentDelta([['PATH', 'prepend', '/opt/bin' + os.pathsep]], environment)
+
+        self.assertEqual(environment, {'PATH': '/opt/bin'})
+
+class EnvironmentComposerTest(unittest.TestCase):
+
+    ENV_MODULE = ('import os\n'
+                  'def setEnvironment(allLib, envEntryContainer):\n'
+                  '    with open(os.environ["MCORE_TEST_LOG"], "a") as _file:\n'
+                  '        _file.write("{0}\\n")\n'
+                  '    if envEntryContainer is not None:\n'
+                  '        envEntryContainer.append("{0}")\n'
+                  '    os.environ["MCORE_TEST_PATH"] = "/opt/{0}" + os.pathsep + os.environ.get("MCORE_TEST_PATH", "")\n'
+                  '    return {1}\n')
+
+    def setUp(self):
+
+        self.directory  = tempfile.mkdtemp()
+        self.cachePath  = os.path.join(tempfile.mkdtemp(), 'envComposer.json')
+
+        self._createPackage('mCore' , [], True)
+        self._createPackage('mAsset', ['mCore'], False)
+
+        self.registry   = mCore.packageRegistryLib.PackageRegistry([self.directory], useCache=False)
+
+        os.environ['MCORE_TEST_LOG'] = os.path.join(os.path.dirname(self.cachePath), 'calls.log')
+
+    def tearDown(self):
+
+        os.environ.pop('MCORE_TEST_PATH', None)
+        os.environ.pop('MCORE_TEST_LOG', None)
+
+        shutil.rmtree(self.directory)
+        shutil.rmtree(os.path.dirname(self.cachePath))
+
+    def _createPackage(self, name, dependencies, initialize):
+
+        packagePath = mCore.pythonUtilsLib.createPythonPackage(self.directory, name, createUnitTestPackage=False)
+
+        mCore.pythonUtilsLib.createPythonModule(packagePath, 'packageInfoLib.py', 'NAME = "{}"\nDEPENDENT_PACKAGES = {}\n'.format(name, dependencies))
+        filePath = mCore.pythonUtilsLib.createPythonModule(packagePath, 'packageEnvLib.py', EnvironmentComposerTest.ENV_MODULE.format(name, initialize))
+
+        # Modification times within the granularity aren't trusted by the cache
+        past = time.time() - 60
+        os.utime(filePath, (past, past))
+
+    def _compose(self, value=None, envEntryContainer=None):
+
+        composer    = mCore.envComposerLib.EnvironmentComposer.fromRegistry(self.registry,
+                                                                            ['mAsset'],
+                                                                            envEntryContainer=envEntryContainer,
+                                                                            cacheFilePath=self.cachePath)
+
+        if value is None:
+            os.environ.pop('MCORE_TEST_PATH', None)
+        else:
+            os.environ['MCORE_TEST_PATH'] = value
+
+        with open(os.environ['MCORE_TEST_LOG'], 'w'):
+            pass
+
+        summary = composer.compose()
+
+        with open(os.environ['MCORE_TEST_LOG']) as _file:
+            return summary, _file.read().split()
+
+    def test_compose(self):
+
+        summary, calls = self._compose()
+        value          = os.environ['MCORE_TEST_PATH']
+
+        self.assertEqual(summary, {'cached': False, 'packages': 2, 'initialized': ['mCore']})
+        self.assertEqual(calls, ['mCore', 'mAsset'])
+        self.assertEqual(value, '/opt/mAsset{0}/opt/mCore{0}'.format(os.pathsep))
+
+        summary, calls = self._compose()
+
+        self.assertEqual(summary, {'cached': True, 'packages': 2, 'initialized': ['mCore']})
+        self.assertEqual(calls, [])
+        self.assertEqual(os.environ['MCORE_TEST_PATH'], value)
+
+    def test_invalidate(self):
+
+        self._compose()
+
+        # Module of the package is changed without changing its version
+        filePath = os.path.join(self.directory, 'mAsset', 'packageEnvLib.py')
+
+        with open(filePath, 'w') as _file:
+            _file.write(EnvironmentComposerTest.ENV_MODULE.format('mAsset', True))
+
+        os.utime(filePath, (time.time() - 30, time.time() - 30))
+
+        summary, calls = self._compose()
+
+        self.assertFalse(summary['cached'])
+        self.assertEqual(summary['initialized'], ['mCore', 'mAsset'])
+        self.assertEqual(calls, ['mCore', 'mAsset'])
+
+    def test_replay(self):
+
+        self._compose()
+
+        # Variable was set on an empty environment, a value of the user can't be replayed on
+        summary, calls = self._compose('/user')
+
+        self.assertFalse(summary['cached'])
+        self.assertEqual(calls, ['mCore', 'mAsset'])
+        self.assertEqual(os.environ['MCORE_TEST_PATH'], '/opt/mAsset{0}/opt/mCore{0}/user'.format(os.pathsep))
+
+        # Prepended values are replayed on any value
+        summary, calls = self._compose('/other')
+
+        self.assertTrue(summary['cached'])
+        self.assertEqual(calls, [])
+        self.assertEqual(os.environ['MCORE_TEST_PATH'], '/opt/mAsset{0}/opt/mCore{0}/other'.format(os.pathsep))
+
+    def test_envEntryContainer(self):
+
+        container       = []
+        summary, calls  = self._compose(envEntryContainer=container)
+
+        self.assertFalse(summary['cached'])
+        self.assertEqual(calls, ['mCore', 'mAsset'])
+        self.assertEqual(container, ['mCore', 'mAsset'])
+
+        container       = []
+        summary, calls  = self._compose(envEntryContainer=container)
+
+        self.assertTrue(summary['cached'])
+        self.assertEqual(calls, [])
+        self.assertEqual(container, ['mCore', 'mAsset'])
+
+        # Functions add entries only if they get a container
+        summary, calls  = self._compose()
+
+        self.assertFalse(summary['cached'])
+        self.assertEqual(calls, ['mCore', 'mAsset'])
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,121 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/tests/importIndexLibTest.py [ FILE   ] - Unit test module.
+## @package mCore.tests.importIndexLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import importlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+import mCore.importIndexLib
+import mCore.pythonUtilsLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class ImportIndexTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory  = tempfile.mkdtemp()
+        self.first      = os.path.join(self.directory, 'first')
+        self.second     = os.path.join(self.directory, 'second')
+        self.cachePath  = os.path.join(self.directory, 'importIndex.json')
+        self.paths      = list(sys.path)
+
+        mCore.pythonUtilsLib.createPythonModule(self.first , 'mIndexShared.py', 'LOCATION = "first"\n')
+        mCore.pythonUtilsLib.createPythonModule(self.second, 'mIndexShared.py', 'LOCATION = "second"\n')
+        mCore.pythonUtilsLib.createPythonPackages(self.second, {'mIndexPackage': {'assetLib.py': 'NAME = 1\n'}}, createUnitTestPackage=False)
+
+        past = time.time() - 60
+        for directory in (self.first, self.second):
+            os.utime(directory, (past, past))
+
+        sys.path[:0] = [self.first, self.second]
+
+        self.index = mCore.importIndexLib.install(self.cachePath)
+
+    def tearDown(self):
+
+        mCore.importIndexLib.uninstall()
+
+        sys.path[:] = self.paths
+
+        for name in list(sys.modules):
+            if name.startswith('mIndex'):
+                del sys.modules[name]
+
+        shutil.rmtree(self.directory)
+
+    def test_install(self):
+
+        self.assertIs(mCore.importIndexLib.getImportIndex(), self.index)
+        self.assertLess(sys.meta_path.index(self.index), sys.meta_path.index(importlib.machinery.PathFinder))
+
+        self.assertTrue(mCore.importIndexLib.uninstall())
+        self.assertNotIn(self.index, sys.meta_path)
+        self.assertFalse(mCore.importIndexLib.uninstall())
+
+    def test_import(self):
+
+        self.assertEqual(self.index.location('mIndexShared') , os.path.join(self.first, 'mIndexShared.py'))
+        self.assertEqual(self.index.location('mIndexPackage'), os.path.join(self.second, 'mIndexPackage', '__init__.py'))
+        self.assertIsNone(self.index.location('mIndexMissing'))
+
+        self.assertEqual(importlib.import_module('mIndexShared').LOCATION, 'first')
+        self.assertEqual(importlib.import_module('mIndexPackage.assetLib').NAME, 1)
+        self.assertIs(sys.modules['mIndexShared'].__spec__.loader.__class__, importlib.machinery.SourceFileLoader)
+
+        with open(self.cachePath) as _file:
+            self.assertIn(self.first, json.load(_file)['directories'])
+
+    def test_stale(self):
+
+        self.index.refresh()
+
+        os.remove(os.path.join(self.first, 'mIndexShared.py'))
+
+        # Stale entry is left to the path based finder
+        self.assertIsNone(self.index.find_spec('mIndexShared'))
+        self.assertEqual(importlib.import_module('mIndexShared').LOCATION, 'second')
+
+        importlib.invalidate_caches()
+
+        self.assertEqual(self.index.location('mIndexShared'), os.path.join(self.second, 'mIndexShared.py'))
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,123 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/tests/importProfilerLibTest.py [ FILE   ] - Unit test module.
+## @package mCore.tests.importProfilerLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+import mCore.importProfilerLib
+import mCore.packageRegistryLib
+import mCore.pythonUtilsLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class ImportProfilerTest(unittest.TestCase):
+
+    OUTPUT = ('import time: self [us] | cumulative | imported package\n'
+              'import time:       100 |        100 |     json\n'
+              'import time:       200 |        300 |   mAssetCore.assetLib\n'
+              'import time:        50 |        350 | mAssetCore\n'
+              'import time:        10 |         10 |     mAssetCore.shotLib\n'
+              'import time:        40 |         50 |   mShotCore\n'
+              'import time:        30 |         80 | mShot\n'
+              'Traceback is not an import time line\n')
+
+    def setUp(self):
+
+        self.directory = tempfile.mkdtemp()
+
+        mCore.pythonUtilsLib.createPythonPackages(self.directory,
+                                                  {'mAssetCore': {'packageInfoLib.py': 'NAME = "mAsset"\nVERSION = "2.1.0"\nPYTHON_PACKAGES = ["mAssetCore", "mShotCore"]\n'},
+                                                   'mShotCore' : None,
+                                                   'mShot'     : None},
+                                                  createUnitTestPackage=False)
+
+        self.resolver = mCore.importProfilerLib.PackageResolver([self.directory], registry=mCore.packageRegistryLib.PackageRegistry([self.directory], useCache=False))
+
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+
+    def test_parseImportTime(self):
+
+        records = mCore.importProfilerLib.parseImportTime(ImportProfilerTest.OUTPUT)
+
+        self.assertEqual([(x.name, x.depth, x.parent) for x in records], [('json'               , 2, 'mAssetCore.assetLib'),
+                                                                           ('mAssetCore.assetLib', 1, 'mAssetCore'),
+                                                                           ('mAssetCore'         , 0, None),
+                                                                           ('mAssetCore.shotLib' , 2, 'mShotCore'),
+                                                                           ('mShotCore'          , 1, 'mShot'),
+                                                                           ('mShot'              , 0, None)])
+
+    def test_resolve(self):
+
+        self.assertEqual(self.resolver.resolve('mShotCore.shotLib'), ('mAsset', '2.1.0'))
+        self.assertEqual(self.resolver.resolve('mShot')            , ('mShot' , ''))
+        self.assertEqual(self.resolver.resolve('os.path')[0]       , mCore.importProfilerLib.STANDARD_LIBRARY)
+
+    def test_profile(self):
+
+        records  = mCore.importProfilerLib.parseImportTime(ImportProfilerTest.OUTPUT)
+        profile  = mCore.importProfilerLib.ImportProfile.fromRecords('mShot', records, resolver=self.resolver)
+        packages = profile.packages()
+
+        self.assertEqual(packages['mAsset'], {'version': '2.1.0', 'modules': 4, 'self': 300, 'cumulative': 400})
+        self.assertEqual(packages['mShot'] , {'version': ''     , 'modules': 1, 'self': 30 , 'cumulative': 80})
+        self.assertEqual(profile.total(), 430)
+        self.assertEqual(profile.report()[0][0], 'mAsset')
+
+        filePath = os.path.join(self.directory, 'profile.json')
+        profile.save(filePath)
+
+        previous = mCore.importProfilerLib.ImportProfile.load(filePath)
+        previous.packages()['mAsset']['self'] = 100
+
+        rows = profile.compare(previous, minimum=0.1)
+
+        self.assertEqual(rows[0][0], 'mAsset')
+        self.assertEqual(rows[0][4], 'regressed')
+        self.assertEqual(rows[-1][4], '')
+
+    def test_create(self):
+
+        resolver = mCore.importProfilerLib.PackageResolver(registry=mCore.packageRegistryLib.PackageRegistry(useCache=False))
+        profile  = mCore.importProfilerLib.ImportProfile.create('mCore.enumAbs', resolver=resolver)
+
+        self.assertIn('mCore', profile.packages())
+        self.assertEqual(profile.packages()['mCore']['modules'], 3)
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,110 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/tests/importTimeTest.py [ FILE   ] - Unit test module.
+## @package mCore.tests.importTimeTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import subprocess
+import sys
+import unittest
+
+import mCore
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class ImportTimeTest(unittest.TestCase):
+
+    ## [ tuple of str ] - Modules commonly imported by other packages.
+    MODULES = ('mCore.dateTimeLib',
+               'mCore.displayLib',
+               'mCore.nameSpaceLib',
+               'mCore.packageEnvLib',
+               'mCore.packageInfoLib',
+               'mCore.platformLib',
+               'mCore.pythonUtilsLib')
+
+    ## [ tuple of str ] - Modules of the package, which are imported by importing MODULES.
+    PACKAGE_MODULES = ('mCore',
+                       'mCore.cacheLib',
+                       'mCore.dateTimeLib',
+                       'mCore.displayLib',
+                       'mCore.enumAbs',
+                       'mCore.nameSpaceLib',
+                       'mCore.packageEnvLib',
+                       'mCore.packageInfoLib',
+                       'mCore.platformLib',
+                       'mCore.pythonUtilsLib',
+                       'mCore.pythonVersionLib')
+
+    ## [ tuple of str ] - Third party modules, which must be imported only when they are used.
+    DEFERRED_MODULES = ('mFileSystem',
+                        'numpy')
+
+    def _importModules(self, modules):
+
+        code = ('import sys\n'
+                'before = set(sys.modules)\n'
+                'import {}\n'
+                'print(" ".join(sorted(set(sys.modules) - before)))\n').format(', '.join(modules))
+
+        environment = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(os.path.abspath(mCore.__file__))))
+
+        return subprocess.check_output([sys.executable, '-S', '-c', code], env=environment, universal_newlines=True).split()
+
+    def test_importPackage(self):
+
+        self.assertEqual(self._importModules(['mCore']), ['mCore'])
+
+    def test_packageModules(self):
+
+        imported = self._importModules(ImportTimeTest.MODULES)
+
+        self.assertEqual(tuple([x for x in imported if x == 'mCore' or x.startswith('mCore.')]), ImportTimeTest.PACKAGE_MODULES)
+
+    def test_deferredModules(self):
+
+        imported = self._importModules(ImportTimeTest.MODULES)
+
+        for module in ImportTimeTest.DEFERRED_MODULES:
+            self.assertNotIn(module, imported)
+
+    def test_lazyAttribute(self):
+
+        self.assertIn('displayLib', dir(mCore))
+        self.assertIs(mCore.platformLib, sys.modules['mCore.platformLib'])
+
+        with self.assertRaises(AttributeError):
+            mCore.missingLib
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,92 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/tests/packageIndexLibTest.py [ FILE   ] - Unit test module.
+## @package mCore.tests.packageIndexLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import unittest
+
+import mCore.packageIndexLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class PackageIndexTest(unittest.TestCase):
+
+    PACKAGES = {'mCore'     : {'KEYWORDS'       : ['core', 'namespace', 'platform'],
+                               'PLATFORMS'      : ['Linux', 'Darwin', 'Windows'],
+                               'APPLICATIONS'   : ['all'],
+                               'PYTHON_VERSIONS': ['2', '3']},
+                'mMaya'     : {'KEYWORDS'       : ['maya', 'namespace'],
+                               'PLATFORMS'      : ['Linux'],
+                               'APPLICATIONS'   : ['maya'],
+                               'PYTHON_VERSIONS': ['3.9']},
+                'mNuke'     : {'KEYWORDS'       : 'nuke',
+                               'PLATFORMS'      : ['Windows'],
+                               'APPLICATIONS'   : ['nuke'],
+                               'PYTHON_VERSIONS': ['2.7']}}
+
+    def setUp(self):
+
+        self.index = mCore.packageIndexLib.PackageIndex()
+
+        for name, data in PackageIndexTest.PACKAGES.items():
+            self.index.setPackage(name, data)
+
+    def test_search(self):
+
+        self.assertEqual(self.index.search(), ['mCore', 'mMaya', 'mNuke'])
+        self.assertEqual(self.index.search(keywords=['namespace'], platform='linux', pythonVersion='3'), ['mCore', 'mMaya'])
+        self.assertEqual(self.index.search(keywords=['NAME', 'co']), ['mCore'])
+        self.assertEqual(self.index.search(keywords=['name'], prefix=False), [])
+        self.assertEqual(self.index.search(application='maya'), ['mCore', 'mMaya'])
+        self.assertEqual(self.index.search(pythonVersion='2.7.18'), ['mCore', 'mNuke'])
+        self.assertEqual(self.index.search(pythonVersion='3.9', platform='Windows'), ['mCore'])
+
+    def test_update(self):
+
+        self.assertEqual(self.index.terms(mCore.packageIndexLib.Field.kKeywords, 'n'), ['namespace', 'nuke'])
+
+        self.assertTrue(self.index.setPackage('mNuke', {'KEYWORDS': ['nuke', 'compositing'], 'PLATFORMS': ['Linux']}))
+        self.assertFalse(self.index.setPackage('mNuke', {'KEYWORDS': ['nuke', 'compositing'], 'PLATFORMS': ['Linux']}))
+
+        self.assertEqual(self.index.search(keywords=['comp'], platform='Linux'), ['mNuke'])
+        self.assertEqual(self.index.search(pythonVersion='2'), ['mCore'])
+
+        self.assertTrue(self.index.removePackage('mNuke'))
+        self.assertFalse(self.index.removePackage('mNuke'))
+
+        self.assertEqual(self.index.terms(mCore.packageIndexLib.Field.kKeywords, 'n'), ['namespace'])
+        self.assertEqual(self.index.search(keywords=['comp']), [])
+        self.assertEqual(len(self.index), 2)
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
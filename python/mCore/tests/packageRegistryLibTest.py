@@ -0,0 +1,167 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/tests/packageRegistryLibTest.py [ FILE   ] - Unit test module.
+## @package mCore.tests.packageRegistryLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import mCore.packageRegistryLib
+import mCore.pythonUtilsLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class PackageRegistryTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory  = tempfile.mkdtemp()
+        self.first      = os.path.join(self.directory, 'first')
+        self.second     = os.path.join(self.directory, 'second')
+        self.cachePath  = os.path.join(self.directory, 'packageRegistry.json')
+
+        self._createPackage(self.first , 'mAsset', 'NAME = "mAsset"\nVERSION = "2.0.0"\nPYTHON_PACKAGES = ["mAsset", "mAssetUI"]\nDEPENDENT_PACKAGES = ["mCore"]\n')
+        self._createPackage(self.second, 'mAsset', 'NAME = "mAsset"\nVERSION = "1.0.0"\n')
+        self._createPackage(self.second, 'mShot' , 'NAME = "mShot"\nVERSION = "1.0.0"\nKEYWORDS = ("shot", {"edit"})\nSIDE_EFFECT = open("/")\n')
+
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+
+    def _createPackage(self, root, name, content):
+
+        packagePath = mCore.pythonUtilsLib.createPythonPackage(root, name, createUnitTestPackage=False)
+        filePath    = mCore.pythonUtilsLib.createPythonModule(packagePath, 'packageInfoLib.py', content)
+
+        # Modification times within the granularity aren't trusted by the cache
+        past = time.time() - 60
+        os.utime(filePath, (past, past))
+
+        return filePath
+
+    def _createRegistry(self):
+
+        return mCore.packageRegistryLib.PackageRegistry([self.first, self.second], cacheFilePath=self.cachePath, maxWorkers=2)
+
+    def test_packages(self):
+
+        registry = self._createRegistry()
+
+        self.assertEqual(registry.refresh(), {'packages': 3, 'read': 3, 'removed': 0})
+        self.assertEqual([(x.name(), x.version()) for x in registry.packages()], [('mAsset', '2.0.0'), ('mShot', '1.0.0')])
+
+        package = registry.findPythonPackage('mAssetUI')
+
+        self.assertEqual(package.pythonDirectory(), os.path.realpath(self.first))
+        self.assertEqual(package.dependentPackages(), ['mCore'])
+        self.assertEqual(registry.package('mShot').get('KEYWORDS'), ['shot', ['edit']])
+        self.assertIsNone(registry.package('mShot').get('SIDE_EFFECT'))
+        self.assertIsNone(registry.package('mMissing'))
+
+    def test_cache(self):
+
+        self._createRegistry().refresh()
+
+        self.assertEqual(self._createRegistry().refresh()['read'], 0)
+
+        filePath = self._createPackage(self.second, 'mShot', '')
+        with open(filePath, 'a') as _file:
+            _file.write('VERSION = "1.1.0"\n')
+
+        past = time.time() - 30
+        os.utime(filePath, (past, past))
+
+        registry = self._createRegistry()
+
+        self.assertEqual(registry.refresh()['read'], 1)
+        self.assertEqual(registry.package('mShot').version(), '1.1.0')
+
+        shutil.rmtree(os.path.join(self.second, 'mShot'))
+
+        self.assertEqual(self._createRegistry().refresh()['removed'], 1)
+
+    def test_refreshPackage(self):
+
+        registry = self._createRegistry()
+        registry.refresh()
+
+        filePath = self._createPackage(self.second, 'mEdit', 'NAME = "mEdit"\n')
+
+        self.assertEqual(registry.refreshPackage(os.path.dirname(filePath)).name(), 'mEdit')
+        self.assertEqual(registry.package('mEdit').filePath(), os.path.realpath(filePath))
+
+        os.remove(filePath)
+
+        self.assertIsNone(registry.refreshPackage(filePath))
+        self.assertIsNone(registry.package('mEdit'))
+        self.assertIsNone(registry.refreshPackage(os.path.join(self.directory, 'elsewhere')))
+
+    def test_refreshSymbolicLink(self):
+
+        filePath = self._createPackage(os.path.join(self.directory, 'external'), 'mEdit', 'NAME = "mEdit"\nVERSION = "1.0.0"\n')
+        linkPath = os.path.join(self.second, 'mEdit')
+
+        os.symlink(os.path.dirname(filePath), linkPath)
+
+        registry = self._createRegistry()
+
+        self.assertEqual(registry.package('mEdit').version(), '1.0.0')
+
+        with open(filePath, 'w') as _file:
+            _file.write('NAME = "mEdit"\nVERSION = "1.0.10"\n')
+
+        self.assertEqual(registry.refreshPackage(linkPath).version(), '1.0.10')
+        self.assertEqual(registry.package('mEdit').version(), '1.0.10')
+
+    def test_snapshot(self):
+
+        registry = self._createRegistry()
+        snapshot = registry.snapshot()
+
+        self._createPackage(self.second, 'mEdit', 'NAME = "mEdit"\n')
+        shutil.rmtree(os.path.join(self.second, 'mShot'))
+
+        self.assertEqual(registry.refreshPackages([os.path.join(self.second, x) for x in ('mEdit', 'mShot', 'mMissing')]), 2)
+        self.assertEqual(registry.refreshPackages([os.path.join(self.second, 'mEdit')]), 0)
+
+        # Old snapshot doesn't change
+        self.assertEqual([x.name() for x in snapshot.packages()], ['mAsset', 'mShot'])
+        self.assertEqual([x.name() for x in registry.snapshot().packages()], ['mAsset', 'mEdit'])
+        self.assertEqual(registry.snapshot().generation(), snapshot.generation() + 1)
+        self.assertEqual(registry.snapshot().findPythonPackage('mAssetUI').version(), '2.0.0')
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,180 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/tests/packageWatcherLibTest.py [ FILE   ] - Unit test module.
+## @package mCore.tests.packageWatcherLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import io
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+import mCore.displayLib
+import mCore.packageRegistryLib
+import mCore.packageWatcherLib
+import mCore.pythonUtilsLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class PackageWatcherTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory  = os.path.realpath(tempfile.mkdtemp())
+        self.registry   = mCore.packageRegistryLib.PackageRegistry([self.directory], useCache=False)
+
+        self._writePackage('mCore', '1.0.0')
+        self._writePackage('mAsset', '1.0.0')
+
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+
+    def _writePackage(self, name, version):
+
+        packagePath = mCore.pythonUtilsLib.createPythonPackage(self.directory, name, createUnitTestPackage=False)
+        filePath    = os.path.join(packagePath, 'packageInfoLib.py')
+
+        with open(filePath, 'w') as _file:
+            _file.write('NAME = "{}"\nVERSION = "{}"\n'.format(name, version))
+
+        # Polling compares modification times, make sure they differ
+        past = time.time() - 60 + len(version)
+        os.utime(filePath, (past, past))
+
+        return packagePath
+
+    def _assertUpdates(self, backend):
+
+        watcher = mCore.packageWatcherLib.PackageWatcher(self.registry, backend=backend)
+        watcher.start(useThread=False)
+
+        try:
+            snapshot = watcher.snapshot()
+
+            self.assertEqual(watcher.backend(), backend)
+            self.assertEqual(watcher.poll(), set())
+
+            self._writePackage('mAsset', '1.1.10')
+            self._writePackage('mShot' , '1.0.0')
+            shutil.rmtree(os.path.join(self.directory, 'mCore'))
+
+            self.assertEqual(watcher.poll(), set([os.path.join(self.directory, x) for x in ('mAsset', 'mCore', 'mShot')]))
+            self.assertEqual([(x.name(), x.version()) for x in watcher.snapshot().packages()], [('mAsset', '1.1.10'), ('mShot', '1.0.0')])
+            self.assertEqual([x.name() for x in snapshot.packages()], ['mAsset', 'mCore'])
+
+        finally:
+            watcher.stop()
+
+    def test_polling(self):
+
+        self._assertUpdates(mCore.packageWatcherLib.Backend.kPolling)
+
+    @unittest.skipIf(mCore.packageWatcherLib._loadInotify() is None, 'inotify is not available')
+    def test_inotify(self):
+
+        self._assertUpdates(mCore.packageWatcherLib.Backend.kInotify)
+
+    @unittest.skipIf(mCore.packageWatcherLib._loadInotify() is None, 'inotify is not available')
+    def test_watchRoots(self):
+
+        watcher = mCore.packageWatcherLib._InotifyWatcher(mCore.packageWatcherLib._loadInotify(), [self.directory])
+
+        try:
+            # Watches of directories created while events are lost are added again
+            packagePath = self._writePackage('mShot', '1.0.0')
+            watcher._watches.clear()
+            watcher._watchRoots()
+
+            self.assertEqual(sorted([x[0] for x in watcher._watches.values()]),
+                             sorted([self.directory] + [os.path.join(self.directory, x) for x in ('mAsset', 'mCore', 'mShot')]))
+
+            self._writePackage('mShot', '1.0.10')
+
+            self.assertIn(packagePath, watcher.read())
+
+        finally:
+            watcher.close()
+
+    def test_threadError(self):
+
+        out     = io.StringIO()
+        sink    = mCore.displayLib.StreamSink(stream=out, useColor=False)
+        changed = threading.Event()
+        calls   = []
+
+        def onChange(snapshot, paths):
+            calls.append(paths)
+            if len(calls) == 1:
+                raise RuntimeError('onChange failed')
+            changed.set()
+
+        watcher = mCore.packageWatcherLib.PackageWatcher(self.registry, interval=0.05, latency=0.01, onChange=onChange)
+
+        mCore.displayLib.Display.addSink(sink)
+        watcher.start()
+
+        try:
+            self._writePackage('mCore', '2.0.10')
+
+            # Roots are scanned after the error without another change
+            self.assertTrue(changed.wait(10))
+            self.assertIsNone(calls[-1])
+            self.assertIn('onChange failed', out.getvalue())
+
+        finally:
+            watcher.stop()
+            mCore.displayLib.Display.removeSink(sink)
+
+    def test_thread(self):
+
+        changed = threading.Event()
+        watcher = mCore.packageWatcherLib.PackageWatcher(self.registry,
+                                                         interval=0.05,
+                                                         latency=0.01,
+                                                         onChange=lambda snapshot, paths: changed.set())
+        watcher.start()
+
+        try:
+            self._writePackage('mCore', '2.0.10')
+
+            self.assertTrue(changed.wait(10))
+            self.assertEqual(watcher.snapshot().package('mCore').version(), '2.0.10')
+
+        finally:
+            watcher.stop()
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,77 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/tests/pathListLibTest.py [ FILE   ] - Unit test module.
+## @package mCore.tests.pathListLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import unittest
+
+import mCore.pathListLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class PathListTest(unittest.TestCase):
+
+    def test_pathList(self):
+
+        pathList = mCore.pathListLib.PathList('/a:/b/:/a::/c', separator=':')
+
+        self.assertEqual(pathList.toList(), ['/a', '/b', '/c'])
+        self.assertEqual(pathList.pruned(), 2)
+
+        self.assertEqual(pathList.prepend(['/c', '/d']), 1)
+        self.assertEqual(pathList.append('/d:/e'), 1)
+        self.assertEqual(pathList.toString(), '/c:/d:/a:/b:/e')
+        self.assertEqual(pathList.pruned(), 4)
+
+        self.assertIn('/b/./', pathList)
+        self.assertTrue(pathList.remove('/b'))
+        self.assertFalse(pathList.remove('/b'))
+        self.assertNotIn('/b', pathList)
+        self.assertEqual(len(pathList), 4)
+
+    def test_environment(self):
+
+        environment = {'PATH': '/usr/bin:/bin:/usr/bin'}
+        pathList    = mCore.pathListLib.PathList.fromEnvironment('PATH', environment, separator=':')
+
+        pathList.prepend('/opt/bin')
+
+        self.assertEqual(pathList.setEnvironment('PATH', environment), '/opt/bin:/usr/bin:/bin')
+        self.assertEqual(environment, {'PATH': '/opt/bin:/usr/bin:/bin'})
+
+        mCore.pathListLib.PathList(separator=':').setEnvironment('PATH', environment)
+
+        self.assertEqual(environment, {})
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,144 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/tests/platformLibTest.py [ FILE   ] - Unit test module.
+## @package mCore.tests.platformLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+import mCore.platformLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class PlatformInfoTest(unittest.TestCase):
+
+    def test_snapshot(self):
+
+        info = mCore.platformLib.getPlatformInfo()
+
+        self.assertIs(info, mCore.platformLib.getPlatformInfo())
+        self.assertIn(info.system, mCore.platformLib.Name.listAttributes(stringOnly=True, getValues=True, removeK=True))
+        self.assertNotIn(info.system, info.others)
+        self.assertEqual(info.isLinux, mCore.platformLib.Platform.isLinux())
+        self.assertGreaterEqual(info.cpuCount, info.availableCpuCount)
+        self.assertGreaterEqual(info.availableCpuCount, info.effectiveCpuCount)
+        self.assertGreaterEqual(info.effectiveCpuCount, 1)
+        self.assertGreater(info.pageSize, 0)
+
+        with self.assertRaises(AttributeError):
+            info.cpuCount = 1
+
+class CgroupTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory = tempfile.mkdtemp()
+        self.root      = mCore.platformLib._CGROUP_ROOT
+        self.procFile  = mCore.platformLib._PROC_CGROUP_FILE
+
+        mCore.platformLib._CGROUP_ROOT      = os.path.join(self.directory, 'cgroup')
+        mCore.platformLib._PROC_CGROUP_FILE = os.path.join(self.directory, 'cgroup.proc')
+
+    def tearDown(self):
+
+        mCore.platformLib._CGROUP_ROOT      = self.root
+        mCore.platformLib._PROC_CGROUP_FILE = self.procFile
+
+        shutil.rmtree(self.directory)
+
+    def _createFile(self, relativePath, content):
+
+        filePath = os.path.join(self.directory, relativePath)
+
+        if not os.path.isdir(os.path.dirname(filePath)):
+            os.makedirs(os.path.dirname(filePath))
+
+        with open(filePath, 'w') as _file:
+            _file.write(content)
+
+    def test_v2(self):
+
+        self._createFile('cgroup.proc', '0::/job.slice\n')
+        self._createFile('cgroup/job.slice/cpu.max', '150000 100000\n')
+        self._createFile('cgroup/job.slice/memory.max', '1073741824\n')
+
+        self.assertEqual(mCore.platformLib._getCgroupCpuQuota(), 1.5)
+        self.assertEqual(mCore.platformLib._getCgroupMemoryLimit(), 1073741824)
+
+        self._createFile('cgroup/job.slice/cpu.max', 'max 100000\n')
+        self._createFile('cgroup/job.slice/memory.max', 'max\n')
+
+        self.assertIsNone(mCore.platformLib._getCgroupCpuQuota())
+        self.assertIsNone(mCore.platformLib._getCgroupMemoryLimit())
+
+    def test_v1(self):
+
+        self._createFile('cgroup.proc', '4:memory:/docker/1\n3:cpu,cpuacct:/docker/1\n')
+        self._createFile('cgroup/cpu/cpu.cfs_quota_us', '200000\n')
+        self._createFile('cgroup/cpu/cpu.cfs_period_us', '100000\n')
+        self._createFile('cgroup/memory/memory.limit_in_bytes', '536870912\n')
+
+        # Cgroup path isn't visible, root directories of the controllers are used
+        self.assertEqual(mCore.platformLib._getCgroupCpuQuota(), 2.0)
+        self.assertEqual(mCore.platformLib._getCgroupMemoryLimit(), 536870912)
+
+        self._createFile('cgroup/cpu/cpu.cfs_quota_us', '-1\n')
+        self._createFile('cgroup/memory/memory.limit_in_bytes', '9223372036854771712\n')
+
+        self.assertIsNone(mCore.platformLib._getCgroupCpuQuota())
+        self.assertIsNone(mCore.platformLib._getCgroupMemoryLimit())
+
+    def test_invalid(self):
+
+        self._createFile('cgroup.proc', '0::/\n')
+        self._createFile('cgroup/cpu.max', 'garbage\n')
+        self._createFile('cgroup/memory.max', '\n')
+
+        self.assertIsNone(mCore.platformLib._getCgroupCpuQuota())
+        self.assertIsNone(mCore.platformLib._getCgroupMemoryLimit())
+
+        self._createFile('cgroup/cpu.max', '100000 0\n')
+        self._createFile('cgroup/memory.max', '12abc\n')
+
+        self.assertIsNone(mCore.platformLib._getCgroupCpuQuota())
+        self.assertIsNone(mCore.platformLib._getCgroupMemoryLimit())
+
+    def test_missing(self):
+
+        self.assertIsNone(mCore.platformLib._getCgroupCpuQuota())
+        self.assertIsNone(mCore.platformLib._getCgroupMemoryLimit())
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,233 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/tests/pythonUtilsLibTest.py [ FILE   ] - Unit test module.
+## @package mCore.tests.pythonUtilsLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import importlib.util
+import os
+import py_compile
+import shutil
+import tempfile
+import time
+import unittest
+
+import mCore.pythonUtilsLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class PythonObjectsTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory      = tempfile.mkdtemp()
+        self.cacheDirectory = tempfile.mkdtemp()
+
+        packagePath = mCore.pythonUtilsLib.createPythonPackage(self.directory, 'mAsset')
+        modulePath  = mCore.pythonUtilsLib.createPythonModule(packagePath, 'assetLib.py', 'NAME = 1\n')
+
+        py_compile.compile(modulePath)
+        py_compile.compile(os.path.join(packagePath, '__init__.py'))
+
+        with open(os.path.join(packagePath, 'legacyLib.pyc'), 'wb') as _file:
+            _file.write(b'0000')
+
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+        shutil.rmtree(self.cacheDirectory)
+
+    def test_removePythonObjects(self):
+
+        packagePath = os.path.join(self.directory, 'mAsset')
+        summary     = mCore.pythonUtilsLib.removePythonObjects([self.directory, packagePath, self.directory])
+
+        self.assertEqual(summary['files']      , 3)
+        self.assertEqual(summary['directories'], 1)
+        self.assertEqual(summary['errors']     , 0)
+        self.assertGreater(summary['bytes']    , 4)
+
+        self.assertFalse(os.path.isdir(os.path.join(packagePath, '__pycache__')))
+        self.assertTrue(os.path.isfile(os.path.join(packagePath, 'assetLib.py')))
+
+        self.assertEqual(mCore.pythonUtilsLib.removePythonObjects(self.directory)['files'], 0)
+
+    def test_removeStalePythonObjects(self):
+
+        packagePath  = os.path.join(self.directory, 'mAsset')
+        manifestPath = os.path.join(self.cacheDirectory, 'manifest.json')
+        cachePath    = os.path.join(packagePath, '__pycache__')
+
+        os.remove(os.path.join(packagePath, 'assetLib.py'))
+
+        summary = mCore.pythonUtilsLib.removeStalePythonObjects(self.directory, manifestFilePath=manifestPath)
+
+        # assetLib and legacyLib objects are stale, __init__ object is up to date
+        self.assertEqual(summary['files']      , 2)
+        self.assertEqual(summary['directories'], 0)
+        self.assertEqual(summary['scanned']    , 3)
+        self.assertEqual(os.listdir(cachePath) , [x for x in os.listdir(cachePath) if x.startswith('__init__.')])
+
+        # Move modification times out of the racy window, so the manifest can be trusted
+        past = time.time() - 60
+        for directory in (self.directory, packagePath, os.path.join(packagePath, 'tests')):
+            os.utime(directory, (past, past))
+
+        mCore.pythonUtilsLib.removeStalePythonObjects(self.directory, manifestFilePath=manifestPath)
+        summary = mCore.pythonUtilsLib.removeStalePythonObjects(self.directory, manifestFilePath=manifestPath)
+
+        self.assertEqual(summary['scanned'], 0)
+        self.assertEqual(summary['skipped'], 3)
+
+        os.remove(os.path.join(packagePath, '__init__.py'))
+
+        summary = mCore.pythonUtilsLib.removeStalePythonObjects(self.directory, manifestFilePath=manifestPath)
+
+        self.assertEqual(summary['files']      , 1)
+        self.assertEqual(summary['directories'], 1)
+        self.assertEqual(summary['scanned']    , 1)
+        self.assertFalse(os.path.isdir(cachePath))
+
+class CreatePythonPackagesTest(unittest.TestCase):
+
+    SPEC = {'mAsset'          : {'assetLib.py': 'NAME = 1\n'},
+            'mAsset/exporters': None}
+
+    def setUp(self):
+
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+
+    def test_dryRun(self):
+
+        operations = mCore.pythonUtilsLib.createPythonPackages(self.directory, CreatePythonPackagesTest.SPEC, dryRun=True)
+        operations = [(x[0], os.path.relpath(x[1], self.directory)) for x in operations]
+
+        self.assertEqual(operations, [('makedirs', os.path.join('mAsset', 'exporters', 'tests')),
+                                      ('makedirs', os.path.join('mAsset', 'tests')),
+                                      ('create'  , os.path.join('mAsset', '__init__.py')),
+                                      ('create'  , os.path.join('mAsset', 'assetLib.py')),
+                                      ('create'  , os.path.join('mAsset', 'exporters', '__init__.py')),
+                                      ('create'  , os.path.join('mAsset', 'exporters', 'tests', '__init__.py')),
+                                      ('create'  , os.path.join('mAsset', 'tests', '__init__.py'))])
+        self.assertEqual(os.listdir(self.directory), [])
+
+        with self.assertRaises(ValueError):
+            mCore.pythonUtilsLib.createPythonPackages(self.directory, {'../mAsset': None}, dryRun=True)
+
+        for name in ('sub/assetLib.py', os.path.join('sub', 'assetLib.py'), '..', ''):
+            with self.assertRaises(ValueError):
+                mCore.pythonUtilsLib.createPythonPackages(self.directory, {'mAsset': {name: None}})
+
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_createPythonPackages(self):
+
+        modulePath = mCore.pythonUtilsLib.createPythonModule(os.path.join(self.directory, 'mAsset'), 'assetLib.py', 'NAME = 0\n')
+
+        self.assertEqual(len(mCore.pythonUtilsLib.createPythonPackages(self.directory, CreatePythonPackagesTest.SPEC)), 6)
+        self.assertTrue(os.path.isfile(os.path.join(self.directory, 'mAsset', 'exporters', 'tests', '__init__.py')))
+
+        # Existing files are not modified
+        with open(modulePath) as _file:
+            self.assertEqual(_file.read(), 'NAME = 0\n')
+
+        self.assertEqual(len(mCore.pythonUtilsLib.createPythonPackages(self.directory, CreatePythonPackagesTest.SPEC)), 2)
+
+class CompilePythonObjectsTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory = tempfile.mkdtemp()
+        self.modules   = []
+
+        for name in ('mAsset', 'mShot'):
+            packagePath = mCore.pythonUtilsLib.createPythonPackage(self.directory, name, createUnitTestPackage=False)
+            self.modules.append(mCore.pythonUtilsLib.createPythonModule(packagePath, 'lib.py', 'NAME = 1\n'))
+
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+
+    def test_compilePythonObjects(self):
+
+        summary = mCore.pythonUtilsLib.compilePythonObjects(self.directory, optimizations=(0, 2), maxWorkers=2)
+
+        self.assertEqual(summary['compiled'], 8)
+        self.assertEqual(summary['errors']  , 0)
+        self.assertEqual(sorted(summary['packages']), [os.path.join(os.path.realpath(self.directory), x) for x in ('mAsset', 'mShot')])
+        self.assertTrue(os.path.isfile(importlib.util.cache_from_source(self.modules[0], optimization=2)))
+
+        with open(self.modules[0], 'a') as _file:
+            _file.write('SIZE = 2\n')
+
+        summary = mCore.pythonUtilsLib.compilePythonObjects(self.directory, optimizations=(0, 2))
+
+        self.assertEqual(summary['compiled'], 2)
+        self.assertEqual(summary['skipped'] , 6)
+
+    def test_compilePythonObjectsHash(self):
+
+        mCore.pythonUtilsLib.compilePythonObjects(self.directory)
+
+        objectPath = importlib.util.cache_from_source(self.modules[0])
+        py_compile.compile(self.modules[0], cfile=objectPath, invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH)
+
+        self.assertEqual(mCore.pythonUtilsLib.compilePythonObjects(self.directory)['compiled'], 0)
+
+        # Same size and modification time, only the hash tells the source changed
+        sourceStat = os.stat(self.modules[0])
+
+        with open(self.modules[0], 'w') as _file:
+            _file.write('NAME = 2\n')
+
+        os.utime(self.modules[0], ns=(sourceStat.st_atime_ns, sourceStat.st_mtime_ns))
+
+        self.assertEqual(mCore.pythonUtilsLib.compilePythonObjects(self.directory)['compiled'], 1)
+
+    def test_compilePythonObjectsError(self):
+
+        mCore.pythonUtilsLib.createPythonModule(self.directory, 'broken.py', 'def (\n')
+
+        summary = mCore.pythonUtilsLib.compilePythonObjects(self.directory)
+
+        self.assertEqual(summary['errors'], 1)
+        self.assertEqual(summary['packages'][os.path.join(os.path.realpath(self.directory), 'broken.py')]['errors'], 1)
+
+        with self.assertRaises(ValueError):
+            mCore.pythonUtilsLib.compilePythonObjects(self.directory, optimizations=(3,))
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
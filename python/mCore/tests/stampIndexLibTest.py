@@ -0,0 +1,139 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/tests/stampIndexLibTest.py [ FILE   ] - Unit test module.
+## @package mCore.tests.stampIndexLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import mCore.dateTimeLib
+import mCore.stampIndexLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class StampIndexTest(unittest.TestCase):
+
+    NAMES = ['soldier_2013.05.19_10.01.45.ma',
+             'soldier_2013.05.20_19.32.22.ma',
+             'soldier_2013.05.18_08.00.00.ma']
+
+    def setUp(self):
+
+        self.directory = tempfile.mkdtemp()
+
+        for name in StampIndexTest.NAMES + ['notes.txt']:
+            self._createFile(name)
+
+        self.index = mCore.stampIndexLib.StampIndex(self.directory, localTime=False)
+
+    def tearDown(self):
+
+        shutil.rmtree(self.directory)
+
+    def _createFile(self, name):
+
+        with open(os.path.join(self.directory, name), 'w') as _file:
+            _file.write(name)
+
+    def _age(self):
+
+        # Directory modified well before the scan isn't rescanned until its modification time changes
+        mtime = time.time() - 60
+        os.utime(self.directory, (mtime, mtime))
+
+    def test_latest(self):
+
+        self.assertEqual(len(self.index), 3)
+        self.assertEqual(self.index.latest(), ['soldier_2013.05.20_19.32.22.ma'])
+        self.assertEqual(self.index.latest(2), ['soldier_2013.05.20_19.32.22.ma', 'soldier_2013.05.19_10.01.45.ma'])
+        self.assertEqual(self.index.latest(0), [])
+        self.assertEqual(self.index.seconds('soldier_2013.05.20_19.32.22.ma'), 1369078342)
+        self.assertIsNone(self.index.seconds('notes.txt'))
+
+    def test_invalidStamps(self):
+
+        # Non ASCII digits and dates, which don't exist, aren't stamps
+        self._createFile('soldier_\u0662\u0660\u0661\u0663.05.21_00.00.00.ma')
+        self._createFile('soldier_2013.02.30_00.00.00.ma')
+
+        self.assertTrue(self.index.refresh(force=True))
+        self.assertEqual(len(self.index), 3)
+        self.assertEqual(self.index.latest(), ['soldier_2013.05.20_19.32.22.ma'])
+
+    def test_between(self):
+
+        start, end = mCore.dateTimeLib.parseStamps(['2013.05.19_00.00.00', '2013.05.20_19.32.22'], localTime=False)
+
+        self.assertEqual(self.index.between(start, end), ['soldier_2013.05.19_10.01.45.ma', 'soldier_2013.05.20_19.32.22.ma'])
+        self.assertEqual(self.index.between(end=start), ['soldier_2013.05.18_08.00.00.ma'])
+        self.assertEqual(self.index.between(start=end + 1), [])
+        self.assertEqual(len(self.index.between()), 3)
+
+    def test_recent(self):
+
+        name = 'soldier_{}.ma'.format(mCore.dateTimeLib.getDateTimeForFileSystem())
+        self._createFile(name)
+
+        index = mCore.stampIndexLib.StampIndex(self.directory)
+
+        self.assertEqual(index.recent(3600), [name])
+        self.assertEqual(self.index.recent(3600), [name])
+
+    def test_refresh(self):
+
+        self._age()
+
+        self.assertTrue(self.index.refresh())
+        self.assertFalse(self.index.refresh())
+        self.assertEqual(len(self.index), 3)
+
+        self._createFile('soldier_2013.05.21_00.00.00.ma')
+        os.remove(os.path.join(self.directory, 'soldier_2013.05.18_08.00.00.ma'))
+
+        self.assertTrue(self.index.refresh())
+        self.assertEqual(self.index.latest(), ['soldier_2013.05.21_00.00.00.ma'])
+        self.assertEqual(self.index.between(), ['soldier_2013.05.19_10.01.45.ma',
+                                                'soldier_2013.05.20_19.32.22.ma',
+                                                'soldier_2013.05.21_00.00.00.ma'])
+
+        self._age()
+
+        self.assertTrue(self.index.refresh())
+        self.assertFalse(self.index.refresh())
+        self.assertTrue(self.index.refresh(force=True))
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,86 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/tests/versionLibTest.py [ FILE   ] - Unit test module.
+## @package mCore.tests.versionLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import unittest
+
+import mCore.versionLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class VersionTest(unittest.TestCase):
+
+    def test_parseVersion(self):
+
+        self.assertEqual(mCore.versionLib.sortVersions(['1.10', '1.0.post1', '1.9', '1.0rc1', '1.0.0-beta.10', '1.0.0-beta.2', '1.0.dev3', 'v0.9']),
+                         ['v0.9', '1.0.dev3', '1.0.0-beta.2', '1.0.0-beta.10', '1.0rc1', '1.0.post1', '1.9', '1.10'])
+
+        self.assertEqual(mCore.versionLib.sortVersions(['1.0a1.post1', '1.0a1', '1.0a1.1', '1.0a1.dev1', '1.0a1.dev2', '1.0.post1.dev1', '1.0.post1', '1.0']),
+                         ['1.0a1.dev1', '1.0a1.dev2', '1.0a1', '1.0a1.1', '1.0a1.post1', '1.0', '1.0.post1.dev1', '1.0.post1'])
+
+        self.assertEqual(mCore.versionLib.compareVersions('1.0', '1.0.0+local'), 0)
+        self.assertEqual(mCore.versionLib.compareVersions('1.0-1', '1.0'), 1)
+        self.assertIs(mCore.versionLib.parseVersion('2.1.0'), mCore.versionLib.parseVersion('2.1.0'))
+        self.assertTrue(mCore.versionLib.isPreRelease('2.0.0-alpha'))
+        self.assertFalse(mCore.versionLib.isPreRelease('2.0.0'))
+        self.assertTrue(mCore.versionLib.isPreRelease('2.0.0.post1.dev1'))
+        self.assertRaises(ValueError, mCore.versionLib.parseVersion, 'latest')
+
+    def test_constraint(self):
+
+        self.assertEqual(mCore.versionLib.Constraint('>=1.2, <2 || ==3.*').filter(['1.1', '1.2', '1.9.9', '2.0', '3.0', '3.5.1', '4']),
+                         ['1.2', '1.9.9', '3.0', '3.5.1'])
+        self.assertEqual(mCore.versionLib.Constraint('~=1.4.2').filter(['1.4.1', '1.4.2', '1.4.9', '1.5']), ['1.4.2', '1.4.9'])
+        self.assertEqual(mCore.versionLib.Constraint('~=1.4').filter(['1.3', '1.4', '1.9', '2.0']), ['1.4', '1.9'])
+        self.assertEqual(mCore.versionLib.Constraint('>1, !=1.3.*').filter(['1.0', '1.2', '1.3.4', '1.4']), ['1.2', '1.4'])
+        self.assertTrue(mCore.versionLib.Constraint('1.0').match('1.0.0'))
+        self.assertTrue(mCore.versionLib.Constraint('*').match('0.1'))
+        self.assertIs(mCore.versionLib.parseConstraint('<2'), mCore.versionLib.parseConstraint('<2'))
+
+        for text in ('>=latest', '>=1.*', '~=1'):
+            self.assertRaises(ValueError, mCore.versionLib.Constraint, text)
+
+    def test_selectBestVersions(self):
+
+        candidates = {'mCore' : ['1.0.0', '1.4.2', '2.0.0b1', '1.4.10'],
+                      'mAsset': ['0.9'],
+                      'mShot' : ['2.0.0b1', '1.0']}
+
+        self.assertEqual(mCore.versionLib.selectBestVersions(candidates, {'mCore': '~=1.0', 'mAsset': '>=1'}),
+                         {'mCore': '1.4.10', 'mAsset': None, 'mShot': '1.0'})
+
+        self.assertEqual(mCore.versionLib.selectBestVersions(candidates, includePreReleases=True)['mShot'], '2.0.0b1')
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
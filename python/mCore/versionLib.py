@@ -0,0 +1,486 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mCore/versionLib.py @brief [ FILE   ] - Package version utilities.
+## @package mCore.versionLib    @brief [ MODULE ] - Package version utilities.
+#
+#  VERSION constants of packageInfoLib modules are parsed into tuples, which compare the way
+#  versions do. Parsed versions and constraints are memoized, so each string is parsed once.
+#
+# @code
+#
+#import mCore.versionLib
+#
+#mCore.versionLib.parseVersion('1.10.0') > mCore.versionLib.parseVersion('1.9')
+# #True
+#
+#mCore.versionLib.Constraint('>=1.2, <2 || ==3.*').match('1.4.1')
+# #True
+#
+#mCore.versionLib.selectBestVersions({'mCore': ['1.0.0', '1.4.2', '2.0.0b1']}, {'mCore': '~=1.0'})
+# #{'mCore': '1.4.2'}
+#
+# @endcode
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import re
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ _sre.SRE_Pattern ] - Release and suffix of a version.
+_VERSION_PATTERN = re.compile(r'^\s*v?(\d+(?:\.\d+)*)(?:[-_.]?(.*?))?(?:\+.*)?\s*$', re.IGNORECASE)
+
+## [ _sre.SRE_Pattern ] - Operator and version of a constraint clause.
+_CLAUSE_PATTERN = re.compile(r'^\s*(~=|==|!=|>=|<=|>|<|=)?\s*([^\s]+)\s*$')
+
+## [ _sre.SRE_Pattern ] - Alphabetical and numerical parts of a version suffix.
+_SUFFIX_PATTERN = re.compile(r'[a-z]+|\d+')
+
+## [ dict ] - Labels of version suffixes as keys and their phases as values.
+_PHASES = {'dev'    : 0,
+           'a'      : 1,
+           'alpha'  : 1,
+           'b'      : 2,
+           'beta'   : 2,
+           'c'      : 3,
+           'pre'    : 3,
+           'preview': 3,
+           'rc'     : 3,
+           'post'   : 5,
+           'p'      : 5,
+           'r'      : 5,
+           'rev'    : 5}
+
+## [ int ] - Phase of unknown labels, which are considered as pre-releases.
+_UNKNOWN_PHASE = 1
+
+## [ int ] - Phase of final releases.
+_FINAL_PHASE = 4
+
+## [ tuple ] - Suffix item of dev labels following another label, such as dev of 1.0a1.dev1.
+_DEV_ITEM = (0, 0, 'dev')
+
+## [ tuple ] - Suffix item, which ends each suffix tuple.
+_END_ITEM = (1, 0, '')
+
+## [ int ] - Maximum number of memoized versions and constraints, memos are cleared when it is reached.
+_MEMO_SIZE = 100000
+
+## [ dict ] - Version strings as keys and their parsed versions as values.
+_VERSIONS = {}
+
+## [ dict ] - Constraint strings as keys and mCore.versionLib.Constraint instances as values.
+_CONSTRAINTS = {}
+
+#
+## @brief Parse given version.
+#
+#  @param text [ str | None | in  ] - Version.
+#
+#  @exception ValueError - If the version doesn't start with a number.
+#
+#  @return tuple - Release tuple without trailing zeros, phase and suffix tuple.
+def _parseVersion(text):
+
+    match = _VERSION_PATTERN.match(text)
+    if not match:
+        raise ValueError('Invalid version: {}'.format(text))
+
+    release = [int(x) for x in match.group(1).split('.')]
+    while len(release) > 1 and not release[-1]:
+        release.pop()
+
+    suffix  = _SUFFIX_PATTERN.findall((match.group(2) or '').lower())
+    phase   = _FINAL_PHASE
+
+    if suffix:
+
+        if suffix[0].isdigit():
+            # Revisions such as 1.0-1
+            phase = _PHASES['post']
+        else:
+            label = suffix.pop(0)
+            phase = _PHASES.get(label)
+            if phase is None:
+                phase = _UNKNOWN_PHASE
+                suffix.insert(0, label)
+
+    # Dev labels compare lower than the end of the suffix, numbers compare lower than other labels,
+    # e.g. 1.0a1.dev1 < 1.0a1 < 1.0a1.1 < 1.0a1.post1
+    items = [_DEV_ITEM if x == 'dev' else (2, int(x), '') if x.isdigit() else (3, 0, x) for x in suffix]
+    items.append(_END_ITEM)
+
+    return (tuple(release), phase, tuple(items))
+
+#
+## @brief Parse release numbers of given version without removing trailing zeros.
+#
+#  @param text [ str | None | in  ] - Version such as 1.4 or 1.4.*.
+#
+#  @exception ValueError - If the version doesn't start with a number.
+#
+#  @return tuple of int - Release numbers.
+def _parseRelease(text):
+
+    match = _VERSION_PATTERN.match(text)
+    if not match:
+        raise ValueError('Invalid version: {}'.format(text))
+
+    return tuple([int(x) for x in match.group(1).split('.')])
+
+#
+## @brief Get whether release of given version starts with given release numbers.
+#
+#  @param version [ tuple        | None | in  ] - Parsed version.
+#  @param release [ tuple of int | None | in  ] - Release numbers.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def _hasPrefix(version, release):
+
+    items = version[0]
+
+    if len(items) < len(release):
+        items = items + (0,) * (len(release) - len(items))
+
+    return items[:len(release)] == release
+
+## [ dict ] - Operators as keys and functions, which get whether a parsed version satisfies a value, as values.
+_OPERATORS = {'=='  : lambda version, value: version == value,
+              '!='  : lambda version, value: version != value,
+              '>='  : lambda version, value: version >= value,
+              '<='  : lambda version, value: version <= value,
+              '>'   : lambda version, value: version > value,
+              '<'   : lambda version, value: version < value,
+              '==*' : _hasPrefix,
+              '!=*' : lambda version, value: not _hasPrefix(version, value)}
+
+#
+## @brief Parse given version.
+#
+#  Versions are memoized, so parsing the same version again is a dictionary lookup. Trailing zeros
+#  are ignored, so 1.0 equals to 1.0.0. Suffixes such as dev, a, b and rc are pre-releases and
+#  compare lower than the release, post and numeric suffixes such as 1.0-1 compare higher. Unknown
+#  labels are considered as pre-releases, local versions after + are ignored.
+#
+#  @param version [ str | None | in  ] - Version such as 1.0.0, v2.1 or 1.0.0-beta.2.
+#
+#  @exception ValueError - If the version doesn't start with a number.
+#
+#  @return tuple - Comparable version.
+def parseVersion(version):
+
+    try:
+        return _VERSIONS[version]
+    except KeyError:
+        pass
+
+    if len(_VERSIONS) >= _MEMO_SIZE:
+        _VERSIONS.clear()
+
+    parsed = _VERSIONS[version] = _parseVersion(version)
+
+    return parsed
+
+#
+## @brief Get whether given parsed version is a pre-release.
+#
+#  Dev releases of post-releases, such as 1.0.post1.dev1, are pre-releases too.
+#
+#  @param parsed [ tuple | None | in  ] - Parsed version.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def _isPreRelease(parsed):
+
+    return parsed[1] < _FINAL_PHASE or _DEV_ITEM in parsed[2]
+
+#
+## @brief Get whether given version is a pre-release.
+#
+#  @param version [ str | None | in  ] - Version.
+#
+#  @exception ValueError - If the version doesn't start with a number.
+#
+#  @return bool - Result.
+def isPreRelease(version):
+
+    return _isPreRelease(parseVersion(version))
+
+#
+## @brief Compare given versions.
+#
+#  @param first  [ str | None | in  ] - First version.
+#  @param second [ str | None | in  ] - Second version.
+#
+#  @exception ValueError - If a version doesn't start with a number.
+#
+#  @return int - -1 if first version is lower, 1 if it is higher, 0 if they are equal.
+def compareVersions(first, second):
+
+    first   = parseVersion(first)
+    second  = parseVersion(second)
+
+    return (first > second) - (first < second)
+
+#
+## @brief Sort given versions.
+#
+#  @param versions [ list of str | None  | in  ] - Versions.
+#  @param reverse  [ bool        | False | in  ] - Whether to sort them from the highest to the lowest.
+#
+#  @exception ValueError - If a version doesn't start with a number.
+#
+#  @return list of str - Versions.
+def sortVersions(versions, reverse=False):
+
+    return sorted(versions, key=parseVersion, reverse=reverse)
+
+#
+## @brief Get parsed constraint.
+#
+#  @param constraint [ str | None | in  ] - Constraint.
+#
+#  @exception ValueError - If the constraint is invalid.
+#
+#  @return mCore.versionLib.Constraint - Constraint.
+def parseConstraint(constraint):
+
+    try:
+        return _CONSTRAINTS[constraint]
+    except KeyError:
+        pass
+
+    if len(_CONSTRAINTS) >= _MEMO_SIZE:
+        _CONSTRAINTS.clear()
+
+    parsed = _CONSTRAINTS[constraint] = Constraint(constraint)
+
+    return parsed
+
+#
+## @brief Select the highest version of each package satisfying its constraint.
+#
+#  Each version and constraint is parsed once, candidates of a package are scanned once.
+#
+#  @param candidates          [ dict | None  | in  ] - Package names as keys and list of their versions as values.
+#  @param constraints         [ dict | None  | in  ] - Package names as keys and their constraints as values, str or mCore.versionLib.Constraint.
+#  @param includePreReleases  [ bool | False | in  ] - Whether pre-releases can be selected.
+#
+#  @exception ValueError - If a version or constraint is invalid.
+#
+#  @return dict - Package names as keys and their selected versions as values, None if no version satisfies the constraint.
+def selectBestVersions(candidates, constraints=None, includePreReleases=False):
+
+    constraints = constraints or {}
+    result      = {}
+
+    for name, versions in candidates.items():
+
+        constraint = constraints.get(name)
+        if constraint is not None and not isinstance(constraint, Constraint):
+            constraint = parseConstraint(constraint)
+
+        bestVersion = None
+        bestParsed  = None
+
+        for version in versions:
+
+            parsed = parseVersion(version)
+
+            if bestParsed is not None and parsed <= bestParsed:
+                continue
+
+            if not includePreReleases and _isPreRelease(parsed):
+                continue
+
+            if constraint is not None and not constraint.matchParsed(parsed):
+                continue
+
+            bestVersion = version
+            bestParsed  = parsed
+
+        result[name] = bestVersion
+
+    return result
+
+#
+## @brief [ CLASS ] - Version constraint.
+#
+#  Clauses separated by commas must all be satisfied, alternatives separated by || are OR'ed.
+#  Supported clauses are ==, !=, >=, <=, >, <, compatible release ~= and wildcards ==1.* and !=1.*.
+#  A version without an operator means ==, * and empty constraints match all versions.
+class Constraint(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param text [ str | None | in  ] - Constraint such as >=1.2, <2.0 || ~=3.1.
+    #
+    #  @exception ValueError - If the constraint is invalid.
+    #
+    #  @return None - None.
+    def __init__(self, text):
+
+        ## [ str ] - Constraint.
+        self._text          = text
+
+        ## [ list of list of tuple ] - Alternatives, each one is a list of functions and their values.
+        self._alternatives  = [Constraint._compileClauses(x) for x in text.split('||')]
+
+    #
+    ## @brief String representation.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Representation.
+    def __repr__(self):
+
+        return '<Constraint {}>'.format(self._text)
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Compile clauses of given alternative.
+    #
+    #  @param text [ str | None | in  ] - Clauses separated by commas.
+    #
+    #  @exception ValueError - If a clause is invalid.
+    #
+    #  @return list of tuple - Functions and their values.
+    @staticmethod
+    def _compileClauses(text):
+
+        clauses = []
+
+        for clause in text.split(','):
+
+            if not clause.strip() or clause.strip() == '*':
+                continue
+
+            match = _CLAUSE_PATTERN.match(clause)
+            if not match:
+                raise ValueError('Invalid constraint: {}'.format(clause.strip()))
+
+            operator    = match.group(1) or '=='
+            version     = match.group(2)
+
+            if operator == '=':
+                operator = '=='
+
+            if version.endswith('.*'):
+
+                if operator not in ('==', '!='):
+                    raise ValueError('Wildcard can only be used with == and != operators: {}'.format(clause.strip()))
+
+                clauses.append((_OPERATORS[operator + '*'], _parseRelease(version[:-2])))
+
+            elif operator == '~=':
+
+                release = _parseRelease(version)
+                if len(release) < 2:
+                    raise ValueError('Compatible release needs at least two numbers: {}'.format(clause.strip()))
+
+                clauses.append((_OPERATORS['>='], _parseVersion(version)))
+                clauses.append((_OPERATORS['==*'], release[:-1]))
+
+            else:
+                clauses.append((_OPERATORS[operator], _parseVersion(version)))
+
+        return clauses
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Constraint.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Constraint.
+    def text(self):
+
+        return self._text
+
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get whether given parsed version satisfies the constraint.
+    #
+    #  @param parsed [ tuple | None | in  ] - Version returned by mCore.versionLib.parseVersion function.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def matchParsed(self, parsed):
+
+        for clauses in self._alternatives:
+            for function, value in clauses:
+                if not function(parsed, value):
+                    break
+            else:
+                return True
+
+        return False
+
+    #
+    ## @brief Get whether given version satisfies the constraint.
+    #
+    #  @param version [ str | None | in  ] - Version.
+    #
+    #  @exception ValueError - If the version doesn't start with a number.
+    #
+    #  @return bool - Result.
+    def match(self, version):
+
+        return self.matchParsed(parseVersion(version))
+
+    #
+    ## @brief Get the versions satisfying the constraint.
+    #
+    #  @param versions [ list of str | None | in  ] - Versions.
+    #
+    #  @exception ValueError - If a version doesn't start with a number.
+    #
+    #  @return list of str - Versions in given order.
+    def filter(self, versions):
+
+        return [x for x in versions if self.matchParsed(parseVersion(x))]